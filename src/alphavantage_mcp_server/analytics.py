@@ -0,0 +1,558 @@
+import re
+from dataclasses import dataclass, field
+from functools import reduce
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from alphavantage_mcp_server.slicing import END_OF_DAY
+from alphavantage_mcp_server.store import FIELD_PREFIX, SeriesFrame
+
+PERIODS_PER_YEAR = {"daily": 252, "weekly": 52, "monthly": 12}
+
+OHLC_FIELDS = ("open", "high", "low", "close")
+
+# The options each calculation accepts, e.g. "VARIANCE(annualized=True)".
+OPTIONS = {
+    "MIN": (),
+    "MAX": (),
+    "MEAN": (),
+    "MEDIAN": (),
+    "CUMULATIVE_RETURN": (),
+    "VARIANCE": ("annualized",),
+    "STDDEV": ("annualized",),
+    "MAX_DRAWDOWN": (),
+    "HISTOGRAM": ("bins",),
+    "AUTOCORRELATION": ("lag",),
+    "COVARIANCE": ("annualized",),
+    "CORRELATION": ("method",),
+}
+
+SLIDING_CALCULATIONS = (
+    "MEAN",
+    "MEDIAN",
+    "CUMULATIVE_RETURN",
+    "VARIANCE",
+    "STDDEV",
+    "COVARIANCE",
+    "CORRELATION",
+)
+
+CALCULATION = re.compile(r"\s*([A-Za-z_]+)\s*(?:\(([^)]*)\))?\s*")
+
+RANGE = re.compile(r"(\d+)(day|week|month|year)s?", re.IGNORECASE)
+
+DATE = re.compile(r"\d{4}-\d{2}(-\d{2})?")
+
+
+class UnsupportedCalculation(ValueError):
+    """A calculation, option or range the local engine does not implement."""
+
+
+@dataclass(frozen=True)
+class Calculation:
+    """One entry of the CALCULATIONS parameter."""
+
+    text: str
+    name: str
+    options: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def annualized(self) -> bool:
+        return self.options.get("annualized", "false").lower() == "true"
+
+    def integer(self, option: str, default: int) -> int:
+        try:
+            value = int(self.options.get(option, default))
+        except ValueError:
+            value = 0
+        if value < 1:
+            raise UnsupportedCalculation(f"Invalid {option}: {self.options[option]}")
+        return value
+
+
+def parse_calculations(text: str, sliding: bool = False) -> list[Calculation]:
+    """
+    :argument: text (str): The comma-separated calculations, e.g. "MEAN,STDDEV(annualized=True)".
+    :argument: sliding (bool): Whether they are for a sliding window (default: False).
+
+    :returns: The parsed calculations.
+    """
+
+    calculations = []
+    for entry in re.findall(r"[^,(]+(?:\([^)]*\))?", text or ""):
+        match = CALCULATION.fullmatch(entry)
+        if match is None or not entry.strip():
+            raise UnsupportedCalculation(f"Invalid calculation: {entry}")
+        name = match.group(1).upper()
+        options = {}
+        for option in filter(None, (match.group(2) or "").split(",")):
+            key, _, value = option.partition("=")
+            options[key.strip().lower()] = value.strip()
+        if name not in OPTIONS or (sliding and name not in SLIDING_CALCULATIONS):
+            raise UnsupportedCalculation(f"Unsupported calculation: {name}")
+        unknown = set(options) - set(OPTIONS[name])
+        if unknown:
+            raise UnsupportedCalculation(
+                f"Unsupported option for {name}: {', '.join(sorted(unknown))}"
+            )
+        if options.get("method", "pearson").lower() != "pearson":
+            raise UnsupportedCalculation(
+                f"Unsupported correlation method: {options['method']}"
+            )
+        calculations.append(Calculation(entry.strip(), name, options))
+    if not calculations:
+        raise UnsupportedCalculation("No calculations")
+    return calculations
+
+
+def range_bounds(
+    series_range: str | None, last_date: str
+) -> tuple[str | None, str | None]:
+    """
+    :argument: series_range (str): "full", a length like "6month" or "2year", or start (and end) dates separated by a comma.
+    :argument: last_date (str): The latest date of the data.
+
+    :returns: The first and last dates of the range, None where it is open.
+    """
+
+    if not series_range or series_range.lower() == "full":
+        return None, None
+    parts = [part.strip() for part in series_range.split(",")]
+    match = RANGE.fullmatch(parts[0])
+    if match is not None and len(parts) == 1:
+        count, unit = int(match.group(1)), match.group(2).lower()
+        last = np.datetime64(last_date[:10], "D")
+        if unit in ("day", "week"):
+            start = last - np.timedelta64(count * (7 if unit == "week" else 1), "D")
+        else:
+            month = last.astype("datetime64[M]") - np.timedelta64(
+                count * (12 if unit == "year" else 1), "M"
+            )
+            # The same day of the month, or the month's last day if it is shorter.
+            day = last - last.astype("datetime64[M]").astype("datetime64[D]")
+            month_end = (month + np.timedelta64(1, "M")).astype("datetime64[D]")
+            start = min(
+                month.astype("datetime64[D]") + day, month_end - np.timedelta64(1, "D")
+            )
+        return str(start), None
+    if len(parts) <= 2 and all(DATE.fullmatch(part) for part in parts):
+        return parts[0], parts[1] if len(parts) == 2 else None
+    raise UnsupportedCalculation(f"Unsupported range: {series_range}")
+
+
+def align(series: list[tuple[np.ndarray, np.ndarray]]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    :argument: series (list): The (dates, values) of each symbol, dates ascending.
+
+    :returns: The dates every symbol has, and a (dates x symbols) float64 matrix of their values.
+    """
+
+    indexes = [np.asarray(dates) for dates, _ in series]
+    common = reduce(np.intersect1d, indexes)
+    matrix = np.empty((len(common), len(series)))
+    for j, (index, (_, values)) in enumerate(zip(indexes, series)):
+        matrix[:, j] = np.asarray(values)[np.searchsorted(index, common)]
+    return common, matrix
+
+
+def price_column(payload: dict, field: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    :argument: payload (dict): A daily TIME_SERIES_* response.
+    :argument: field (str): The price field, e.g. "close" or "adjusted close".
+
+    :returns: The datetime64 dates, ascending, and the float64 values of the field.
+    """
+
+    series = next(
+        (
+            value
+            for key, value in payload.items()
+            if "Time Series" in key and isinstance(value, (dict, SeriesFrame))
+        ),
+        None,
+    )
+    if not series:
+        message = (
+            payload.get("Error Message")
+            or payload.get("Information")
+            or "no time series"
+        )
+        raise ValueError(f"Cannot parse price series: {message}")
+    if isinstance(series, SeriesFrame):
+        try:
+            values = series.column(field).astype(float)
+        except KeyError:
+            raise ValueError(f"Cannot parse price series: missing {field}") from None
+        return series.index.astype("datetime64[D]", copy=False), values
+
+    dates = sorted(series)
+    key = next((k for k in series[dates[0]] if FIELD_PREFIX.sub("", k) == field), None)
+    if key is None:
+        raise ValueError(f"Cannot parse price series: missing {field}")
+    values = np.array([float(series[date][key]) for date in dates])
+    return np.array(dates, dtype="datetime64[D]"), values
+
+
+def _values(values: np.ndarray) -> list:
+    """Plain floats, with undefined results (e.g. a correlation with a constant series) as None."""
+    return np.where(np.isfinite(values), values, None).tolist()
+
+
+def _per_symbol(symbols: list[str], values: np.ndarray) -> dict:
+    return dict(zip(symbols, _values(values)))
+
+
+def _lower_triangle(matrix: np.ndarray) -> list[list]:
+    return [row[: i + 1] for i, row in enumerate(_values(np.atleast_2d(matrix)))]
+
+
+@dataclass
+class Window:
+    """Aligned prices of several symbols over the analyzed range."""
+
+    symbols: list[str]
+    dates: np.ndarray
+    prices: np.ndarray
+    periods_per_year: int
+
+    def __post_init__(self):
+        if len(self.dates) < 3:
+            raise ValueError("Not enough common data points for the calculations")
+        self.returns = self.prices[1:] / self.prices[:-1] - 1
+
+    def scale(self, calculation: Calculation, power: float = 1.0) -> float:
+        return self.periods_per_year**power if calculation.annualized else 1.0
+
+
+def _max_drawdown(window: Window) -> dict:
+    prices = window.prices
+    drawdowns = prices / np.maximum.accumulate(prices, axis=0) - 1
+    troughs = drawdowns.argmin(axis=0)
+    result = {}
+    for j, symbol in enumerate(window.symbols):
+        peak = prices[: troughs[j] + 1, j].argmax()
+        result[symbol] = {
+            "max_drawdown": float(drawdowns[troughs[j], j]),
+            "drawdown_range": {
+                "start_drawdown": str(window.dates[peak]),
+                "end_drawdown": str(window.dates[troughs[j]]),
+            },
+        }
+    return result
+
+
+def _histogram(window: Window, bins: int) -> dict:
+    result = {}
+    for symbol, column in zip(window.symbols, window.returns.T):
+        counts, edges = np.histogram(column, bins=bins)
+        result[symbol] = {"bin_count": counts.tolist(), "bin_edges": edges.tolist()}
+    return result
+
+
+def _autocorrelation(window: Window, lag: int) -> dict:
+    centered = window.returns - window.returns.mean(axis=0)
+    if lag >= len(centered):
+        raise ValueError(f"Lag {lag} is longer than the data")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = (centered[lag:] * centered[:-lag]).sum(axis=0) / (centered**2).sum(
+            axis=0
+        )
+    return _per_symbol(window.symbols, values)
+
+
+def fixed_window(window: Window, calculations: list[Calculation]) -> dict:
+    """
+    Compute statistics of the returns over the whole window.
+
+    Variances and covariances are sample estimates; annualized ones are scaled by
+    the periods per year of the interval. Covariance and correlation matrices are
+    computed for all symbols in one matrix operation and returned as their lower
+    triangle, like the remote endpoint.
+
+    :argument: window (Window): The aligned prices.
+    :argument: calculations (list[Calculation]): The calculations.
+
+    :returns: The results keyed by calculation, as in the "RETURNS_CALCULATIONS" of ANALYTICS_FIXED_WINDOW.
+    """
+
+    returns, symbols = window.returns, window.symbols
+    result = {}
+    for calculation in calculations:
+        name = calculation.name
+        if name == "MIN":
+            value = _per_symbol(symbols, returns.min(axis=0))
+        elif name == "MAX":
+            value = _per_symbol(symbols, returns.max(axis=0))
+        elif name == "MEAN":
+            value = _per_symbol(symbols, returns.mean(axis=0))
+        elif name == "MEDIAN":
+            value = _per_symbol(symbols, np.median(returns, axis=0))
+        elif name == "CUMULATIVE_RETURN":
+            value = _per_symbol(symbols, window.prices[-1] / window.prices[0] - 1)
+        elif name == "VARIANCE":
+            value = _per_symbol(
+                symbols, returns.var(axis=0, ddof=1) * window.scale(calculation)
+            )
+        elif name == "STDDEV":
+            value = _per_symbol(
+                symbols, returns.std(axis=0, ddof=1) * window.scale(calculation, 0.5)
+            )
+        elif name == "MAX_DRAWDOWN":
+            value = _max_drawdown(window)
+        elif name == "HISTOGRAM":
+            value = _histogram(window, calculation.integer("bins", 10))
+        elif name == "AUTOCORRELATION":
+            value = _autocorrelation(window, calculation.integer("lag", 1))
+        elif name == "COVARIANCE":
+            matrix = np.cov(returns, rowvar=False) * window.scale(calculation)
+            value = {"index": symbols, "covariance": _lower_triangle(matrix)}
+        else:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                matrix = np.corrcoef(returns, rowvar=False)
+            value = {"index": symbols, "correlation": _lower_triangle(matrix)}
+        result[calculation.text] = value
+    return result
+
+
+def _window_sums(values: np.ndarray, size: int) -> np.ndarray:
+    """The sums of every `size` consecutive rows, from one cumulative sum."""
+    sums = np.cumsum(values, axis=0)
+    sums = np.vstack([np.zeros((1,) + values.shape[1:]), sums])
+    return sums[size:] - sums[:-size]
+
+
+def sliding_window(window: Window, calculations: list[Calculation], size: int) -> dict:
+    """
+    Compute statistics of the returns over every `size` consecutive periods.
+
+    Means, variances, covariances and correlations are derived from cumulative
+    sums of the returns, their squares and their pairwise products, so each is
+    O(n) whatever the window size; the returns are centered first to keep the
+    differences of large sums accurate. Running medians use a strided view of the
+    windows. Each value is labeled with the last date of its window.
+
+    :argument: window (Window): The aligned prices.
+    :argument: calculations (list[Calculation]): The calculations.
+    :argument: size (int): The number of returns in a window.
+
+    :returns: The results keyed by calculation, as in the "RETURNS_CALCULATIONS" of ANALYTICS_SLIDING_WINDOW.
+    """
+
+    returns, symbols = window.returns, window.symbols
+    if size < 2 or size > len(returns):
+        raise ValueError(f"Invalid window size {size} for {len(returns)} returns")
+    labels = [str(date) for date in window.dates[size:]]
+
+    centered = returns - returns.mean(axis=0)
+    sums = _window_sums(centered, size)
+    variances = np.maximum(_window_sums(centered**2, size) - sums**2 / size, 0) / (
+        size - 1
+    )
+    first, second = np.triu_indices(len(symbols), 1)
+
+    def running(values: np.ndarray) -> dict:
+        return {
+            symbol: dict(zip(labels, _values(column)))
+            for symbol, column in zip(symbols, values.T)
+        }
+
+    def pairwise(values: np.ndarray) -> dict:
+        result = {symbol: {} for symbol in symbols[:-1]}
+        for i, j, column in zip(first, second, values.T):
+            result[symbols[i]][symbols[j]] = dict(zip(labels, _values(column)))
+        return result
+
+    def covariances() -> np.ndarray:
+        products = _window_sums(centered[:, first] * centered[:, second], size)
+        return (products - sums[:, first] * sums[:, second] / size) / (size - 1)
+
+    result = {}
+    for calculation in calculations:
+        name = calculation.name
+        if name == "MEAN":
+            value = {"RUNNING_MEAN": running(_window_sums(returns, size) / size)}
+        elif name == "MEDIAN":
+            medians = np.median(sliding_window_view(returns, size, axis=0), axis=-1)
+            value = {"RUNNING_MEDIAN": running(medians)}
+        elif name == "CUMULATIVE_RETURN":
+            prices = window.prices
+            value = {
+                "RUNNING_CUMULATIVE_RETURN": running(prices[size:] / prices[:-size] - 1)
+            }
+        elif name == "VARIANCE":
+            value = {"RUNNING_VARIANCE": running(variances * window.scale(calculation))}
+        elif name == "STDDEV":
+            deviations = np.sqrt(variances) * window.scale(calculation, 0.5)
+            value = {"RUNNING_STDDEV": running(deviations)}
+        elif name == "COVARIANCE":
+            value = {
+                "RUNNING_COVARIANCE": pairwise(
+                    covariances() * window.scale(calculation)
+                )
+            }
+        else:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                correlations = covariances() / np.sqrt(
+                    variances[:, first] * variances[:, second]
+                )
+            value = {"RUNNING_CORRELATION": pairwise(correlations)}
+        result[calculation.text] = value
+    return result
+
+
+def analyze(
+    symbols: list[str],
+    series: list[tuple[np.ndarray, np.ndarray]],
+    calculations: list[Calculation],
+    interval: str,
+    ohlc: str = "close",
+    series_range: str | None = None,
+    window_size: int | None = None,
+) -> dict:
+    """
+    Compute an ANALYTICS_FIXED_WINDOW (or, with a window size, an
+    ANALYTICS_SLIDING_WINDOW) response from price series.
+
+    The series are aligned on the dates all of them have, then cut to the range.
+
+    :argument: symbols (list[str]): The symbols.
+    :argument: series (list): The (dates, prices) of each symbol, dates ascending.
+    :argument: calculations (list[Calculation]): The parsed calculations.
+    :argument: interval (str): "daily", "weekly" or "monthly".
+    :argument: ohlc (str): The price field the series hold (default: "close").
+    :argument: series_range (str): The range of the data (default: None, the full series).
+    :argument: window_size (int): The sliding window size (default: None, a fixed window).
+
+    :returns: The response, with "meta_data" and "payload" like the remote endpoint's.
+    """
+
+    dates, prices = align(series)
+    if not len(dates):
+        raise ValueError("The series have no dates in common")
+    start, end = range_bounds(series_range, str(dates[-1]))
+    lo = np.searchsorted(dates, start) if start else 0
+    hi = np.searchsorted(dates, end + END_OF_DAY, side="right") if end else len(dates)
+    window = Window(
+        list(symbols), dates[lo:hi], prices[lo:hi], PERIODS_PER_YEAR[interval]
+    )
+
+    meta = {
+        "symbols": ",".join(symbols),
+        "min_dt": str(window.dates[0]),
+        "max_dt": str(window.dates[-1]),
+        "ohlc": ohlc.capitalize(),
+        "interval": interval.upper(),
+    }
+    if window_size is None:
+        calculated = fixed_window(window, calculations)
+    else:
+        meta["window_size"] = window_size
+        calculated = sliding_window(window, calculations, window_size)
+    return {"meta_data": meta, "payload": {"RETURNS_CALCULATIONS": calculated}}
+
+
+def shrunk_covariance(
+    returns: np.ndarray, shrinkage: str | float | None = None
+) -> tuple[np.ndarray, float]:
+    """
+    Estimate the covariance matrix of returns, optionally shrunk towards a scaled
+    identity matrix (the average variance on the diagonal).
+
+    :argument: returns (np.ndarray): A (periods x symbols) matrix of returns.
+    :argument: shrinkage (str | float): None for the sample covariance, "ledoit_wolf" for the Ledoit-Wolf optimal intensity, or an intensity between 0 and 1 (default: None).
+
+    :returns: The covariance matrix and the shrinkage intensity applied.
+    """
+
+    if shrinkage is None or shrinkage == "":
+        return np.atleast_2d(np.cov(returns, rowvar=False)), 0.0
+
+    count, size = returns.shape
+    target_scale = None
+    if str(shrinkage).lower().replace("-", "_") == "ledoit_wolf":
+        # Ledoit & Wolf (2004), "A well-conditioned estimator for large-dimensional covariance matrices".
+        centered = returns - returns.mean(axis=0)
+        sample = centered.T @ centered / count
+        target_scale = np.trace(sample) / size
+        distance = ((sample - target_scale * np.eye(size)) ** 2).sum() / size
+        spread = ((centered**2).sum(axis=1) ** 2).sum() / count - (sample**2).sum()
+        spread = min(spread / count / size, distance)
+        intensity = float(spread / distance) if distance > 0 else 1.0
+    else:
+        try:
+            intensity = float(shrinkage)
+        except ValueError:
+            intensity = -1.0
+        if not 0 <= intensity <= 1:
+            raise ValueError(
+                f"Invalid shrinkage: {shrinkage} (expected ledoit_wolf or a number between 0 and 1)"
+            )
+        sample = np.atleast_2d(np.cov(returns, rowvar=False))
+    if target_scale is None:
+        target_scale = np.trace(sample) / size
+    shrunk = (1 - intensity) * sample
+    shrunk[np.diag_indices(size)] += intensity * target_scale
+    return shrunk, intensity
+
+
+def _day_after(date: str) -> np.datetime64:
+    """The day after a YYYY-MM-DD date, or the first day after a YYYY-MM month."""
+    value = np.datetime64(date)
+    return (value + np.timedelta64(1, np.datetime_data(value.dtype)[0])).astype(
+        "datetime64[D]"
+    )
+
+
+def cross_section(
+    symbols: list[str],
+    series: list[tuple[np.ndarray, np.ndarray]],
+    matrix: str = "correlation",
+    start_date: str | None = None,
+    end_date: str | None = None,
+    shrinkage: str | float | None = None,
+) -> dict:
+    """
+    Compute the correlation or covariance matrix of the daily returns of many symbols.
+
+    The prices are aligned on the dates every symbol has into one float64 matrix,
+    and the matrix of returns is reduced in one vectorized pass.
+
+    :argument: symbols (list[str]): The symbols.
+    :argument: series (list): The (datetime64 dates, prices) of each symbol, dates ascending.
+    :argument: matrix (str): "correlation" or "covariance" (default: "correlation").
+    :argument: start_date (str): The first date, YYYY-MM-DD or YYYY-MM (default: None).
+    :argument: end_date (str): The last date, inclusive (default: None).
+    :argument: shrinkage (str | float): See shrunk_covariance (default: None).
+
+    :returns: The lower triangle of the matrix, with its index of symbols and the dates it covers.
+    """
+
+    if matrix not in ("correlation", "covariance"):
+        raise ValueError(
+            f"Invalid matrix: {matrix} (expected correlation or covariance)"
+        )
+    dates, prices = align(series)
+    lo = np.searchsorted(dates, np.datetime64(start_date, "D")) if start_date else 0
+    hi = np.searchsorted(dates, _day_after(end_date)) if end_date else len(dates)
+    dates, prices = dates[lo:hi], prices[lo:hi]
+    if len(dates) < 3:
+        raise ValueError("Not enough common data points for the matrix")
+
+    returns = prices[1:] / prices[:-1] - 1
+    values, intensity = shrunk_covariance(returns, shrinkage)
+    if matrix == "correlation":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            deviations = np.sqrt(np.diag(values))
+            values = values / np.outer(deviations, deviations)
+    return {
+        "meta_data": {
+            "symbols": ",".join(symbols),
+            "min_dt": str(dates[0]),
+            "max_dt": str(dates[-1]),
+            "observations": len(returns),
+            "shrinkage": intensity,
+        },
+        "index": list(symbols),
+        matrix: _lower_triangle(values),
+    }
@@ -1,16 +1,465 @@
+import asyncio
+import logging
 import os
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 import httpx
 from dotenv import load_dotenv
 
+from alphavantage_mcp_server import metrics
+from alphavantage_mcp_server.analytics import (
+    OHLC_FIELDS,
+    PERIODS_PER_YEAR,
+    analyze,
+    cross_section,
+    parse_calculations,
+    price_column,
+)
+from alphavantage_mcp_server.backfill import date_range, plan_months
+from alphavantage_mcp_server.batching import (
+    QuoteBatcher,
+    chunk_symbols,
+    merge_bulk_quotes,
+)
+from alphavantage_mcp_server.cache import (
+    INTRADAY_INTERVALS,
+    ResponseCache,
+    TTLClass,
+    is_cacheable,
+    mark_stale,
+    ttl_class,
+    ttl_seconds,
+)
+from alphavantage_mcp_server.disk_cache import DiskCache
+from alphavantage_mcp_server.earnings import EarningsCalendar
+from alphavantage_mcp_server.encoding import OutputFormat
+from alphavantage_mcp_server.indicators import (
+    INDICATORS,
+    INTERVALS,
+    OHLCV,
+    IndicatorContext,
+    UnsupportedIndicator,
+    compute,
+    parse_ohlcv,
+    resolve_params,
+    to_payload,
+)
+from alphavantage_mcp_server.progress import report_progress
+from alphavantage_mcp_server.ratelimit import RateLimiter, throttle_message
+from alphavantage_mcp_server.resample import RESAMPLINGS, resampled_payload
+from alphavantage_mcp_server.scheduler import Priority
+from alphavantage_mcp_server.singleflight import SingleFlight
+from alphavantage_mcp_server.slicing import select
+from alphavantage_mcp_server.store import (
+    OUTPUTSIZE_FUNCTIONS,
+    SeriesFrame,
+    SeriesStore,
+    compress,
+    concat_frames,
+    is_incremental,
+    payload_size,
+    series_key,
+)
+from alphavantage_mcp_server.streaming import STREAMS, advance
+from alphavantage_mcp_server.symbols import SymbolIndex
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 API_KEY = os.getenv("ALPHAVANTAGE_API_KEY")
 if not API_KEY:
     raise ValueError("ALPHAVANTAGE_API_KEY environment variable required")
 
 API_BASE_URL = "https://www.alphavantage.co/query"
 
+HTTP2 = os.getenv("ALPHAVANTAGE_HTTP2", "false").lower() in ("1", "true", "yes")
+MAX_CONNECTIONS = int(os.getenv("ALPHAVANTAGE_MAX_CONNECTIONS", "20"))
+MAX_KEEPALIVE_CONNECTIONS = int(
+    os.getenv("ALPHAVANTAGE_MAX_KEEPALIVE_CONNECTIONS", "10")
+)
+KEEPALIVE_EXPIRY = float(os.getenv("ALPHAVANTAGE_KEEPALIVE_EXPIRY", "30"))
+REQUEST_TIMEOUT = float(os.getenv("ALPHAVANTAGE_TIMEOUT", "30"))
+REQUESTS_PER_MINUTE = int(os.getenv("ALPHAVANTAGE_REQUESTS_PER_MINUTE", "75"))
+REQUESTS_PER_DAY = int(os.getenv("ALPHAVANTAGE_REQUESTS_PER_DAY", "0"))
+THROTTLE_RETRIES = int(os.getenv("ALPHAVANTAGE_THROTTLE_RETRIES", "3"))
+THROTTLE_BACKOFF = float(os.getenv("ALPHAVANTAGE_THROTTLE_BACKOFF", "15"))
+CACHE_MAX_BYTES = int(os.getenv("ALPHAVANTAGE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+SERIES_STORE_MAX_BYTES = int(
+    os.getenv("ALPHAVANTAGE_SERIES_STORE_MAX_BYTES", str(64 * 1024 * 1024))
+)
+DISK_CACHE_PATH = os.getenv("ALPHAVANTAGE_DISK_CACHE_PATH")
+DISK_CACHE_MAX_BYTES = int(
+    os.getenv("ALPHAVANTAGE_DISK_CACHE_MAX_BYTES", str(1024 * 1024 * 1024))
+)
+STALE_WHILE_REVALIDATE = {
+    TTLClass(cls.strip())
+    for cls in os.getenv("ALPHAVANTAGE_STALE_WHILE_REVALIDATE", "").split(",")
+    if cls.strip()
+}
+MAX_STALE = float(os.getenv("ALPHAVANTAGE_MAX_STALE", "3600"))
+MAX_REVALIDATIONS = int(os.getenv("ALPHAVANTAGE_MAX_REVALIDATIONS", "2"))
+BACKGROUND_MAX_WAIT = float(os.getenv("ALPHAVANTAGE_BACKGROUND_MAX_WAIT", "5"))
+LOCAL_RESAMPLING = os.getenv("ALPHAVANTAGE_LOCAL_RESAMPLING", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+QUOTE_BATCH_WINDOW = float(os.getenv("ALPHAVANTAGE_QUOTE_BATCH_WINDOW_MS", "0")) / 1000
+BACKFILL_CONCURRENCY = int(os.getenv("ALPHAVANTAGE_BACKFILL_CONCURRENCY", "4"))
+LOCAL_INDICATORS = os.getenv("ALPHAVANTAGE_LOCAL_INDICATORS", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+LOCAL_ANALYTICS = os.getenv("ALPHAVANTAGE_LOCAL_ANALYTICS", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+LOCAL_SYMBOL_SEARCH = os.getenv(
+    "ALPHAVANTAGE_LOCAL_SYMBOL_SEARCH", "false"
+).lower() in ("1", "true", "yes")
+SYMBOL_SEARCH_FALLBACK = os.getenv(
+    "ALPHAVANTAGE_SYMBOL_SEARCH_FALLBACK", "true"
+).lower() in ("1", "true", "yes")
+OUTPUT_FORMAT = OutputFormat(os.getenv("ALPHAVANTAGE_OUTPUT_FORMAT", "compact").lower())
+
+_client: httpx.AsyncClient | None = None
+rate_limiter = RateLimiter(REQUESTS_PER_MINUTE, REQUESTS_PER_DAY)
+_inflight = SingleFlight()
+response_cache = ResponseCache(CACHE_MAX_BYTES)
+metrics.register("cache", response_cache.stats)
+series_store = SeriesStore(SERIES_STORE_MAX_BYTES)
+metrics.register("series_store", series_store.stats)
+disk_cache = (
+    DiskCache(DISK_CACHE_PATH, DISK_CACHE_MAX_BYTES) if DISK_CACHE_PATH else None
+)
+if disk_cache is not None:
+    metrics.register("disk_cache", disk_cache.stats)
+_revalidations: dict[tuple, asyncio.Task] = {}
+_resolvers: dict[str, Callable[[dict], Awaitable[dict | str | None]]] = {}
+
+
+def create_client(
+    http2: bool = HTTP2,
+    max_connections: int = MAX_CONNECTIONS,
+    max_keepalive_connections: int = MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float = KEEPALIVE_EXPIRY,
+    timeout: float = REQUEST_TIMEOUT,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    """
+    Create the pooled HTTP client used for every Alpha Vantage request.
+
+    :argument: http2 (bool): Negotiate HTTP/2 (requires the "http2" extra) (default: ALPHAVANTAGE_HTTP2).
+    :argument: max_connections (int): The connection pool size (default: ALPHAVANTAGE_MAX_CONNECTIONS).
+    :argument: max_keepalive_connections (int): Idle connections kept open (default: ALPHAVANTAGE_MAX_KEEPALIVE_CONNECTIONS).
+    :argument: keepalive_expiry (float): Seconds an idle connection is kept (default: ALPHAVANTAGE_KEEPALIVE_EXPIRY).
+    :argument: timeout (float): The default request timeout in seconds (default: ALPHAVANTAGE_TIMEOUT).
+    :argument: transport (httpx.AsyncBaseTransport): An alternative transport, mostly for tests (default: None).
+
+    :returns: The HTTP client.
+    """
+
+    try:
+        return httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=timeout,
+            transport=transport,
+        )
+    except ImportError as e:
+        raise ValueError(
+            "ALPHAVANTAGE_HTTP2 requires the http2 extra: pip install 'alphavantage[http2]'"
+        ) from e
+
+
+async def init_client(**kwargs) -> httpx.AsyncClient:
+    """
+    Create the shared HTTP client, replacing (and closing) any previous one.
+
+    :argument: kwargs: Forwarded to create_client.
+
+    :returns: The shared HTTP client.
+    """
+
+    global _client
+    await close_client()
+    _client = create_client(**kwargs)
+    return _client
+
+
+async def close_client() -> None:
+    """
+    Close the shared HTTP client and release its pooled connections.
+    """
+
+    global _client
+    client, _client = _client, None
+    if client is not None:
+        await client.aclose()
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_client()
+    return _client
+
+
+async def _send_request(https_params: dict) -> httpx.Response:
+    response = await _get_client().get(API_BASE_URL, params=https_params)
+    response.raise_for_status()
+    return response
+
+
+def register_resolver(
+    function: str, resolver: Callable[[dict], Awaitable[dict | str | None]]
+) -> None:
+    """
+    Register a local source for an Alpha Vantage function.
+
+    Before a request for `function` is sent, the resolver is awaited with the
+    request parameters. A non-None result is cached and returned in place of an
+    API call; None falls through to the API.
+
+    :argument: function (str): The Alpha Vantage function name, e.g. "GLOBAL_QUOTE".
+    :argument: resolver (Callable): Coroutine function taking the request parameters.
+    """
+
+    _resolvers[function] = resolver
+
+
+def request_key(https_params: dict) -> tuple:
+    """
+    Normalize request parameters into a hashable key identifying the request.
+
+    The API key and unset (None) parameters are left out, so requests that only
+    differ by those map to the same key.
+
+    :argument: https_params (dict): The query parameters.
+
+    :returns: The sorted (name, value) pairs of the request.
+    """
+
+    return tuple(
+        sorted(
+            (name, str(value))
+            for name, value in https_params.items()
+            if name != "apikey" and value is not None
+        )
+    )
+
+
+def _cache_get(https_params: dict, key: tuple) -> dict | str | None:
+    skey = series_key(https_params)
+    if skey is not None:
+        return series_store.get(skey, https_params)
+    return response_cache.get(key)
+
+
+def _cache_get_stale(https_params: dict, key: tuple) -> tuple[dict | str, float] | None:
+    skey = series_key(https_params)
+    if skey is not None:
+        return series_store.get_stale(skey, https_params, MAX_STALE)
+    return response_cache.get_stale(key, MAX_STALE)
+
+
+def _cache_set(
+    https_params: dict, key: tuple, result: dict | str, ttl: float, size: int
+) -> dict | str:
+    """
+    Cache a response in memory, with its time series converted to typed arrays (see
+    store.SeriesFrame). Whole series go to the series store, keyed by the series
+    they hold; everything else goes to the response cache.
+
+    :returns: The response as cached, which is what callers receive.
+    """
+
+    skey = series_key(https_params)
+    if skey is not None and isinstance(result, dict):
+        return series_store.set(skey, https_params, result, ttl)
+    compressed = compress(result)
+    if compressed is not result:
+        size = payload_size(compressed)
+    response_cache.set(key, compressed, ttl, size)
+    return compressed
+
+
+async def _fetch(
+    https_params: dict,
+    key: tuple,
+    text: bool = False,
+    background: bool = False,
+) -> dict[str, str] | str | None:
+    """
+    Answer a request that missed the in-memory caches: from the disk cache (see
+    disk_cache.DiskCache), a registered resolver, or a merge of the latest points
+    into an expired full history (see store.merge_payloads), and else from the API.
+    API requests wait for the rate limiter (see scheduler.FairQueue). A throttle
+    response makes the limiter back off, and the request is queued again up to
+    THROTTLE_RETRIES times.
+
+    :returns: The response as cached, or None for a dropped background request.
+    """
+
+    cls = ttl_class(https_params)
+    if cls is not None and disk_cache is not None:
+        entry = await asyncio.to_thread(disk_cache.get, key)
+        if entry is not None:
+            return _cache_set(https_params, key, entry.value, entry.ttl, entry.size)
+
+    resolver = _resolvers.get(https_params.get("function"))
+    if resolver is not None and not background:
+        result = await resolver(https_params)
+        if result is not None:
+            if cls is not None:
+                size = len(result) if isinstance(result, str) else payload_size(result)
+                return _cache_set(https_params, key, result, ttl_seconds(cls), size)
+            return result
+
+    skey = series_key(https_params)
+    if (
+        skey is not None
+        and is_incremental(https_params)
+        and series_store.has_history(skey)
+    ):
+        # Refresh the expired history with the last 100 points; the store merges them.
+        compact = {**https_params, "outputsize": "compact"}
+        await _fetch(compact, request_key(compact), text, background)
+        merged = series_store.get(skey, https_params)
+        if merged is not None:
+            return merged
+
+    text = text or https_params.get("datatype") == "csv"
+    for attempt in range(THROTTLE_RETRIES + 1):
+        priority = Priority.BACKGROUND if background else None
+        if not await rate_limiter.acquire(priority, max_wait=BACKGROUND_MAX_WAIT):
+            # Background work only uses spare quota, dropped when none frees up in time.
+            metrics.increment("scheduler.dropped")
+            return None
+
+        response = await _send_request(https_params)
+        result = response.text if text else response.json()
+
+        message = throttle_message(result)
+        if message is None:
+            if cls is not None and is_cacheable(result):
+                ttl = ttl_seconds(cls)
+                if disk_cache is not None:
+                    await asyncio.to_thread(
+                        disk_cache.set, key, response.content, text, ttl
+                    )
+                return _cache_set(https_params, key, result, ttl, len(response.content))
+            return result
+        rate_limiter.backoff(THROTTLE_BACKOFF * 2**attempt)
+        if background:
+            return None
+
+    raise ValueError(f"Alpha Vantage rate limit exceeded: {message}")
+
+
+def _revalidate(https_params: dict, key: tuple, text: bool) -> None:
+    """
+    Refresh an expired cache entry in a background task, unless a refresh for it is
+    already running or MAX_REVALIDATIONS refreshes are in progress.
+
+    This serves the TTL classes listed in ALPHAVANTAGE_STALE_WHILE_REVALIDATE,
+    whose expired JSON responses are returned with a "_stale" marker meanwhile.
+    The refresh only uses spare rate limiter capacity and is given up after
+    ALPHAVANTAGE_BACKGROUND_MAX_WAIT seconds without any.
+    """
+
+    if (
+        key in _revalidations
+        or key in _inflight
+        or len(_revalidations) >= MAX_REVALIDATIONS
+    ):
+        return
+
+    async def refresh():
+        try:
+            await _fetch(https_params, key, text, background=True)
+        except (ValueError, httpx.HTTPError) as e:
+            # The stale entry stays cached; the next request after it runs out retries.
+            metrics.increment("revalidate.errors")
+            logger.warning("Refreshing %s failed: %s", https_params.get("function"), e)
+        finally:
+            _revalidations.pop(key, None)
+
+    metrics.increment("revalidate.started")
+    _revalidations[key] = asyncio.create_task(refresh())
+
+
+async def _make_api_request(
+    https_params: dict, text: bool = False
+) -> dict[str, str] | str:
+    """
+    Send a request to the Alpha Vantage API through the shared HTTP client, unless
+    it can be answered from a cache or locally.
+
+    The lookup order is the in-memory caches (cache.ResponseCache, and
+    store.SeriesStore for time series), an expired entry served while it is
+    refreshed (see _revalidate), then _fetch. Identical concurrent requests share
+    one call (see singleflight.SingleFlight).
+
+    :argument: https_params (dict): The query parameters, including the function and apikey.
+    :argument: text (bool): Always return the raw response text (default: False).
+
+    :returns: The response text for CSV (or text) requests, the decoded JSON otherwise.
+    Cached responses are shared between callers and must not be modified.
+    """
+
+    key = request_key(https_params)
+    cls = ttl_class(https_params)
+    if cls is not None:
+        cached = _cache_get(https_params, key)
+        if cached is not None:
+            return cached
+
+        if cls in STALE_WHILE_REVALIDATE:
+            stale = _cache_get_stale(https_params, key)
+            if stale is not None and isinstance(stale[0], dict):
+                _revalidate(https_params, key, text)
+                return mark_stale(*stale)
+
+    return await _inflight.do(key, lambda: _fetch(https_params, key, text))
+
+
+#####
+# Indexes of cached responses
+#####
+_indexes: dict[tuple, tuple] = {}
+_indexes_lock = asyncio.Lock()
+
+
+async def _index_of(name: tuple, source: str, build: Callable[[str], Any]) -> Any:
+    """
+    The index `build(source)` of a cached response, built in a worker thread.
+
+    The cache returns the same object for a response until it expires, so the
+    index is built once per response and rebuilt after a fresh one is fetched.
+
+    :argument: name (tuple): Identifies the index.
+    :argument: source (str): The response the index is built from.
+    :argument: build (Callable): Builds the index from the response.
+
+    :returns: The index.
+    """
+
+    async with _indexes_lock:
+        entry = _indexes.get(name)
+        if entry is None or entry[0] is not source:
+            entry = (source, await asyncio.to_thread(build, source))
+            _indexes[name] = entry
+    return entry[1]
+
 
 #####
 # Core Stock APIs
@@ -28,7 +477,7 @@ async def fetch_intraday(
     Fetch intraday stock data from the Alpha Vantage API.
 
     :argument: symbol (str): The stock symbol to fetch.
-    :argument: interval (str): The time interval for the data (default: "5min").
+    :argument: interval (str): The time interval for the data (default: "60min").
     :argument: datatype (str): The response data type (default: "json").
     :argument: adjusted (bool): The adjusted data flag (default: True).
     :argument: extended_hours (bool): The extended hours flag (default: True).
@@ -50,10 +499,7 @@ async def fetch_intraday(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_time_series_daily(
@@ -64,6 +510,7 @@ async def fetch_time_series_daily(
 
     :argument: symbol (str): The stock symbol to fetch.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: outputsize (str): The output size for the data (default: "compact").
 
     :returns: The daily stock data.
     """
@@ -75,10 +522,7 @@ async def fetch_time_series_daily(
         "outputsize": outputsize,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_time_series_daily_adjusted(
@@ -89,6 +533,7 @@ async def fetch_time_series_daily_adjusted(
 
     :argument: symbol (str): The stock symbol to fetch.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: outputsize (str): The output size for the data (default: "compact").
 
     :returns: The daily adjusted stock data.
     """
@@ -100,10 +545,7 @@ async def fetch_time_series_daily_adjusted(
         "outputsize": outputsize,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_time_series_weekly(
@@ -124,10 +566,7 @@ async def fetch_time_series_weekly(
         "datatype": datatype,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_time_series_weekly_adjusted(
@@ -148,10 +587,7 @@ async def fetch_time_series_weekly_adjusted(
         "datatype": datatype,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_time_series_monthly(
@@ -172,10 +608,7 @@ async def fetch_time_series_monthly(
         "datatype": datatype,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_time_series_monthly_adjusted(
@@ -196,10 +629,7 @@ async def fetch_time_series_monthly_adjusted(
         "datatype": datatype,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_quote(symbol: str, datatype: str = "json") -> dict[str, str] | str:
@@ -218,10 +648,7 @@ async def fetch_quote(symbol: str, datatype: str = "json") -> dict[str, str] | s
         "datatype": datatype,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_realtime_bulk_quotes(
@@ -230,22 +657,43 @@ async def fetch_realtime_bulk_quotes(
     """
     Fetch real-time bulk stock quotes from the Alpha Vantage API.
 
+    The API accepts 100 symbols per request; longer lists are split into chunks
+    fetched concurrently (under the rate limiter) and merged into one response.
+
     :argument: symbols (list[str]): The stock symbols to fetch.
     :argument: datatype (str): The response data type (default: "json").
 
     :returns: The real-time bulk stock quotes.
     """
 
-    https_params = {
-        "function": "REALTIME_BULK_QUOTES",
-        "symbols": ",".join(symbols[:100]),
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    results = await asyncio.gather(
+        *(
+            _make_api_request(
+                {
+                    "function": "REALTIME_BULK_QUOTES",
+                    "symbols": ",".join(chunk),
+                    "datatype": datatype,
+                    "apikey": API_KEY,
+                }
+            )
+            for chunk in chunk_symbols(symbols)
+        )
+    )
+    if len(results) == 1:
+        return results[0]
+    return merge_bulk_quotes(list(results))
+
+
+async def _batched_quote(https_params: dict) -> dict | None:
+    if https_params.get("datatype") != "json":
+        return None
+    return await quote_batcher.get(https_params["symbol"])
+
+
+quote_batcher = QuoteBatcher(fetch_realtime_bulk_quotes, QUOTE_BATCH_WINDOW)
+# Opt-in, since REALTIME_BULK_QUOTES is only available to premium keys.
+if QUOTE_BATCH_WINDOW > 0:
+    register_resolver("GLOBAL_QUOTE", _batched_quote)
 
 
 async def search_endpoint(
@@ -266,10 +714,7 @@ async def search_endpoint(
         "datatype": datatype,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_market_status() -> dict[str, str] | str:
@@ -280,10 +725,7 @@ async def fetch_market_status() -> dict[str, str] | str:
     """
 
     https_params = {"function": "MARKET_STATUS", "apikey": API_KEY}
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _make_api_request(https_params)
 
 
 #####
@@ -311,10 +753,7 @@ async def fetch_realtime_options(
         "contract": contract,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_historical_options(
@@ -335,10 +774,7 @@ async def fetch_historical_options(
         "date": date,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 #####
@@ -380,10 +816,7 @@ async def fetch_news_sentiment(
         "limit": limit,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_top_gainer_losers() -> dict[str, str]:
@@ -397,10 +830,7 @@ async def fetch_top_gainer_losers() -> dict[str, str]:
         "function": "TOP_GAINERS_LOSERS",
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_insider_transactions(symbol: str) -> dict[str, str]:
@@ -417,10 +847,7 @@ async def fetch_insider_transactions(symbol: str) -> dict[str, str]:
         "symbol": symbol,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_analytics_fixed_window(
@@ -433,8 +860,8 @@ async def fetch_analytics_fixed_window(
     """
     Fetch analytics data from the Alpha Vantage API.
 
-    :argument: symbol (list[str]): The stock symbols to fetch.
-    :argument: range (str): The range of the data (default: "full").
+    :argument: symbols (list[str]): The stock symbols to fetch.
+    :argument: series_range (str): The range of the data (default: "full").
     :argument: interval (str): The time interval for the data.
     :argument: ohlc (str): The OHLC data type (default: "close").
     :argument: calculations (list[str]): The analytics calculations (default: None).
@@ -451,10 +878,7 @@ async def fetch_analytics_fixed_window(
         "calculations": ",".join(calculations) if calculations else None,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_analytics_sliding_window(
@@ -468,7 +892,12 @@ async def fetch_analytics_sliding_window(
     """
     Fetch analytics data from the Alpha Vantage API.
 
-    :argument: symbol (list[str]): The stock symbols to fetch.
+    :argument: symbols (list[str]): The stock symbols to fetch.
+    :argument: series_range (str): The range of the data (default: "full").
+    :argument: ohlc (str): The OHLC data type (default: "close").
+    :argument: interval (str): The time interval for the data.
+    :argument: window_size (int): The size of the moving window (default: 10).
+    :argument: calculations (list[str]): The analytics calculations (default: None).
 
     :returns: The analytics data.
     """
@@ -483,10 +912,7 @@ async def fetch_analytics_sliding_window(
         "calculations": ",".join(calculations) if calculations else None,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _make_api_request(https_params)
 
 
 #####
@@ -508,10 +934,7 @@ async def fetch_company_overview(symbol: str) -> dict[str, str]:
         "symbol": symbol,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_etf_profile(symbol: str) -> dict[str, str]:
@@ -528,10 +951,7 @@ async def fetch_etf_profile(symbol: str) -> dict[str, str]:
         "symbol": symbol,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _make_api_request(https_params)
 
 
 async def company_dividends(symbol: str) -> dict[str, str]:
@@ -548,10 +968,7 @@ async def company_dividends(symbol: str) -> dict[str, str]:
         "symbol": symbol,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_company_splits(symbol: str) -> dict[str, str]:
@@ -568,10 +985,7 @@ async def fetch_company_splits(symbol: str) -> dict[str, str]:
         "symbol": symbol,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_income_statement(symbol: str) -> dict[str, str]:
@@ -588,10 +1002,7 @@ async def fetch_income_statement(symbol: str) -> dict[str, str]:
         "symbol": symbol,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_balance_sheet(symbol: str) -> dict[str, str]:
@@ -608,10 +1019,7 @@ async def fetch_balance_sheet(symbol: str) -> dict[str, str]:
         "symbol": symbol,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_cash_flow(symbol: str) -> dict[str, str]:
@@ -628,10 +1036,7 @@ async def fetch_cash_flow(symbol: str) -> dict[str, str]:
         "symbol": symbol,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_earnings(symbol: str) -> dict[str, str]:
@@ -648,10 +1053,7 @@ async def fetch_earnings(symbol: str) -> dict[str, str]:
         "symbol": symbol,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _make_api_request(https_params)
 
 async def fetch_earnings_call_transcript(symbol: str, quarter: str) -> dict[str, str]:
     """
@@ -669,21 +1071,17 @@ async def fetch_earnings_call_transcript(symbol: str, quarter: str) -> dict[str,
         "quarter": quarter,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _make_api_request(https_params)
 
-async def fetch_listing_status(
-        date: str = None, state: str = "active"
-) -> dict[str, str]:
+
+async def fetch_listing_status(date: str = None, state: str = "active") -> str:
     """
     Fetch company listing status data from the Alpha Vantage API.
 
     :argument: date (str): The date of the listing status (default: None).
     :argument: state (str): The listing status state (default: "active").
 
-    :returns: The company listing status data.
+    :returns: The company listing status data using CSV format.
     """
 
     https_params = {
@@ -692,20 +1090,25 @@ async def fetch_listing_status(
         "state": state,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _make_api_request(https_params, text=True)
 
 
 async def fetch_earnings_calendar(
-    symbol: str, horizon: str = "3month"
+    symbol: str,
+    horizon: str = "3month",
+    start_date: str = None,
+    end_date: str = None,
 ) -> str:
     """
     Fetch companies earnings calendar data from the Alpha Vantage API.
 
-    :argument: symbol (str): The stock symbol to fetch.
+    The calendar of every company is fetched once a day per horizon and shared by
+    all queries, which take their symbols and report dates from it.
+
+    :argument: symbol (str): The stock symbol to fetch, or a comma-separated list of symbols (default: every symbol).
     :argument: horizon (str): The earning calendar horizon (default: "3month").
+    :argument: start_date (str): The first report date, YYYY-MM-DD or YYYY-MM (default: None).
+    :argument: end_date (str): The last report date, inclusive (default: None).
 
     :returns: The company earning calendar data using CSV format
     """
@@ -715,13 +1118,17 @@ async def fetch_earnings_calendar(
         "horizon": horizon,
         "apikey": API_KEY,
     }
-    if symbol:
-        https_params["symbol"] = symbol
+    text = await _make_api_request(https_params, text=True)
+    symbols = [s.strip() for s in symbol.split(",") if s.strip()] if symbol else None
+    if symbols is None and start_date is None and end_date is None:
+        return text
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text
+    try:
+        calendar = await _index_of(("earnings", horizon), text, EarningsCalendar)
+    except ValueError:
+        # An error message rather than a calendar.
+        return text
+    return calendar.query(symbols, start_date, end_date)
 
 
 async def fetch_ipo_calendar() -> str:
@@ -735,10 +1142,7 @@ async def fetch_ipo_calendar() -> str:
         "function": "IPO_CALENDAR",
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text
+    return await _make_api_request(https_params, text=True)
 
 
 #####
@@ -765,10 +1169,7 @@ async def fetch_exchange_rate(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_fx_intraday(
@@ -800,10 +1201,7 @@ async def fetch_fx_intraday(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_fx_daily(
@@ -831,10 +1229,7 @@ async def fetch_fx_daily(
         "outputsize": outputsize,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_fx_weekly(
@@ -857,10 +1252,7 @@ async def fetch_fx_weekly(
         "datatype": datatype,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_fx_monthly(
@@ -883,10 +1275,7 @@ async def fetch_fx_monthly(
         "datatype": datatype,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 #####
@@ -906,8 +1295,9 @@ async def fetch_digital_currency_intraday(
 
     :argument: symbol (str): The digital currency symbol to fetch.
     :argument: market (str): The market symbol to fetch.
-    :argument: interval (str): The time interval for the data (default: "5min").
+    :argument: interval (str): The time interval for the data (default: None).
     :argument: datatype (str): The response data type (default: "json").
+    :argument: outputsize (str): The output size for the data (default: "compact").
 
     :returns: The intraday digital currency data.
     """
@@ -922,13 +1312,10 @@ async def fetch_digital_currency_intraday(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
-async def fetch_digital_currency_daily(symbol: str, market: str) -> str:
+async def fetch_digital_currency_daily(symbol: str, market: str) -> dict[str, str]:
     """
     Fetch daily digital currency data from the Alpha Vantage API.
 
@@ -945,13 +1332,10 @@ async def fetch_digital_currency_daily(symbol: str, market: str) -> str:
         "market": market,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text
+    return await _make_api_request(https_params)
 
 
-async def fetch_digital_currency_weekly(symbol: str, market: str) -> str:
+async def fetch_digital_currency_weekly(symbol: str, market: str) -> dict[str, str]:
     """
     Fetch weekly digital currency data from the Alpha Vantage API.
 
@@ -968,13 +1352,10 @@ async def fetch_digital_currency_weekly(symbol: str, market: str) -> str:
         "market": market,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text
+    return await _make_api_request(https_params)
 
 
-async def fetch_digital_currency_monthly(symbol: str, market: str) -> str:
+async def fetch_digital_currency_monthly(symbol: str, market: str) -> dict[str, str]:
     """
     Fetch monthly digital currency data from the Alpha Vantage API.
 
@@ -991,10 +1372,7 @@ async def fetch_digital_currency_monthly(symbol: str, market: str) -> str:
         "market": market,
         "apikey": API_KEY,
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text
+    return await _make_api_request(https_params)
 
 
 #####
@@ -1021,10 +1399,7 @@ async def fetch_wti_crude(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_brent_crude(
@@ -1046,10 +1421,7 @@ async def fetch_brent_crude(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_natural_gas(
@@ -1071,10 +1443,7 @@ async def fetch_natural_gas(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_copper(
@@ -1096,10 +1465,7 @@ async def fetch_copper(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_aluminum(
@@ -1121,10 +1487,7 @@ async def fetch_aluminum(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_wheat(
@@ -1146,10 +1509,7 @@ async def fetch_wheat(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_corn(
@@ -1171,10 +1531,7 @@ async def fetch_corn(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_cotton(
@@ -1196,10 +1553,7 @@ async def fetch_cotton(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_sugar(
@@ -1221,10 +1575,7 @@ async def fetch_sugar(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_coffee(
@@ -1246,10 +1597,7 @@ async def fetch_coffee(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_all_commodities(
@@ -1271,10 +1619,7 @@ async def fetch_all_commodities(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 #####
@@ -1301,10 +1646,7 @@ async def fetch_real_gdp(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_real_gdp_per_capita(datatype: str = "json") -> dict[str, str] | str:
@@ -1323,10 +1665,7 @@ async def fetch_real_gdp_per_capita(datatype: str = "json") -> dict[str, str] |
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_treasury_yield(
@@ -1350,10 +1689,7 @@ async def fetch_treasury_yield(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_federal_funds_rate(
@@ -1375,10 +1711,7 @@ async def fetch_federal_funds_rate(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_cpi(
@@ -1400,10 +1733,7 @@ async def fetch_cpi(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_inflation(datatype: str = "json") -> dict[str, str] | str:
@@ -1421,10 +1751,7 @@ async def fetch_inflation(datatype: str = "json") -> dict[str, str] | str:
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_retail_sales(datatype: str = "json") -> dict[str, str] | str:
@@ -1442,10 +1769,7 @@ async def fetch_retail_sales(datatype: str = "json") -> dict[str, str] | str:
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_durables(datatype: str = "json") -> dict[str, str] | str:
@@ -1463,10 +1787,7 @@ async def fetch_durables(datatype: str = "json") -> dict[str, str] | str:
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_unemployment(datatype: str = "json") -> dict[str, str] | str:
@@ -1484,10 +1805,7 @@ async def fetch_unemployment(datatype: str = "json") -> dict[str, str] | str:
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_nonfarm_payrolls(datatype: str = "json") -> dict[str, str] | str:
@@ -1505,10 +1823,7 @@ async def fetch_nonfarm_payrolls(datatype: str = "json") -> dict[str, str] | str
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 #####
@@ -1548,10 +1863,7 @@ async def fetch_sma(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_ema(
@@ -1586,10 +1898,7 @@ async def fetch_ema(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_wma(
@@ -1624,10 +1933,7 @@ async def fetch_wma(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_dema(
@@ -1662,10 +1968,7 @@ async def fetch_dema(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_tema(
@@ -1700,10 +2003,7 @@ async def fetch_tema(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_trima(
@@ -1738,10 +2038,7 @@ async def fetch_trima(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_kama(
@@ -1776,10 +2073,7 @@ async def fetch_kama(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_mama(
@@ -1817,10 +2111,7 @@ async def fetch_mama(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_vwap(
@@ -1849,10 +2140,7 @@ async def fetch_vwap(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_t3(
@@ -1887,10 +2175,7 @@ async def fetch_t3(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_macd(
@@ -1931,10 +2216,7 @@ async def fetch_macd(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_macdext(
@@ -1984,10 +2266,7 @@ async def fetch_macdext(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_stoch(
@@ -2031,10 +2310,7 @@ async def fetch_stoch(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_stochf(
@@ -2072,10 +2348,7 @@ async def fetch_stochf(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_rsi(
@@ -2110,10 +2383,7 @@ async def fetch_rsi(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_stochrsi(
@@ -2157,10 +2427,7 @@ async def fetch_stochrsi(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_willr(
@@ -2192,10 +2459,7 @@ async def fetch_willr(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_adx(
@@ -2227,10 +2491,7 @@ async def fetch_adx(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_adxr(
@@ -2262,10 +2523,7 @@ async def fetch_adxr(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_apo(
@@ -2306,10 +2564,7 @@ async def fetch_apo(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_ppo(
@@ -2350,10 +2605,7 @@ async def fetch_ppo(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_mom(
@@ -2388,10 +2640,7 @@ async def fetch_mom(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_bop(
@@ -2420,10 +2669,7 @@ async def fetch_bop(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_cci(
@@ -2455,10 +2701,7 @@ async def fetch_cci(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_cmo(
@@ -2493,10 +2736,7 @@ async def fetch_cmo(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_roc(
@@ -2531,10 +2771,7 @@ async def fetch_roc(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_rocr(
@@ -2569,10 +2806,7 @@ async def fetch_rocr(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_aroon(
@@ -2604,10 +2838,7 @@ async def fetch_aroon(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_aroonosc(
@@ -2639,10 +2870,7 @@ async def fetch_aroonosc(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_mfi(
@@ -2674,10 +2902,7 @@ async def fetch_mfi(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_trix(
@@ -2712,10 +2937,7 @@ async def fetch_trix(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_ultosc(
@@ -2753,10 +2975,7 @@ async def fetch_ultosc(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_dx(
@@ -2788,10 +3007,7 @@ async def fetch_dx(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_minus_di(
@@ -2823,10 +3039,7 @@ async def fetch_minus_di(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_plus_di(
@@ -2858,10 +3071,7 @@ async def fetch_plus_di(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_minus_dm(
@@ -2893,10 +3103,7 @@ async def fetch_minus_dm(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_plus_dm(
@@ -2928,10 +3135,7 @@ async def fetch_plus_dm(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_bbands(
@@ -2975,10 +3179,7 @@ async def fetch_bbands(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_midpoint(
@@ -3013,10 +3214,7 @@ async def fetch_midpoint(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_midprice(
@@ -3048,10 +3246,7 @@ async def fetch_midprice(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_sar(
@@ -3086,10 +3281,7 @@ async def fetch_sar(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_trange(
@@ -3118,10 +3310,7 @@ async def fetch_trange(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_atr(
@@ -3153,10 +3342,7 @@ async def fetch_atr(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_natr(
@@ -3188,10 +3374,7 @@ async def fetch_natr(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_ad(
@@ -3220,10 +3403,7 @@ async def fetch_ad(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_adosc(
@@ -3258,10 +3438,7 @@ async def fetch_adosc(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_obv(
@@ -3290,10 +3467,7 @@ async def fetch_obv(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_ht_trendline(
@@ -3325,10 +3499,7 @@ async def fetch_ht_trendline(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_ht_sine(
@@ -3360,10 +3531,7 @@ async def fetch_ht_sine(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_ht_trendmode(
@@ -3392,10 +3560,7 @@ async def fetch_ht_trendmode(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_ht_dcperiod(
@@ -3427,10 +3592,7 @@ async def fetch_ht_dcperiod(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_ht_dcphase(
@@ -3462,10 +3624,7 @@ async def fetch_ht_dcphase(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
 
 
 async def fetch_ht_phasor(
@@ -3497,7 +3656,499 @@ async def fetch_ht_phasor(
         "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _make_api_request(https_params)
+
+
+#####
+# Local technical indicators
+#####
+
+
+def price_series_key(symbol: str, interval: str, month: str = None) -> tuple | None:
+    """
+    :argument: symbol (str): The stock symbol.
+    :argument: interval (str): The indicator interval.
+    :argument: month (str): The month of intraday data (default: None).
+
+    :returns: The series store key of the series fetch_price_series loads, or None if it is not kept there.
+    """
+
+    if interval in INTRADAY_INTERVALS:
+        params = {
+            "function": "TIME_SERIES_INTRADAY",
+            "interval": interval,
+            "month": month,
+        }
+    else:
+        params = {"function": f"TIME_SERIES_{str(interval).upper()}"}
+    return series_key({**params, "symbol": symbol, "outputsize": "full"})
+
+
+async def fetch_price_series(
+    symbol: str, interval: str = "daily", month: str = None
+) -> OHLCV:
+    """
+    Fetch the full price series technical indicators of an interval are computed from.
+
+    Daily, weekly and monthly indicators use the (unadjusted) TIME_SERIES_DAILY,
+    TIME_SERIES_WEEKLY and TIME_SERIES_MONTHLY series; intraday indicators use
+    TIME_SERIES_INTRADAY for the interval and month. The series is fetched through
+    the regular request path, so it is cached and shared by every indicator.
+
+    :argument: symbol (str): The stock symbol to fetch.
+    :argument: interval (str): The indicator interval (default: "daily").
+    :argument: month (str): The month of intraday data (default: None).
+
+    :returns: The price series in ascending time order.
+    """
+
+    if interval in INTRADAY_INTERVALS:
+        payload = await fetch_intraday(symbol, interval, outputsize="full", month=month)
+    elif interval == "daily":
+        payload = await fetch_time_series_daily(symbol, outputsize="full")
+    elif interval == "weekly":
+        payload = await fetch_time_series_weekly(symbol)
+    elif interval == "monthly":
+        payload = await fetch_time_series_monthly(symbol)
+    else:
+        raise UnsupportedIndicator(f"Unsupported interval: {interval}")
+    return parse_ohlcv(payload)
+
+
+async def _local_indicator(https_params: dict) -> dict | None:
+    if https_params.get("datatype") not in (None, "json"):
+        return None
+    function = https_params["function"]
+    interval = https_params.get("interval")
+    try:
+        params = resolve_params(function, https_params)
+        if interval not in INTERVALS:
+            raise UnsupportedIndicator(f"Unsupported interval: {interval}")
+        series = await fetch_price_series(
+            https_params["symbol"], interval, https_params.get("month")
+        )
+    except ValueError:
+        # Unsupported parameters or no usable series: the API answers instead.
+        metrics.increment("indicators.fallbacks")
+        return None
+
+    key = price_series_key(https_params["symbol"], interval, https_params.get("month"))
+    name = (function, tuple(sorted(params.items())))
+    streamed = key is not None and function in STREAMS and key in series_store
+    checkpoint = series_store.state(key, name) if streamed else None
+
+    def run():
+        if not streamed:
+            values, saved = compute(IndicatorContext(series), function, params), None
+        else:
+            values, saved, resumed = advance(function, params, series, checkpoint)
+            if resumed:
+                metrics.increment("indicators.resumed")
+        payload = to_payload(
+            function, https_params["symbol"], interval, series, params, values
+        )
+        return payload, saved
+
+    metrics.increment("indicators.local")
+    payload, saved = await asyncio.to_thread(run)
+    if streamed:
+        series_store.set_state(key, name, saved)
+    return payload
+
+
+async def fetch_indicator_bundle(
+    symbol: str, interval: str, indicators: list[dict], month: str = None
+) -> dict[str, dict]:
+    """
+    Compute several technical indicators of one symbol in a single pass.
+
+    The price series is loaded once (see fetch_price_series) and every indicator
+    is computed over the same IndicatorContext, so intermediates such as EMAs and
+    the true range are shared between them. Indicators that cannot be computed
+    locally (e.g. KAMA or SAR) are fetched from the API concurrently, as are all of
+    them when no price series can be loaded.
+
+    :argument: symbol (str): The stock symbol.
+    :argument: interval (str): The time interval, e.g. "daily" or "5min".
+    :argument: indicators (list[dict]): The indicators, each with a "function" and its
+        parameters, e.g. {"function": "SMA", "time_period": 20, "series_type": "close"}.
+        An optional "name" overrides the key of the indicator in the result.
+    :argument: month (str): The month of intraday data (default: None).
+
+    :returns: One technical indicator response per indicator, keyed by name
+        (default: the function followed by its parameter values, e.g. "SMA(20, close)").
+    """
+
+    if not indicators:
+        raise ValueError("At least one indicator is required")
+
+    requests = {}
+    for spec in indicators:
+        spec = dict(spec)
+        function = str(spec.pop("function", "")).upper()
+        if not function:
+            raise ValueError(f"Indicator without function: {spec}")
+        name = spec.pop("name", None) or (
+            f"{function}({', '.join(str(v) for v in spec.values())})"
+            if spec
+            else function
+        )
+        if name in requests:
+            raise ValueError(f"Duplicate indicator: {name}")
+        requests[name] = {
+            **spec,
+            "function": function,
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+        }
+
+    local = {}
+    for name, https_params in requests.items():
+        try:
+            local[name] = resolve_params(https_params["function"], https_params)
+        except UnsupportedIndicator:
+            pass
+
+    series = None
+    if local:
+        try:
+            if interval not in INTERVALS:
+                raise UnsupportedIndicator(f"Unsupported interval: {interval}")
+            series = await fetch_price_series(symbol, interval, month)
+        except ValueError:
+            metrics.increment("indicators.fallbacks", len(local))
+            local = {}
+
+    remote = [name for name in requests if name not in local]
+    fetched = await asyncio.gather(
+        *(
+            _make_api_request({**requests[name], "datatype": "json", "apikey": API_KEY})
+            for name in remote
+        )
+    )
+
+    def run():
+        ctx = IndicatorContext(series)
+        return {
+            name: to_payload(
+                requests[name]["function"],
+                symbol,
+                interval,
+                series,
+                params,
+                compute(ctx, requests[name]["function"], params),
+            )
+            for name, params in local.items()
+        }
+
+    computed = await asyncio.to_thread(run) if local else {}
+    metrics.increment("indicators.local", len(computed))
+    results = {**computed, **dict(zip(remote, fetched))}
+    return {name: results[name] for name in requests}
+
+
+#####
+# Intraday backfill
+#####
+def _join_months(partitions: list[dict | SeriesFrame]) -> dict | SeriesFrame:
+    if all(isinstance(part, SeriesFrame) for part in partitions):
+        joined = concat_frames(partitions)
+        if joined is not None:
+            return joined
+    return {date: row for part in reversed(partitions) for date, row in part.items()}
+
+
+async def backfill_intraday(
+    symbol: str,
+    interval: str,
+    start_date: str,
+    end_date: str,
+    adjusted: bool = True,
+    extended_hours: bool = True,
+    include_data: bool = False,
+) -> dict:
+    """
+    Load the intraday history of a symbol over a date range, one calendar month per request.
+
+    The months are requested concurrently (up to ALPHAVANTAGE_BACKFILL_CONCURRENCY
+    at a time) under the shared rate limiter, and progress is reported after each
+    one. Completed past months are cached as immutable responses, also on disk when
+    ALPHAVANTAGE_DISK_CACHE_PATH is set, so running the same backfill again after an
+    interruption only requests the months still missing. A failed month does not
+    stop the others; it is listed under "failed".
+
+    :argument: symbol (str): The stock symbol to load.
+    :argument: interval (str): The time interval between data points: 1min, 5min, 15min, 30min or 60min.
+    :argument: start_date (str): The first date of the range, YYYY-MM or YYYY-MM-DD.
+    :argument: end_date (str): The last date of the range, YYYY-MM or YYYY-MM-DD.
+    :argument: adjusted (bool): The adjusted data flag (default: True).
+    :argument: extended_hours (bool): The extended hours flag (default: True).
+    :argument: include_data (bool): Return the data points of the range as well as the summary (default: False).
+
+    :returns: The number of data points loaded per month, the months that failed, and the data points when requested.
+    """
+
+    if interval not in INTRADAY_INTERVALS:
+        raise ValueError(f"Invalid interval: {interval}")
+    months = plan_months(start_date, end_date)
+    semaphore = asyncio.Semaphore(BACKFILL_CONCURRENCY)
+    done = 0
+
+    async def load(month: str) -> dict:
+        nonlocal done
+        try:
+            async with semaphore:
+                payload = await fetch_intraday(
+                    symbol,
+                    interval,
+                    adjusted=adjusted,
+                    extended_hours=extended_hours,
+                    outputsize="full",
+                    month=month,
+                )
+        finally:
+            done += 1
+            await report_progress(done, len(months))
+        if not isinstance(payload, dict):
+            raise TypeError(f"no time series: {type(payload).__name__} response")
+        if f"Time Series ({interval})" not in payload:
+            message = payload.get("Error Message") or payload.get("Information")
+            raise ValueError(message or "no time series")
+        return payload[f"Time Series ({interval})"]
+
+    await report_progress(0, len(months))
+    loaded = await asyncio.gather(
+        *(load(month) for month in months), return_exceptions=True
+    )
+
+    summary, failed, partitions = {}, {}, []
+    for month, series in zip(months, loaded):
+        if isinstance(series, BaseException):
+            if not isinstance(series, Exception):
+                raise series  # Cancelled, not a failed month
+            failed[month] = str(series)
+            metrics.increment("backfill.failed_months")
+        else:
+            summary[month] = len(series)
+            partitions.append(series)
+    metrics.increment("backfill.months", len(summary))
+
+    result = {
+        "Meta Data": {
+            "1. Information": "Intraday backfill",
+            "2. Symbol": symbol,
+            "3. Interval": interval,
+            "4. Start Date": start_date,
+            "5. End Date": end_date,
+        },
+        "months": summary,
+        "failed": failed,
+    }
+    if include_data and partitions:
+        series = _join_months(partitions)
+        result[f"Time Series ({interval})"] = series
+        result = select(result, *date_range(start_date, end_date))
+    return result
+
+
+#####
+# Local resampling
+#####
+async def _local_resample(https_params: dict) -> dict | None:
+    """
+    Resolver deriving weekly and monthly series from the full daily history of the
+    same series, when the series store holds a fresh one. The daily series is never
+    requested for this; without it the request goes to the API.
+    """
+
+    spec = RESAMPLINGS[https_params["function"]]
+    daily_params = {**https_params, "function": spec.daily}
+    if spec.daily in OUTPUTSIZE_FUNCTIONS:
+        daily_params["outputsize"] = "full"
+    key = series_key(daily_params)
+    daily = series_store.get(key, daily_params) if key is not None else None
+    result = None
+    if daily is not None:
+        result = await asyncio.to_thread(
+            resampled_payload, https_params["function"], daily
+        )
+    metrics.increment("resample.local" if result is not None else "resample.fallbacks")
+    return result
+
+
+#####
+# Local symbol search
+#####
+async def symbol_index() -> SymbolIndex:
+    """
+    The search index of the active listings, rebuilt with each daily listing
+    (LISTING_STATUS) fetch.
+
+    :returns: The symbol index.
+    """
+
+    listing = await fetch_listing_status()
+    return await _index_of(("symbols",), listing, SymbolIndex.from_csv)
+
+
+async def _local_symbol_search(https_params: dict) -> dict | None:
+    """
+    Resolver answering SYMBOL_SEARCH from the index of the active listings. When
+    nothing matches, the request goes to the API unless
+    ALPHAVANTAGE_SYMBOL_SEARCH_FALLBACK is disabled.
+    """
+
+    if https_params.get("datatype") not in (None, "json"):
+        return None
+    index = await symbol_index()
+    result = index.best_matches(https_params.get("keywords") or "")
+    if result["bestMatches"] or not SYMBOL_SEARCH_FALLBACK:
+        metrics.increment("symbol_search.local")
+        return result
+    metrics.increment("symbol_search.fallbacks")
+    return None
+
+
+#####
+# Local analytics
+#####
+async def _local_analytics(https_params: dict) -> dict | None:
+    """
+    Resolver computing ANALYTICS_FIXED_WINDOW and ANALYTICS_SLIDING_WINDOW from the
+    cached price series of each symbol (see fetch_price_series), with no limit on
+    the number of symbols. Intraday intervals, unsupported calculations and series
+    that cannot be loaded go to the API.
+    """
+
+    symbols = [
+        symbol.strip().upper()
+        for symbol in (
+            https_params.get("symbols") or https_params.get("symbol") or ""
+        ).split(",")
+        if symbol.strip()
+    ]
+    interval = str(https_params.get("interval") or "").lower()
+    ohlc = str(https_params.get("ohlc") or "close").lower()
+    sliding = https_params["function"] == "ANALYTICS_SLIDING_WINDOW"
+    try:
+        calculations = parse_calculations(https_params.get("calculations"), sliding)
+        if not symbols or interval not in PERIODS_PER_YEAR or ohlc not in OHLC_FIELDS:
+            raise ValueError("Unsupported analytics request")
+        window_size = int(https_params.get("window_size") or 10) if sliding else None
+        prices = await asyncio.gather(
+            *(fetch_price_series(symbol, interval) for symbol in symbols)
+        )
+        series = [(price.dates, getattr(price, ohlc)) for price in prices]
+        result = await asyncio.to_thread(
+            analyze,
+            symbols,
+            series,
+            calculations,
+            interval,
+            ohlc,
+            https_params.get("range"),
+            window_size,
+        )
+    except ValueError:
+        metrics.increment("analytics.fallbacks")
+        return None
+    metrics.increment("analytics.local")
+    return result
+
+
+#####
+# Cross-sectional risk
+#####
+async def fetch_correlation_matrix(
+    symbols: list[str],
+    start_date: str = None,
+    end_date: str = None,
+    matrix: str = "correlation",
+    shrinkage: str | float = None,
+    adjusted: bool = False,
+) -> dict:
+    """
+    Compute the correlation or covariance matrix of the daily returns of many symbols.
+
+    The full daily histories are loaded concurrently under the shared rate limiter
+    (cached histories are reused) and progress is reported after each symbol. The
+    prices are aligned on the dates all loaded symbols have, so a symbol with a
+    short history shortens the window of every other. Symbols that fail to load are
+    listed under "failed" and left out of the matrix.
+
+    :argument: symbols (list[str]): The stock symbols, any number of them.
+    :argument: start_date (str): The first date of the window, YYYY-MM or YYYY-MM-DD (default: None).
+    :argument: end_date (str): The last date of the window, YYYY-MM or YYYY-MM-DD (default: None).
+    :argument: matrix (str): "correlation" or "covariance" (default: "correlation").
+    :argument: shrinkage (str | float): "ledoit_wolf" for the Ledoit-Wolf estimate, or a shrinkage intensity between 0 and 1 towards the average variance (default: None).
+    :argument: adjusted (bool): Use adjusted closes from TIME_SERIES_DAILY_ADJUSTED instead of the closes of TIME_SERIES_DAILY (default: False).
+
+    :returns: The lower triangle of the matrix with its index of symbols, the dates it covers, and the symbols that failed.
+    """
+
+    symbols = list(
+        dict.fromkeys(symbol.strip().upper() for symbol in symbols if symbol.strip())
+    )
+    if len(symbols) < 2:
+        raise ValueError("At least two symbols are required")
+    done = 0
+
+    async def load(symbol: str) -> tuple:
+        nonlocal done
+        try:
+            if adjusted:
+                payload = await fetch_time_series_daily_adjusted(
+                    symbol, outputsize="full"
+                )
+            else:
+                payload = await fetch_time_series_daily(symbol, outputsize="full")
+        finally:
+            done += 1
+            await report_progress(done, len(symbols))
+        return price_column(payload, "adjusted close" if adjusted else "close")
+
+    loaded = await asyncio.gather(*map(load, symbols), return_exceptions=True)
+    for series in loaded:
+        if isinstance(series, BaseException) and not isinstance(series, Exception):
+            raise series  # Cancelled, not a failed symbol
+    failed = {
+        symbol: str(series)
+        for symbol, series in zip(symbols, loaded)
+        if isinstance(series, Exception)
+    }
+    available = [
+        (symbol, series)
+        for symbol, series in zip(symbols, loaded)
+        if not isinstance(series, Exception)
+    ]
+    if len(available) < 2:
+        raise ValueError(f"Fewer than two symbols could be loaded: {failed}")
+
+    result = await asyncio.to_thread(
+        cross_section,
+        [symbol for symbol, _ in available],
+        [series for _, series in available],
+        matrix,
+        start_date,
+        end_date,
+        shrinkage,
+    )
+    result["failed"] = failed
+    return result
+
+
+if LOCAL_INDICATORS:
+    for _function in INDICATORS:
+        register_resolver(_function, _local_indicator)
+
+if LOCAL_RESAMPLING:
+    for _function in RESAMPLINGS:
+        register_resolver(_function, _local_resample)
+
+if LOCAL_SYMBOL_SEARCH:
+    register_resolver("SYMBOL_SEARCH", _local_symbol_search)
+
+if LOCAL_ANALYTICS:
+    register_resolver("ANALYTICS_FIXED_WINDOW", _local_analytics)
+    register_resolver("ANALYTICS_SLIDING_WINDOW", _local_analytics)
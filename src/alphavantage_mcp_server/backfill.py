@@ -0,0 +1,49 @@
+import calendar
+from datetime import date
+
+
+def _month(value: str) -> tuple[int, int]:
+    try:
+        parsed = date.fromisoformat(value[:7] + "-01")
+    except ValueError:
+        raise ValueError(
+            f"Invalid date: {value} (expected YYYY-MM or YYYY-MM-DD)"
+        ) from None
+    return parsed.year, parsed.month
+
+
+def plan_months(start_date: str, end_date: str) -> list[str]:
+    """
+    Split a date range into the calendar months TIME_SERIES_INTRADAY serves with `month`.
+
+    :argument: start_date (str): The first date, YYYY-MM or YYYY-MM-DD.
+    :argument: end_date (str): The last date, YYYY-MM or YYYY-MM-DD.
+
+    :returns: The months covering the range, as YYYY-MM, oldest first.
+    """
+
+    start, end = _month(start_date), _month(end_date)
+    if start > end:
+        raise ValueError(f"start_date {start_date} is after end_date {end_date}")
+    months = []
+    year, month = start
+    while (year, month) <= end:
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def date_range(start_date: str, end_date: str) -> tuple[str, str]:
+    """
+    :argument: start_date (str): The first date, YYYY-MM or YYYY-MM-DD.
+    :argument: end_date (str): The last date, YYYY-MM or YYYY-MM-DD.
+
+    :returns: The range as YYYY-MM-DD dates, from the first day of a start month to the last day of an end month.
+    """
+
+    if len(start_date) == 7:
+        start_date = f"{start_date}-01"
+    if len(end_date) == 7:
+        year, month = _month(end_date)
+        end_date = f"{end_date}-{calendar.monthrange(year, month)[1]:02d}"
+    return start_date, end_date
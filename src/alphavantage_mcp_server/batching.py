@@ -0,0 +1,154 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+from alphavantage_mcp_server import metrics
+
+BULK_QUOTES_MAX_SYMBOLS = 100
+
+
+def chunk_symbols(
+    symbols: list[str], size: int = BULK_QUOTES_MAX_SYMBOLS
+) -> list[list[str]]:
+    """
+    :argument: symbols (list[str]): The symbols to split.
+    :argument: size (int): The maximum chunk length (default: 100).
+
+    :returns: Consecutive chunks of at most `size` symbols (one empty chunk for no symbols).
+    """
+
+    return [symbols[i : i + size] for i in range(0, len(symbols), size)] or [symbols]
+
+
+def merge_bulk_quotes(results: list[dict | str]) -> dict | str:
+    """
+    Merge the responses of several REALTIME_BULK_QUOTES requests into one.
+
+    JSON responses are merged by concatenating their "data" arrays (other keys are
+    taken from the first response); CSV responses are concatenated keeping only
+    the first header line.
+
+    :argument: results (list[dict | str]): The responses, in symbol order.
+
+    :returns: The merged response.
+    """
+
+    first = results[0]
+    if isinstance(first, str):
+        lines = first.splitlines(keepends=True)
+        for result in results[1:]:
+            lines.extend(result.splitlines(keepends=True)[1:])
+        return "".join(lines)
+
+    data = []
+    for result in results:
+        if isinstance(result, dict):
+            data.extend(result.get("data", []))
+    return {**first, "data": data}
+
+
+def bulk_to_global_quote(row: dict) -> dict:
+    """
+    Convert a REALTIME_BULK_QUOTES data row into the GLOBAL_QUOTE response shape.
+
+    :argument: row (dict): One entry of the bulk response "data" array.
+
+    :returns: The quote as returned by GLOBAL_QUOTE.
+    """
+
+    change_percent = row.get("change_percent", "")
+    try:
+        change_percent = f"{float(change_percent):.4f}%"
+    except ValueError:
+        pass
+
+    return {
+        "Global Quote": {
+            "01. symbol": row.get("symbol", ""),
+            "02. open": row.get("open", ""),
+            "03. high": row.get("high", ""),
+            "04. low": row.get("low", ""),
+            "05. price": row.get("close", ""),
+            "06. volume": row.get("volume", ""),
+            "07. latest trading day": row.get("timestamp", "")[:10],
+            "08. previous close": row.get("previous_close", ""),
+            "09. change": row.get("change", ""),
+            "10. change percent": change_percent,
+        }
+    }
+
+
+class QuoteBatcher:
+    """
+    Collect quote requests arriving within a short window and answer them with one
+    bulk quote request.
+
+    The window starts with the first request; when it closes (or `max_batch`
+    symbols are waiting) all waiting symbols are fetched through `fetch_bulk` and
+    each caller receives its quote in GLOBAL_QUOTE shape, or None if the bulk
+    response did not include the symbol.
+    """
+
+    def __init__(
+        self,
+        fetch_bulk: Callable[[list[str]], Awaitable[dict]],
+        window: float,
+        max_batch: int = 100,
+    ):
+        self.fetch_bulk = fetch_bulk
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: dict[str, list[asyncio.Future]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def get(self, symbol: str) -> dict | None:
+        """
+        :argument: symbol (str): The stock symbol to quote.
+
+        :returns: The quote in GLOBAL_QUOTE shape, or None if the bulk response lacked the symbol.
+        """
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(symbol.upper(), []).append(future)
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, {}
+        if pending:
+            task = asyncio.get_running_loop().create_task(self._resolve(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, pending: dict[str, list[asyncio.Future]]) -> None:
+        metrics.increment("quote_batcher.batches")
+        metrics.increment("quote_batcher.symbols", len(pending))
+        try:
+            result = await self.fetch_bulk(list(pending))
+            rows = result.get("data", []) if isinstance(result, dict) else []
+            quotes = {row["symbol"].upper(): row for row in rows if "symbol" in row}
+            for symbol, futures in pending.items():
+                row = quotes.get(symbol)
+                quote = bulk_to_global_quote(row) if row is not None else None
+                for future in futures:
+                    if not future.done():
+                        future.set_result(quote)
+        except (ValueError, httpx.HTTPError) as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+        finally:
+            # After any other error, cancel the callers rather than leave them waiting.
+            for futures in pending.values():
+                for future in futures:
+                    future.cancel()
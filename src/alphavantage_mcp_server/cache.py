@@ -0,0 +1,337 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from datetime import time as dt_time
+from enum import Enum
+from typing import Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from alphavantage_mcp_server import metrics
+
+try:
+    MARKET_TIMEZONE = ZoneInfo("America/New_York")
+except ZoneInfoNotFoundError:
+    MARKET_TIMEZONE = timezone(timedelta(hours=-5))
+
+# Daily data is considered final a little after the 16:00 ET close.
+MARKET_CLOSE = dt_time(16, 15)
+
+INTRADAY_INTERVALS = {"1min", "5min", "15min", "30min", "60min"}
+
+
+class TTLClass(str, Enum):
+    REALTIME = "realtime"
+    INTRADAY = "intraday"
+    DAILY = "daily"
+    FUNDAMENTALS = "fundamentals"
+    IMMUTABLE = "immutable"
+
+
+TTL_SECONDS = {
+    TTLClass.REALTIME: 15,
+    TTLClass.INTRADAY: 5 * 60,
+    TTLClass.FUNDAMENTALS: 24 * 60 * 60,
+    TTLClass.IMMUTABLE: float("inf"),
+}
+
+TTL_POLICY = {
+    # Quotes and snapshots
+    "GLOBAL_QUOTE": TTLClass.REALTIME,
+    "REALTIME_BULK_QUOTES": TTLClass.REALTIME,
+    "MARKET_STATUS": TTLClass.REALTIME,
+    "REALTIME_OPTIONS": TTLClass.REALTIME,
+    "CURRENCY_EXCHANGE_RATE": TTLClass.REALTIME,
+    "TOP_GAINERS_LOSERS": TTLClass.REALTIME,
+    # Intraday series and news
+    "TIME_SERIES_INTRADAY": TTLClass.INTRADAY,
+    "FX_INTRADAY": TTLClass.INTRADAY,
+    "CRYPTO_INTRADAY": TTLClass.INTRADAY,
+    "NEWS_SENTIMENT": TTLClass.INTRADAY,
+    # End of day series
+    "TIME_SERIES_DAILY": TTLClass.DAILY,
+    "TIME_SERIES_DAILY_ADJUSTED": TTLClass.DAILY,
+    "TIME_SERIES_WEEKLY": TTLClass.DAILY,
+    "TIME_SERIES_WEEKLY_ADJUSTED": TTLClass.DAILY,
+    "TIME_SERIES_MONTHLY": TTLClass.DAILY,
+    "TIME_SERIES_MONTHLY_ADJUSTED": TTLClass.DAILY,
+    "FX_DAILY": TTLClass.DAILY,
+    "FX_WEEKLY": TTLClass.DAILY,
+    "FX_MONTHLY": TTLClass.DAILY,
+    "DIGITAL_CURRENCY_DAILY": TTLClass.DAILY,
+    "DIGITAL_CURRENCY_WEEKLY": TTLClass.DAILY,
+    "DIGITAL_CURRENCY_MONTHLY": TTLClass.DAILY,
+    "HISTORICAL_OPTIONS": TTLClass.DAILY,
+    "INSIDER_TRANSACTIONS": TTLClass.DAILY,
+    "ANALYTICS_FIXED_WINDOW": TTLClass.DAILY,
+    "ANALYTICS_SLIDING_WINDOW": TTLClass.DAILY,
+    "LISTING_STATUS": TTLClass.DAILY,
+    "EARNINGS_CALENDAR": TTLClass.DAILY,
+    "IPO_CALENDAR": TTLClass.DAILY,
+    "WTI": TTLClass.DAILY,
+    "BRENT": TTLClass.DAILY,
+    "NATURAL_GAS": TTLClass.DAILY,
+    "COPPER": TTLClass.DAILY,
+    "ALUMINUM": TTLClass.DAILY,
+    "WHEAT": TTLClass.DAILY,
+    "CORN": TTLClass.DAILY,
+    "COTTON": TTLClass.DAILY,
+    "SUGAR": TTLClass.DAILY,
+    "COFFEE": TTLClass.DAILY,
+    "ALL_COMMODITIES": TTLClass.DAILY,
+    "TREASURY_YIELD": TTLClass.DAILY,
+    "FEDERAL_FUNDS_RATE": TTLClass.DAILY,
+    # Fundamentals and monthly/quarterly economic releases
+    "OVERVIEW": TTLClass.FUNDAMENTALS,
+    "ETF_PROFILE": TTLClass.FUNDAMENTALS,
+    "DIVIDENDS": TTLClass.FUNDAMENTALS,
+    "SPLITS": TTLClass.FUNDAMENTALS,
+    "INCOME_STATEMENT": TTLClass.FUNDAMENTALS,
+    "BALANCE_SHEET": TTLClass.FUNDAMENTALS,
+    "CASH_FLOW": TTLClass.FUNDAMENTALS,
+    "EARNINGS": TTLClass.FUNDAMENTALS,
+    "SYMBOL_SEARCH": TTLClass.FUNDAMENTALS,
+    "REAL_GDP": TTLClass.FUNDAMENTALS,
+    "REAL_GDP_PER_CAPITA": TTLClass.FUNDAMENTALS,
+    "CPI": TTLClass.FUNDAMENTALS,
+    "INFLATION": TTLClass.FUNDAMENTALS,
+    "RETAIL_SALES": TTLClass.FUNDAMENTALS,
+    "DURABLES": TTLClass.FUNDAMENTALS,
+    "UNEMPLOYMENT": TTLClass.FUNDAMENTALS,
+    "NONFARM_PAYROLL": TTLClass.FUNDAMENTALS,
+    # Never changes once published
+    "EARNINGS_CALL_TRANSCRIPT": TTLClass.IMMUTABLE,
+}
+
+# Technical indicators follow the class of the series they are computed from.
+INDICATOR_FUNCTIONS = {
+    "SMA", "EMA", "WMA", "DEMA", "TEMA", "TRIMA", "KAMA", "MAMA", "VWAP", "T3",
+    "MACD", "MACDEXT", "STOCH", "STOCHF", "RSI", "STOCHRSI", "WILLR", "ADX",
+    "ADXR", "APO", "PPO", "MOM", "BOP", "CCI", "CMO", "ROC", "ROCR", "AROON",
+    "AROONOSC", "MFI", "TRIX", "ULTOSC", "DX", "MINUS_DI", "PLUS_DI",
+    "MINUS_DM", "PLUS_DM", "BBANDS", "MIDPOINT", "MIDPRICE", "SAR", "TRANGE",
+    "ATR", "NATR", "AD", "ADOSC", "OBV", "HT_TRENDLINE", "HT_SINE",
+    "HT_TRENDMODE", "HT_DCPERIOD", "HT_DCPHASE", "HT_PHASOR",
+}  # fmt: skip
+
+
+def ttl_class(https_params: dict) -> TTLClass | None:
+    """
+    Look up the freshness class of a request.
+
+    :argument: https_params (dict): The query parameters, including the function.
+
+    :returns: The TTL class, or None if responses of this function are not cached.
+    """
+
+    function = https_params.get("function")
+    month = https_params.get("month")
+    if month and month < datetime.now(MARKET_TIMEZONE).strftime("%Y-%m"):
+        return TTLClass.IMMUTABLE
+
+    if function in INDICATOR_FUNCTIONS:
+        if https_params.get("interval") in INTRADAY_INTERVALS:
+            return TTLClass.INTRADAY
+        return TTLClass.DAILY
+
+    if function == "HISTORICAL_OPTIONS":
+        day = https_params.get("date")
+        if day and day < datetime.now(MARKET_TIMEZONE).strftime("%Y-%m-%d"):
+            return TTLClass.IMMUTABLE
+
+    return TTL_POLICY.get(function)
+
+
+def seconds_until_next_close(now: datetime | None = None) -> float:
+    """
+    :argument: now (datetime): The current time (default: now).
+
+    :returns: The seconds until the next weekday market close (plus a settling delay).
+    """
+
+    now = (now or datetime.now(MARKET_TIMEZONE)).astimezone(MARKET_TIMEZONE)
+    close = datetime.combine(now.date(), MARKET_CLOSE, MARKET_TIMEZONE)
+    day: date = now.date()
+    while close <= now or day.weekday() >= 5:
+        day += timedelta(days=1)
+        close = datetime.combine(day, MARKET_CLOSE, MARKET_TIMEZONE)
+    return (close - now).total_seconds()
+
+
+def ttl_seconds(cls: TTLClass) -> float:
+    """
+    :argument: cls (TTLClass): The freshness class.
+
+    :returns: How long a response of that class stays fresh, in seconds.
+    """
+
+    if cls == TTLClass.DAILY:
+        return seconds_until_next_close()
+    return TTL_SECONDS[cls]
+
+
+def is_cacheable(result: Any) -> bool:
+    """
+    :argument: result (Any): A decoded API response.
+
+    :returns: False for error, premium-only and throttle messages, which must not be cached.
+    """
+
+    if isinstance(result, dict):
+        return bool(result) and not set(result) <= {
+            "Error Message",
+            "Information",
+            "Note",
+        }
+    return bool(result)
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    size: int
+    expires_at: float
+
+
+class ResponseCache:
+    """
+    In-process LRU cache of API responses, bounded by the total response size in
+    bytes, where each entry expires after its own TTL.
+    """
+
+    def __init__(self, max_bytes: int, name: str = "cache"):
+        self.max_bytes = max_bytes
+        self.name = name
+        self.size = 0
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        :argument: key (Hashable): The request key.
+
+        :returns: The cached value, or None if it is missing or expired.
+        """
+
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            metrics.increment(f"{self.name}.misses")
+            return None
+        self._entries.move_to_end(key)
+        metrics.increment(f"{self.name}.hits")
+        return entry.value
+
+    def get_stale(self, key: Hashable, max_stale: float) -> tuple[Any, float] | None:
+        """
+        Look up an entry that has expired, as long as it expired at most `max_stale` seconds ago.
+
+        :argument: key (Hashable): The request key.
+        :argument: max_stale (float): The oldest expiry that may still be served, in seconds.
+
+        :returns: The cached value and the seconds since it expired, or None.
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stale = time.monotonic() - entry.expires_at
+        if stale > max_stale:
+            return None
+        self._entries.move_to_end(key)
+        metrics.increment(f"{self.name}.stale_hits")
+        return entry.value, max(stale, 0.0)
+
+    def set(self, key: Hashable, value: Any, ttl: float, size: int) -> None:
+        """
+        Store a value, evicting the least recently used entries to stay within max_bytes.
+
+        :argument: key (Hashable): The request key.
+        :argument: value (Any): The decoded response; callers must treat it as read-only.
+        :argument: ttl (float): Seconds until the entry expires (inf never expires).
+        :argument: size (int): The response size in bytes.
+        """
+
+        self.delete(key)
+        if size > self.max_bytes or ttl <= 0:
+            return
+        self._entries[key] = CacheEntry(value, size, time.monotonic() + ttl)
+        self.size += size
+        self._evict()
+
+    def resize(self, key: Hashable, size: int) -> None:
+        """
+        Update the size of an entry whose value grew or shrank in place, evicting
+        the least recently used entries to stay within max_bytes.
+
+        :argument: key (Hashable): The request key.
+        :argument: size (int): The new size of the entry in bytes.
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        if size > self.max_bytes:
+            self.delete(key)
+            return
+        self.size += size - entry.size
+        entry.size = size
+        self._evict()
+
+    def _evict(self) -> None:
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted.size
+            metrics.increment(f"{self.name}.evictions")
+
+    def peek(self, key: Hashable) -> Any | None:
+        """
+        :argument: key (Hashable): The request key.
+
+        :returns: The cached value, expired or not, without counting a hit or refreshing its recency.
+        """
+
+        entry = self._entries.get(key)
+        return None if entry is None else entry.value
+
+    def delete(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        :returns: The entry count, size and hit rate of the cache.
+        """
+
+        hits = metrics.get(f"{self.name}.hits")
+        misses = metrics.get(f"{self.name}.misses")
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "stale_hits": metrics.get(f"{self.name}.stale_hits"),
+        }
+
+
+def mark_stale(value: dict, stale_seconds: float) -> dict:
+    """
+    Annotate a response served past its expiry while a fresh copy is being fetched.
+
+    :argument: value (dict): The cached response (left unmodified).
+    :argument: stale_seconds (float): The seconds since the response expired.
+
+    :returns: A shallow copy of the response with a "_stale" marker.
+    """
+
+    return {
+        **value,
+        "_stale": {"stale_seconds": round(stale_seconds, 3), "revalidating": True},
+    }
@@ -0,0 +1,167 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from alphavantage_mcp_server import metrics
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    content BLOB NOT NULL,
+    text INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+@dataclass
+class DiskEntry:
+    value: Any
+    size: int
+    ttl: float
+
+
+class DiskCache:
+    """
+    Response cache stored in a single SQLite file, so that it survives restarts and
+    is shared by every server process on the host.
+
+    Responses are stored as zlib-compressed bodies with an absolute (wall clock)
+    expiry. The database runs in WAL mode so readers in other processes are not
+    blocked by writers. When the uncompressed size of all responses exceeds
+    `max_bytes`, the least recently read ones are deleted.
+
+    Methods block on SQLite; call them from a worker thread (asyncio.to_thread).
+    """
+
+    def __init__(self, path: str, max_bytes: int, name: str = "disk_cache"):
+        self.path = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        self.name = name
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    @staticmethod
+    def _key(key: Hashable) -> str:
+        return json.dumps(key)
+
+    def get(self, key: Hashable) -> DiskEntry | None:
+        """
+        :argument: key (Hashable): The request key.
+
+        :returns: The decoded response with its remaining TTL, or None if missing or expired.
+        """
+
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, text, size, expires_at FROM responses "
+                "WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (self._key(key), now),
+            ).fetchone()
+            if row is None:
+                metrics.increment(f"{self.name}.misses")
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                (now, self._key(key)),
+            )
+
+        metrics.increment(f"{self.name}.hits")
+        content, text, size, expires_at = row
+        body = zlib.decompress(content)
+        value = body.decode() if text else json.loads(body)
+        ttl = float("inf") if expires_at is None else expires_at - now
+        return DiskEntry(value, size, ttl)
+
+    def set(self, key: Hashable, content: bytes, text: bool, ttl: float) -> None:
+        """
+        Store a response body, evicting the least recently read responses to stay within max_bytes.
+
+        :argument: key (Hashable): The request key.
+        :argument: content (bytes): The raw response body.
+        :argument: text (bool): Whether the body is returned as text rather than decoded JSON.
+        :argument: ttl (float): Seconds until the entry expires (inf never expires).
+        """
+
+        if len(content) > self.max_bytes or ttl <= 0:
+            return
+        now = time.time()
+        expires_at = None if ttl == float("inf") else now + ttl
+        compressed = zlib.compress(content)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, content, text, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (self._key(key), compressed, int(text), len(content), expires_at, now),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        self._conn.execute(
+            "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (time.time(),),
+        )
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        metrics.increment(f"{self.name}.evictions", len(evicted))
+
+    def stats(self) -> dict[str, Any]:
+        """
+        :returns: The entry count, size and hit rate of the cache.
+        """
+
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        hits = metrics.get(f"{self.name}.hits")
+        misses = metrics.get(f"{self.name}.misses")
+        return {
+            "path": self.path,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,90 @@
+import csv
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+
+from alphavantage_mcp_server.slicing import END_OF_DAY
+
+
+class EarningsCalendar:
+    """
+    A parsed EARNINGS_CALENDAR response, indexed by symbol and report date.
+
+    The unfiltered calendar of a horizon lists every company, so one instance
+    answers the queries for any set of symbols and dates. Answers are CSV in the
+    layout of the remote endpoint, made of the original lines of the response.
+    """
+
+    def __init__(self, text: str):
+        lines = text.splitlines()
+        if not lines:
+            raise ValueError("Empty earnings calendar")
+        self.header = lines[0]
+        columns = next(csv.reader([self.header]))
+        if "symbol" not in columns or "reportDate" not in columns:
+            raise ValueError(f"Not an earnings calendar: {self.header[:200]}")
+        symbol, report_date = columns.index("symbol"), columns.index("reportDate")
+
+        rows = [
+            (line, row) for line, row in zip(lines[1:], csv.reader(lines[1:])) if row
+        ]
+        self.lines = [line for line, _ in rows]
+        self._symbols = defaultdict(list)
+        for i, (_, row) in enumerate(rows):
+            self._symbols[row[symbol].upper()].append(i)
+        order = sorted(range(len(rows)), key=lambda i: rows[i][1][report_date])
+        self._dates = [rows[i][1][report_date] for i in order]
+        self._by_date = order
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def rows(
+        self,
+        symbols: list[str] | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> list[int]:
+        """
+        :argument: symbols (list[str]): Only these symbols (default: None, every symbol).
+        :argument: start_date (str): The first report date, YYYY-MM-DD or YYYY-MM (default: None).
+        :argument: end_date (str): The last report date, inclusive (default: None).
+
+        :returns: The positions of the matching lines in the response, in response order.
+        """
+
+        selected = None
+        if symbols is not None:
+            selected = {
+                i for symbol in symbols for i in self._symbols.get(symbol.upper(), ())
+            }
+        if start_date is not None or end_date is not None:
+            lo = bisect_left(self._dates, start_date) if start_date else 0
+            hi = (
+                bisect_right(self._dates, end_date + END_OF_DAY)
+                if end_date
+                else len(self._dates)
+            )
+            window = set(self._by_date[lo:hi])
+            selected = window if selected is None else selected & window
+        return (
+            sorted(selected) if selected is not None else list(range(len(self.lines)))
+        )
+
+    def query(
+        self,
+        symbols: list[str] | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> str:
+        """
+        :argument: symbols (list[str]): Only these symbols (default: None, every symbol).
+        :argument: start_date (str): The first report date, YYYY-MM-DD or YYYY-MM (default: None).
+        :argument: end_date (str): The last report date, inclusive (default: None).
+
+        :returns: The matching entries using CSV format, with the header of the response.
+        """
+
+        lines = [self.header] + [
+            self.lines[i] for i in self.rows(symbols, start_date, end_date)
+        ]
+        return "\r\n".join(lines) + "\r\n"
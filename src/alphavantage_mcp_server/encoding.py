@@ -0,0 +1,135 @@
+import json
+import math
+from enum import Enum
+from typing import Any
+
+from alphavantage_mcp_server.store import FIELD_PREFIX, SeriesFrame
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - the orjson extra is optional
+    orjson = None
+
+
+class OutputFormat(str, Enum):
+    COMPACT = "compact"
+    PRETTY = "pretty"
+    COLUMNAR = "columnar"
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, SeriesFrame):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _compact(result: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(result, default=_default).decode()
+        except TypeError:
+            # Non-string keys or integers beyond 64 bits; the json module handles both.
+            pass
+    return json.dumps(
+        result, separators=(",", ":"), ensure_ascii=False, default=_default
+    )
+
+
+def _number(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+    if not math.isfinite(number):
+        return value
+    return (
+        int(number) if number.is_integer() and value.lstrip("-").isdigit() else number
+    )
+
+
+def is_series(value: Any) -> bool:
+    """
+    :argument: value (Any): A value of an API response.
+
+    :returns: Whether the value is a series, a mapping of dates to rows of scalar fields.
+    """
+
+    if isinstance(value, SeriesFrame):
+        return True
+    return (
+        isinstance(value, dict)
+        and bool(value)
+        and all(
+            isinstance(row, dict)
+            and not any(isinstance(v, (dict, list)) for v in row.values())
+            for row in value.values()
+        )
+    )
+
+
+def to_columns(series: dict[str, dict] | SeriesFrame) -> dict[str, list]:
+    """
+    Transpose a series into columns, keeping the order of its dates.
+
+    Numbered field names lose their prefix ("1. open" becomes "open") and numeric
+    strings become numbers. Fields missing from a row are null.
+
+    :argument: series (dict[str, dict] | SeriesFrame): A mapping of dates to rows.
+
+    :returns: {"dates": [...], "<field>": [...], ...}
+    """
+
+    if isinstance(series, SeriesFrame):
+        columns = {"dates": series.dates[::-1]}
+        for field, values in series.columns.items():
+            columns[FIELD_PREFIX.sub("", field)] = values[::-1].tolist()
+        return columns
+
+    fields = dict.fromkeys(field for row in series.values() for field in row)
+    columns = {"dates": list(series)}
+    for field in fields:
+        columns[FIELD_PREFIX.sub("", field)] = [
+            _number(row.get(field)) for row in series.values()
+        ]
+    return columns
+
+
+def columnar(result: Any) -> Any:
+    """
+    :argument: result (Any): A tool result.
+
+    :returns: The result with every series (at any depth) replaced by its columns.
+    """
+
+    if isinstance(result, list):
+        return [columnar(value) for value in result]
+    if not isinstance(result, dict):
+        return result
+    return {
+        key: to_columns(value) if is_series(value) else columnar(value)
+        for key, value in result.items()
+    }
+
+
+def encode(result: Any, output_format: OutputFormat = OutputFormat.COMPACT) -> str:
+    """
+    Serialize a tool result for the MCP response.
+
+    Text results (the CSV endpoints) are passed through as they are instead of
+    being escaped into a JSON string.
+
+    :argument: result (Any): The tool result.
+    :argument: output_format (OutputFormat): compact JSON, indented JSON, or compact JSON with series in columns (default: compact).
+
+    :returns: The response text.
+    """
+
+    if isinstance(result, str):
+        return result
+    if output_format is OutputFormat.PRETTY:
+        return json.dumps(result, indent=2, default=_default)
+    if output_format is OutputFormat.COLUMNAR:
+        result = columnar(result)
+    return _compact(result)
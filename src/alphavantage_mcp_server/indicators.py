@@ -0,0 +1,866 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from alphavantage_mcp_server.cache import INTRADAY_INTERVALS
+from alphavantage_mcp_server.store import SeriesFrame
+
+PRICE_FIELDS = ("open", "high", "low", "close", "volume")
+SERIES_TYPES = ("open", "high", "low", "close")
+INTERVALS = INTRADAY_INTERVALS | {"daily", "weekly", "monthly"}
+
+# TA-Lib moving average types, as accepted by the *matype parameters.
+MA_TYPES = {0: "sma", 1: "ema", 2: "wma", 3: "dema", 4: "tema", 5: "trima", 6: "t3"}
+
+# Volume factor Alpha Vantage uses for T3.
+T3_VFACTOR = 0.7
+
+
+class UnsupportedIndicator(ValueError):
+    """The request cannot be computed locally and has to be sent to the API."""
+
+
+@dataclass
+class OHLCV:
+    """A price series in ascending time order, one array per field."""
+
+    dates: list[str]
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+
+def parse_ohlcv(payload: dict) -> OHLCV:
+    """
+    Parse a TIME_SERIES_* response into arrays.
+
+    Series already held as a SeriesFrame are used without parsing.
+
+    :argument: payload (dict): The decoded time series response.
+
+    :returns: The series in ascending time order.
+    """
+
+    series = next(
+        (
+            value
+            for key, value in payload.items()
+            if "Time Series" in key and isinstance(value, (dict, SeriesFrame))
+        ),
+        None,
+    )
+    if not series:
+        message = (
+            payload.get("Error Message")
+            or payload.get("Information")
+            or "no time series"
+        )
+        raise ValueError(f"Cannot parse price series: {message}")
+
+    if isinstance(series, SeriesFrame):
+        try:
+            columns = {
+                field: series.column(field).astype(float) for field in PRICE_FIELDS
+            }
+        except KeyError as e:
+            raise ValueError(
+                f"Cannot parse price series: missing {e.args[0]}"
+            ) from None
+        return OHLCV(series.dates, **columns)
+
+    dates = sorted(series)
+    columns = {}
+    for field in PRICE_FIELDS:
+        # Field names are numbered ("1. open"); adjusted series renumber volume.
+        name = next(
+            (k for k in series[dates[0]] if k.split(". ", 1)[-1] == field), None
+        )
+        if name is None:
+            raise ValueError(f"Cannot parse price series: missing {field}")
+        columns[field] = np.array([series[d][name] for d in dates], dtype=float)
+    return OHLCV(dates, **columns)
+
+
+def _pad(values: np.ndarray, length: int) -> np.ndarray:
+    out = np.full(length, np.nan)
+    if len(values):
+        out[length - len(values) :] = values
+    return out
+
+
+def _first_valid(x: np.ndarray) -> int:
+    valid = np.flatnonzero(~np.isnan(x))
+    return int(valid[0]) if len(valid) else len(x)
+
+
+def _recurrence(x: np.ndarray, alpha: float, beta: float, y0: float) -> np.ndarray:
+    """
+    Vectorized first-order filter y[i] = alpha * y[i-1] + beta * x[i], with y[-1] = y0.
+
+    Uses the closed form y[i] = alpha^(i+1) * (y0 + sum(beta * x[j] / alpha^(j+1))),
+    evaluated in blocks short enough for alpha^-block to stay within float range.
+    """
+
+    if alpha == 0:
+        return beta * x
+    out = np.empty(len(x))
+    block = max(1, int(150 * np.log(10) / -np.log(alpha))) if alpha < 1 else len(x) or 1
+    for start in range(0, len(x), block):
+        chunk = x[start : start + block]
+        powers = alpha ** np.arange(1, len(chunk) + 1)
+        out[start : start + len(chunk)] = powers * (
+            y0 + np.cumsum(beta * chunk / powers)
+        )
+        y0 = out[start + len(chunk) - 1]
+    return out
+
+
+def rolling(x: np.ndarray, period: int, reduce: Callable) -> np.ndarray:
+    """
+    :argument: x (np.ndarray): The input series.
+    :argument: period (int): The window length.
+    :argument: reduce (Callable): A numpy reduction taking an `axis` argument, e.g. np.max.
+
+    :returns: The reduction over each trailing window, NaN until the first full window.
+    """
+
+    if period < 1 or len(x) < period:
+        return np.full(len(x), np.nan)
+    return _pad(reduce(sliding_window_view(x, period), axis=-1), len(x))
+
+
+def sma(x: np.ndarray, period: int) -> np.ndarray:
+    return rolling(x, period, np.mean)
+
+
+def wma(x: np.ndarray, period: int) -> np.ndarray:
+    weights = np.arange(1, period + 1, dtype=float)
+    if len(x) < period:
+        return np.full(len(x), np.nan)
+    return _pad(sliding_window_view(x, period) @ weights / weights.sum(), len(x))
+
+
+def smoothed(
+    x: np.ndarray, period: int, alpha: float, beta: float, seed: Callable
+) -> np.ndarray:
+    """
+    Recursive smoothing seeded with `seed` of the first `period` valid values.
+    """
+
+    out = np.full(len(x), np.nan)
+    start = _first_valid(x)
+    if len(x) - start < period:
+        return out
+    seed_at = start + period - 1
+    out[seed_at] = seed(x[start : seed_at + 1])
+    out[seed_at + 1 :] = _recurrence(x[seed_at + 1 :], alpha, beta, out[seed_at])
+    return out
+
+
+def ema(x: np.ndarray, period: int) -> np.ndarray:
+    k = 2 / (period + 1)
+    return smoothed(x, period, 1 - k, k, np.mean)
+
+
+def wilder(x: np.ndarray, period: int) -> np.ndarray:
+    """Wilder's moving average, as used by RSI and ATR."""
+    return smoothed(x, period, 1 - 1 / period, 1 / period, np.mean)
+
+
+def wilder_sum(x: np.ndarray, period: int) -> np.ndarray:
+    """Wilder's running sum, as used by the directional movement indicators."""
+    return smoothed(x, period, 1 - 1 / period, 1.0, np.sum)
+
+
+def _shift(x: np.ndarray, periods: int = 1) -> np.ndarray:
+    out = np.full(len(x), np.nan)
+    if periods < len(x):
+        out[periods:] = x[: len(x) - periods]
+    return out
+
+
+def _divide(
+    numerator: np.ndarray, denominator: np.ndarray, fill: float = 0.0
+) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator == 0, fill, numerator / denominator)
+
+
+class IndicatorContext:
+    """
+    Computes indicators over one price series, memoizing intermediate results.
+
+    Intermediates are addressed by key tuples, e.g. ctx["ma", "close", 12, 1] is
+    the 12 period EMA of the close, and ctx["true_range"] the true range. The
+    first element names a `_<op>` method, the rest are its arguments; a source
+    argument is either a price field or another key. Keys without arguments may
+    be given as plain strings. Indicators computed over the
+    same context share intermediates, so MACD(12, 26) reuses EMA(12) and EMA(26),
+    and ATR, NATR, DX and ADX share the true range.
+    """
+
+    def __init__(self, series: OHLCV):
+        self.series = series
+        self._memo: dict[tuple, np.ndarray] = {}
+
+    def __getitem__(self, key: str | tuple) -> np.ndarray:
+        if key in PRICE_FIELDS:
+            return getattr(self.series, key)
+        if isinstance(key, str):
+            key = (key,)
+        if key not in self._memo:
+            op, *args = key
+            self._memo[key] = getattr(self, f"_{op}")(*args)
+        return self._memo[key]
+
+    def __len__(self) -> int:
+        return len(self._memo)
+
+    def _ma(self, source, period: int, matype: int = 0) -> np.ndarray:
+        x = self[source]
+        kind = MA_TYPES.get(matype)
+        if kind == "sma":
+            return sma(x, period)
+        if kind == "ema":
+            return ema(x, period)
+        if kind == "wma":
+            return wma(x, period)
+        if kind == "dema":
+            e1 = ("ma", source, period, 1)
+            return 2 * self[e1] - self["ma", e1, period, 1]
+        if kind == "tema":
+            e1 = ("ma", source, period, 1)
+            e2 = ("ma", e1, period, 1)
+            return 3 * self[e1] - 3 * self[e2] + self["ma", e2, period, 1]
+        if kind == "trima":
+            inner = (period + 1) // 2 if period % 2 else period // 2 + 1
+            outer = (period + 1) // 2 if period % 2 else period // 2
+            return sma(sma(x, outer), inner)
+        if kind == "t3":
+            v = T3_VFACTOR
+            e1 = ("ma", source, period, 1)
+            e2 = ("ma", e1, period, 1)
+            e3 = ("ma", e2, period, 1)
+            e4 = ("ma", e3, period, 1)
+            e5 = ("ma", e4, period, 1)
+            e6 = ("ma", e5, period, 1)
+            c1, c2, c3, c4 = (
+                -(v**3),
+                3 * v**2 + 3 * v**3,
+                -6 * v**2 - 3 * v - 3 * v**3,
+                1 + 3 * v + v**3 + 3 * v**2,
+            )
+            return c1 * self[e6] + c2 * self[e5] + c3 * self[e4] + c4 * self[e3]
+        raise UnsupportedIndicator(f"Unsupported moving average type: {matype}")
+
+    def _rolling_max(self, source, period: int) -> np.ndarray:
+        return rolling(self[source], period, np.max)
+
+    def _rolling_min(self, source, period: int) -> np.ndarray:
+        return rolling(self[source], period, np.min)
+
+    def _rolling_std(self, source, period: int) -> np.ndarray:
+        return rolling(self[source], period, np.std)
+
+    def _change(self, source, periods: int = 1) -> np.ndarray:
+        x = self[source]
+        return x - _shift(x, periods)
+
+    def _rsi(self, source, period: int) -> np.ndarray:
+        change = self["change", source, 1]
+        gain = wilder(np.where(change > 0, change, 0.0)[1:], period)
+        loss = wilder(np.where(change < 0, -change, 0.0)[1:], period)
+        return _pad(100 * _divide(gain, gain + loss, np.nan), len(change))
+
+    def _true_range(self) -> np.ndarray:
+        high, low = self.series.high, self.series.low
+        previous = _shift(self.series.close)
+        tr = np.fmax(
+            high - low, np.fmax(np.abs(high - previous), np.abs(low - previous))
+        )
+        tr[0] = np.nan
+        return tr
+
+    def _atr(self, period: int) -> np.ndarray:
+        return wilder(self["true_range"], period)
+
+    def _dm(self, direction: str) -> np.ndarray:
+        up = self["change", "high", 1]
+        down = -self["change", "low", 1]
+        if direction == "plus":
+            return np.where(
+                (up > down) & (up > 0), up, np.where(np.isnan(up), np.nan, 0.0)
+            )
+        return np.where(
+            (down > up) & (down > 0), down, np.where(np.isnan(down), np.nan, 0.0)
+        )
+
+    def _di(self, direction: str, period: int) -> np.ndarray:
+        dm = wilder_sum(self["dm", direction], period)
+        tr = wilder_sum(self["true_range"], period)
+        return 100 * _divide(dm, tr, np.nan)
+
+    def _dx(self, period: int) -> np.ndarray:
+        plus, minus = self["di", "plus", period], self["di", "minus", period]
+        return 100 * _divide(np.abs(plus - minus), plus + minus)
+
+    def _adx(self, period: int) -> np.ndarray:
+        return wilder(self["dx", period], period)
+
+    def _typical_price(self) -> np.ndarray:
+        return (self.series.high + self.series.low + self.series.close) / 3
+
+    def _ad(self) -> np.ndarray:
+        s = self.series
+        clv = _divide((s.close - s.low) - (s.high - s.close), s.high - s.low)
+        return np.cumsum(clv * s.volume)
+
+    def _stoch_k(self, source_high, source_low, source, period: int) -> np.ndarray:
+        highest = self["rolling_max", source_high, period]
+        lowest = self["rolling_min", source_low, period]
+        return 100 * _divide(self[source] - lowest, highest - lowest)
+
+
+@dataclass
+class Indicator:
+    """How to compute one Alpha Vantage indicator function locally."""
+
+    name: str
+    outputs: tuple[str, ...]
+    params: dict[str, type]
+    defaults: dict[str, object]
+    compute: Callable[[IndicatorContext, dict], tuple[np.ndarray, ...]]
+
+
+def _fixed_ma(matype: int):
+    def compute(ctx: IndicatorContext, p: dict):
+        return (ctx["ma", p["series_type"], p["time_period"], matype],)
+
+    return compute
+
+
+def _macd(ctx: IndicatorContext, p: dict):
+    src = p["series_type"]
+    macd = ctx["ma", src, p["fastperiod"], 1] - ctx["ma", src, p["slowperiod"], 1]
+    signal = ema(macd, p["signalperiod"])
+    return macd, macd - signal, signal
+
+
+def _apo(ctx: IndicatorContext, p: dict):
+    src, matype = p["series_type"], p["matype"]
+    return (
+        ctx["ma", src, p["fastperiod"], matype]
+        - ctx["ma", src, p["slowperiod"], matype],
+    )
+
+
+def _ppo(ctx: IndicatorContext, p: dict):
+    src, matype = p["series_type"], p["matype"]
+    fast, slow = (
+        ctx["ma", src, p["fastperiod"], matype],
+        ctx["ma", src, p["slowperiod"], matype],
+    )
+    return (100 * _divide(fast - slow, slow, np.nan),)
+
+
+def _bbands(ctx: IndicatorContext, p: dict):
+    src, period = p["series_type"], p["time_period"]
+    middle = ctx["ma", src, period, p["matype"]]
+    std = ctx["rolling_std", src, period]
+    return middle + p["nbdevup"] * std, middle, middle - p["nbdevdn"] * std
+
+
+def _rsi(ctx: IndicatorContext, p: dict):
+    return (ctx["rsi", p["series_type"], p["time_period"]],)
+
+
+def _stochrsi(ctx: IndicatorContext, p: dict):
+    rsi = ("rsi", p["series_type"], p["time_period"])
+    fastk = ("stoch_k", rsi, rsi, rsi, p["fastkperiod"])
+    return ctx[fastk], ctx["ma", fastk, p["fastdperiod"], p["fastdmatype"]]
+
+
+def _stoch(ctx: IndicatorContext, p: dict):
+    fastk = ("stoch_k", "high", "low", "close", p["fastkperiod"])
+    slowk = ("ma", fastk, p["slowkperiod"], p["slowkmatype"])
+    return ctx[slowk], ctx["ma", slowk, p["slowdperiod"], p["slowdmatype"]]
+
+
+def _stochf(ctx: IndicatorContext, p: dict):
+    fastk = ("stoch_k", "high", "low", "close", p["fastkperiod"])
+    return ctx[fastk], ctx["ma", fastk, p["fastdperiod"], p["fastdmatype"]]
+
+
+def _willr(ctx: IndicatorContext, p: dict):
+    return (ctx["stoch_k", "high", "low", "close", p["time_period"]] - 100,)
+
+
+def _cci(ctx: IndicatorContext, p: dict):
+    period = p["time_period"]
+    tp = ctx["typical_price"]
+    mean = ctx["ma", "typical_price", period, 0]
+    if len(tp) < period:
+        return (mean,)
+    windows = sliding_window_view(tp, period)
+    deviation = _pad(np.abs(windows - mean[period - 1 :, None]).mean(axis=-1), len(tp))
+    return (_divide(tp - mean, 0.015 * deviation),)
+
+
+def _cmo(ctx: IndicatorContext, p: dict):
+    return (2 * ctx["rsi", p["series_type"], p["time_period"]] - 100,)
+
+
+def _mom(ctx: IndicatorContext, p: dict):
+    return (ctx["change", p["series_type"], p["time_period"]],)
+
+
+def _roc(ctx: IndicatorContext, p: dict):
+    x = ctx[p["series_type"]]
+    return (
+        100
+        * _divide(
+            ctx["change", p["series_type"], p["time_period"]],
+            _shift(x, p["time_period"]),
+            np.nan,
+        ),
+    )
+
+
+def _rocr(ctx: IndicatorContext, p: dict):
+    x = ctx[p["series_type"]]
+    return (_divide(x, _shift(x, p["time_period"]), np.nan),)
+
+
+def _trix(ctx: IndicatorContext, p: dict):
+    src, period = p["series_type"], p["time_period"]
+    e3 = ctx["ma", ("ma", ("ma", src, period, 1), period, 1), period, 1]
+    return (100 * _divide(e3 - _shift(e3), _shift(e3), np.nan),)
+
+
+def _midpoint(ctx: IndicatorContext, p: dict):
+    src, period = p["series_type"], p["time_period"]
+    return ((ctx["rolling_max", src, period] + ctx["rolling_min", src, period]) / 2,)
+
+
+def _midprice(ctx: IndicatorContext, p: dict):
+    period = p["time_period"]
+    return (
+        (ctx["rolling_max", "high", period] + ctx["rolling_min", "low", period]) / 2,
+    )
+
+
+def _aroon(ctx: IndicatorContext, p: dict):
+    period, s = p["time_period"], ctx.series
+    if len(s) <= period:
+        empty = np.full(len(s), np.nan)
+        return empty, empty
+    # Position of the most recent extreme within each window of period + 1 bars.
+    last = period
+    up = last - np.argmax(sliding_window_view(s.high, period + 1)[:, ::-1], axis=-1)
+    down = last - np.argmin(sliding_window_view(s.low, period + 1)[:, ::-1], axis=-1)
+    return _pad(100 * down / period, len(s)), _pad(100 * up / period, len(s))
+
+
+def _aroonosc(ctx: IndicatorContext, p: dict):
+    down, up = _aroon(ctx, p)
+    return (up - down,)
+
+
+def _mfi(ctx: IndicatorContext, p: dict):
+    period = p["time_period"]
+    tp = ctx["typical_price"]
+    flow = tp * ctx.series.volume
+    change = ctx["change", "typical_price", 1]
+    positive = rolling(np.where(change > 0, flow, 0.0), period, np.sum)
+    negative = rolling(np.where(change < 0, flow, 0.0), period, np.sum)
+    mfi = 100 * _divide(positive, positive + negative, np.nan)
+    mfi[:period] = np.nan
+    return (mfi,)
+
+
+def _adosc(ctx: IndicatorContext, p: dict):
+    return (ctx["ma", "ad", p["fastperiod"], 1] - ctx["ma", "ad", p["slowperiod"], 1],)
+
+
+def _bop(ctx: IndicatorContext, p: dict):
+    s = ctx.series
+    return (_divide(s.close - s.open, s.high - s.low),)
+
+
+def _obv(ctx: IndicatorContext, p: dict):
+    s = ctx.series
+    direction = np.sign(np.diff(s.close, prepend=np.nan))
+    direction[0] = 1
+    return (np.cumsum(direction * s.volume),)
+
+
+def _adxr(ctx: IndicatorContext, p: dict):
+    adx = ctx["adx", p["time_period"]]
+    return ((adx + _shift(adx, p["time_period"] - 1)) / 2,)
+
+
+def _ultosc(ctx: IndicatorContext, p: dict):
+    s = ctx.series
+    previous = _shift(s.close)
+    low = np.fmin(s.low, previous)
+    buying = s.close - low
+    true_range = np.fmax(s.high, previous) - low
+    buying[0] = true_range[0] = np.nan
+    averages = [
+        _divide(rolling(buying, n, np.sum), rolling(true_range, n, np.sum), np.nan)
+        for n in (p["timeperiod1"], p["timeperiod2"], p["timeperiod3"])
+    ]
+    return (100 * (4 * averages[0] + 2 * averages[1] + averages[2]) / 7,)
+
+
+_PRICE = {"time_period": int, "series_type": str}
+
+INDICATORS: dict[str, Indicator] = {
+    "SMA": Indicator("Simple Moving Average (SMA)", ("SMA",), _PRICE, {}, _fixed_ma(0)),
+    "EMA": Indicator(
+        "Exponential Moving Average (EMA)", ("EMA",), _PRICE, {}, _fixed_ma(1)
+    ),
+    "WMA": Indicator(
+        "Weighted Moving Average (WMA)", ("WMA",), _PRICE, {}, _fixed_ma(2)
+    ),
+    "DEMA": Indicator(
+        "Double Exponential Moving Average (DEMA)", ("DEMA",), _PRICE, {}, _fixed_ma(3)
+    ),
+    "TEMA": Indicator(
+        "Triple Exponential Moving Average (TEMA)", ("TEMA",), _PRICE, {}, _fixed_ma(4)
+    ),
+    "TRIMA": Indicator(
+        "Triangular Moving Average (TRIMA)", ("TRIMA",), _PRICE, {}, _fixed_ma(5)
+    ),
+    "T3": Indicator(
+        "Triple Exponential Moving Average (T3)",
+        ("T3",),
+        _PRICE,
+        {"vfactor": T3_VFACTOR},
+        _fixed_ma(6),
+    ),
+    "MACD": Indicator(
+        "Moving Average Convergence/Divergence (MACD)",
+        ("MACD", "MACD_Hist", "MACD_Signal"),
+        {"series_type": str, "fastperiod": int, "slowperiod": int, "signalperiod": int},
+        {"fastperiod": 12, "slowperiod": 26, "signalperiod": 9},
+        _macd,
+    ),
+    "RSI": Indicator("Relative Strength Index (RSI)", ("RSI",), _PRICE, {}, _rsi),
+    "STOCHRSI": Indicator(
+        "Stochastic Relative Strength Index (STOCHRSI)",
+        ("FastK", "FastD"),
+        {**_PRICE, "fastkperiod": int, "fastdperiod": int, "fastdmatype": int},
+        {"fastkperiod": 5, "fastdperiod": 3, "fastdmatype": 0},
+        _stochrsi,
+    ),
+    "STOCH": Indicator(
+        "Stochastic (STOCH)",
+        ("SlowK", "SlowD"),
+        {
+            "fastkperiod": int,
+            "slowkperiod": int,
+            "slowdperiod": int,
+            "slowkmatype": int,
+            "slowdmatype": int,
+        },
+        {
+            "fastkperiod": 5,
+            "slowkperiod": 3,
+            "slowdperiod": 3,
+            "slowkmatype": 0,
+            "slowdmatype": 0,
+        },
+        _stoch,
+    ),
+    "STOCHF": Indicator(
+        "Stochastic Fast (STOCHF)",
+        ("FastK", "FastD"),
+        {"fastkperiod": int, "fastdperiod": int, "fastdmatype": int},
+        {"fastkperiod": 5, "fastdperiod": 3, "fastdmatype": 0},
+        _stochf,
+    ),
+    "WILLR": Indicator(
+        "Williams' %R (WILLR)", ("WILLR",), {"time_period": int}, {}, _willr
+    ),
+    "ADX": Indicator(
+        "Average Directional Movement Index (ADX)",
+        ("ADX",),
+        {"time_period": int},
+        {},
+        lambda ctx, p: (ctx["adx", p["time_period"]],),
+    ),
+    "ADXR": Indicator(
+        "Average Directional Movement Index Rating (ADXR)",
+        ("ADXR",),
+        {"time_period": int},
+        {},
+        _adxr,
+    ),
+    "APO": Indicator(
+        "Absolute Price Oscillator (APO)",
+        ("APO",),
+        {"series_type": str, "fastperiod": int, "slowperiod": int, "matype": int},
+        {"fastperiod": 12, "slowperiod": 26, "matype": 0},
+        _apo,
+    ),
+    "PPO": Indicator(
+        "Percentage Price Oscillator (PPO)",
+        ("PPO",),
+        {"series_type": str, "fastperiod": int, "slowperiod": int, "matype": int},
+        {"fastperiod": 12, "slowperiod": 26, "matype": 0},
+        _ppo,
+    ),
+    "MOM": Indicator("Momentum (MOM)", ("MOM",), _PRICE, {}, _mom),
+    "BOP": Indicator("Balance Of Power (BOP)", ("BOP",), {}, {}, _bop),
+    "CCI": Indicator(
+        "Commodity Channel Index (CCI)", ("CCI",), {"time_period": int}, {}, _cci
+    ),
+    "CMO": Indicator("Chande Momentum Oscillator (CMO)", ("CMO",), _PRICE, {}, _cmo),
+    "ROC": Indicator(
+        "Rate of change : ((price/prevPrice)-1)*100", ("ROC",), _PRICE, {}, _roc
+    ),
+    "ROCR": Indicator(
+        "Rate of change ratio: (price/prevPrice)", ("ROCR",), _PRICE, {}, _rocr
+    ),
+    "AROON": Indicator(
+        "Aroon (AROON)", ("Aroon Down", "Aroon Up"), {"time_period": int}, {}, _aroon
+    ),
+    "AROONOSC": Indicator(
+        "Aroon Oscillator (AROONOSC)",
+        ("AROONOSC",),
+        {"time_period": int},
+        {},
+        _aroonosc,
+    ),
+    "MFI": Indicator(
+        "Money Flow Index (MFI)", ("MFI",), {"time_period": int}, {}, _mfi
+    ),
+    "TRIX": Indicator(
+        "1-day Rate-Of-Change (ROC) of a Triple Smooth EMA (TRIX)",
+        ("TRIX",),
+        _PRICE,
+        {},
+        _trix,
+    ),
+    "ULTOSC": Indicator(
+        "Ultimate Oscillator (ULTOSC)",
+        ("ULTOSC",),
+        {"timeperiod1": int, "timeperiod2": int, "timeperiod3": int},
+        {"timeperiod1": 7, "timeperiod2": 14, "timeperiod3": 28},
+        _ultosc,
+    ),
+    "DX": Indicator(
+        "Directional Movement Index (DX)",
+        ("DX",),
+        {"time_period": int},
+        {},
+        lambda ctx, p: (ctx["dx", p["time_period"]],),
+    ),
+    "MINUS_DI": Indicator(
+        "Minus Directional Indicator (MINUS_DI)",
+        ("MINUS_DI",),
+        {"time_period": int},
+        {},
+        lambda ctx, p: (ctx["di", "minus", p["time_period"]],),
+    ),
+    "PLUS_DI": Indicator(
+        "Plus Directional Indicator (PLUS_DI)",
+        ("PLUS_DI",),
+        {"time_period": int},
+        {},
+        lambda ctx, p: (ctx["di", "plus", p["time_period"]],),
+    ),
+    "MINUS_DM": Indicator(
+        "Minus Directional Movement (MINUS_DM)",
+        ("MINUS_DM",),
+        {"time_period": int},
+        {},
+        lambda ctx, p: (wilder_sum(ctx["dm", "minus"], p["time_period"]),),
+    ),
+    "PLUS_DM": Indicator(
+        "Plus Directional Movement (PLUS_DM)",
+        ("PLUS_DM",),
+        {"time_period": int},
+        {},
+        lambda ctx, p: (wilder_sum(ctx["dm", "plus"], p["time_period"]),),
+    ),
+    "BBANDS": Indicator(
+        "Bollinger Bands (BBANDS)",
+        ("Real Upper Band", "Real Middle Band", "Real Lower Band"),
+        {**_PRICE, "nbdevup": float, "nbdevdn": float, "matype": int},
+        {"nbdevup": 2, "nbdevdn": 2, "matype": 0},
+        _bbands,
+    ),
+    "MIDPOINT": Indicator(
+        "MidPoint over period (MIDPOINT)", ("MIDPOINT",), _PRICE, {}, _midpoint
+    ),
+    "MIDPRICE": Indicator(
+        "Midpoint Price over period (MIDPRICE)",
+        ("MIDPRICE",),
+        {"time_period": int},
+        {},
+        _midprice,
+    ),
+    "TRANGE": Indicator(
+        "True Range (TRANGE)", ("TRANGE",), {}, {}, lambda ctx, p: (ctx["true_range"],)
+    ),
+    "ATR": Indicator(
+        "Average True Range (ATR)",
+        ("ATR",),
+        {"time_period": int},
+        {},
+        lambda ctx, p: (ctx["atr", p["time_period"]],),
+    ),
+    "NATR": Indicator(
+        "Normalized Average True Range (NATR)",
+        ("NATR",),
+        {"time_period": int},
+        {},
+        lambda ctx, p: (
+            100 * _divide(ctx["atr", p["time_period"]], ctx.series.close, np.nan),
+        ),
+    ),
+    "AD": Indicator(
+        "Chaikin A/D Line", ("Chaikin A/D",), {}, {}, lambda ctx, p: (ctx["ad"],)
+    ),
+    "ADOSC": Indicator(
+        "Chaikin A/D Oscillator (ADOSC)",
+        ("ADOSC",),
+        {"fastperiod": int, "slowperiod": int},
+        {"fastperiod": 3, "slowperiod": 10},
+        _adosc,
+    ),
+    "OBV": Indicator("On Balance Volume (OBV)", ("OBV",), {}, {}, _obv),
+}
+
+PARAM_LABELS = {
+    "time_period": "Time Period",
+    "fastperiod": "Fast Period",
+    "slowperiod": "Slow Period",
+    "signalperiod": "Signal Period",
+    "matype": "MA Type",
+    "fastkperiod": "FastK Period",
+    "fastdperiod": "FastD Period",
+    "fastdmatype": "FastD MA Type",
+    "slowkperiod": "SlowK Period",
+    "slowdperiod": "SlowD Period",
+    "slowkmatype": "SlowK MA Type",
+    "slowdmatype": "SlowD MA Type",
+    "nbdevup": "Deviation multiplier for upper band",
+    "nbdevdn": "Deviation multiplier for lower band",
+    "timeperiod1": "Time Period 1",
+    "timeperiod2": "Time Period 2",
+    "timeperiod3": "Time Period 3",
+    "vfactor": "Volume Factor (vFactor)",
+}
+
+
+def resolve_params(function: str, https_params: dict) -> dict:
+    """
+    Validate and convert the parameters of an indicator request.
+
+    :argument: function (str): The indicator function, e.g. "SMA".
+    :argument: https_params (dict): The request parameters.
+
+    :returns: The typed parameters, with defaults filled in.
+    """
+
+    indicator = INDICATORS.get(function)
+    if indicator is None:
+        raise UnsupportedIndicator(f"{function} is not computed locally")
+
+    params = {}
+    for name, kind in indicator.params.items():
+        value = https_params.get(name)
+        if value is None:
+            if name not in indicator.defaults:
+                # Let the API report the missing parameter.
+                raise UnsupportedIndicator(f"{function} requires {name}")
+            value = indicator.defaults[name]
+        try:
+            params[name] = kind(value)
+        except ValueError as e:
+            raise UnsupportedIndicator(f"Invalid {name}: {value}") from e
+    for name, value in indicator.defaults.items():
+        params.setdefault(name, value)
+
+    if params.get("series_type", "close") not in SERIES_TYPES:
+        raise UnsupportedIndicator(f"Invalid series_type: {params['series_type']}")
+    for name, value in params.items():
+        if "period" in name and value < 1:
+            raise UnsupportedIndicator(f"Invalid {name}: {value}")
+        if "matype" in name and value not in MA_TYPES:
+            raise UnsupportedIndicator(f"Unsupported {name}: {value}")
+    return params
+
+
+def compute(
+    ctx: IndicatorContext, function: str, params: dict
+) -> tuple[np.ndarray, ...]:
+    """
+    :argument: ctx (IndicatorContext): The context of the price series.
+    :argument: function (str): The indicator function, e.g. "MACD".
+    :argument: params (dict): The parameters from resolve_params.
+
+    :returns: One array per indicator output, aligned with the series dates.
+    """
+
+    return INDICATORS[function].compute(ctx, params)
+
+
+def to_payload(
+    function: str,
+    symbol: str,
+    interval: str,
+    series: OHLCV,
+    params: dict,
+    values: tuple[np.ndarray, ...],
+) -> dict:
+    """
+    Format computed values as an Alpha Vantage technical indicator response.
+
+    :argument: function (str): The indicator function.
+    :argument: symbol (str): The symbol of the series.
+    :argument: interval (str): The interval of the series.
+    :argument: series (OHLCV): The price series the values were computed from.
+    :argument: params (dict): The parameters from resolve_params.
+    :argument: values (tuple[np.ndarray, ...]): The output of compute.
+
+    :returns: The response with "Meta Data" and "Technical Analysis: <function>" keys.
+    """
+
+    indicator = INDICATORS[function]
+    intraday = interval in INTRADAY_INTERVALS
+    dates = [d[:16] for d in series.dates] if intraday else series.dates
+
+    valid = np.all(np.isfinite(np.vstack(values)), axis=0)
+    rows = np.flatnonzero(valid)[::-1]
+    columns = [[f"{x:.4f}" for x in v[rows].tolist()] for v in values]
+    analysis = {
+        dates[i]: dict(zip(indicator.outputs, row))
+        for i, row in zip(rows.tolist(), zip(*columns))
+    }
+
+    meta = {
+        "1: Symbol": symbol,
+        "2: Indicator": indicator.name,
+        "3: Last Refreshed": dates[-1] if dates else "",
+        "4: Interval": interval,
+    }
+    labelled = [name for name in params if name != "series_type"]
+    for i, name in enumerate(labelled, 1):
+        number = "5" if len(labelled) == 1 else f"5.{i}"
+        meta[f"{number}: {PARAM_LABELS[name]}"] = params[name]
+    if "series_type" in params:
+        meta["6: Series Type"] = params["series_type"]
+    meta["7: Time Zone"] = "US/Eastern Time" if intraday else "US/Eastern"
+
+    return {"Meta Data": meta, f"Technical Analysis: {function}": analysis}
@@ -0,0 +1,47 @@
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+_counters: Counter[str] = Counter()
+_gauges: dict[str, Callable[[], Any]] = {}
+
+
+def increment(name: str, value: int = 1) -> None:
+    """
+    Increment a named counter.
+
+    :argument: name (str): The counter name, e.g. "singleflight.coalesced".
+    :argument: value (int): The amount to add (default: 1).
+    """
+
+    _counters[name] += value
+
+
+def get(name: str) -> int:
+    return _counters[name]
+
+
+def register(name: str, gauge: Callable[[], Any]) -> None:
+    """
+    Register a callable reporting a value (e.g. cache statistics) in every snapshot.
+
+    :argument: name (str): The name to report the value under.
+    :argument: gauge (Callable): Returns the current value.
+    """
+
+    _gauges[name] = gauge
+
+
+def snapshot() -> dict[str, Any]:
+    """
+    :returns: The current value of every counter, sorted by name, followed by the registered gauges.
+    """
+
+    result: dict[str, Any] = dict(sorted(_counters.items()))
+    for name, gauge in _gauges.items():
+        result[name] = gauge()
+    return result
+
+
+def reset() -> None:
+    _counters.clear()
@@ -0,0 +1,34 @@
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+
+import anyio
+
+from alphavantage_mcp_server import metrics
+
+ProgressCallback = Callable[[float, float | None], Awaitable[None]]
+
+# Set by the server for the duration of a tool call whose client asked for progress.
+progress_callback: ContextVar[ProgressCallback | None] = ContextVar(
+    "progress_callback", default=None
+)
+
+
+async def report_progress(progress: float, total: float | None = None) -> None:
+    """
+    Report the progress of the current tool call, if its client asked for it.
+
+    A notification that cannot be delivered because the session or its transport
+    is closed does not fail the call.
+
+    :argument: progress (float): The work done so far.
+    :argument: total (float): The total amount of work, if known (default: None).
+    """
+
+    callback = progress_callback.get()
+    if callback is None:
+        return
+    try:
+        await callback(progress, total)
+    except (anyio.ClosedResourceError, anyio.BrokenResourceError, OSError):
+        # The client's session or transport is gone; the call itself carries on.
+        metrics.increment("progress.errors")
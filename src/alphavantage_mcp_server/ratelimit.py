@@ -0,0 +1,175 @@
+import asyncio
+import json
+import time
+from collections.abc import Hashable
+
+from alphavantage_mcp_server.scheduler import (
+    FairQueue,
+    Priority,
+    request_priority,
+    request_session,
+)
+
+THROTTLE_KEYS = ("Note", "Information")
+THROTTLE_MARKERS = ("call frequency", "rate limit", "requests per", "calls per")
+
+
+class TokenBucket:
+    """
+    A token bucket holding up to `capacity` tokens, refilled continuously so that
+    `capacity` tokens become available every `period` seconds.
+    """
+
+    def __init__(self, capacity: int, period: float):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self) -> float:
+        """
+        :returns: The seconds to wait before a token is available (0 if one is available now).
+        """
+
+        self._refill()
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def consume(self) -> None:
+        self.tokens -= 1
+
+
+class RateLimiter:
+    """
+    Async rate limiter enforcing the per-minute and per-day request quotas of an API key.
+
+    Callers that exceed the quota are queued until a token is available instead
+    of being rejected, and served by priority class and fairly across sessions
+    (see scheduler.FairQueue). Background requests only take spare quota and are
+    dropped when none frees up before their deadline. A limit of 0 disables that
+    bucket.
+    """
+
+    def __init__(self, requests_per_minute: int = 0, requests_per_day: int = 0):
+        self.buckets = []
+        if requests_per_minute > 0:
+            self.buckets.append(TokenBucket(requests_per_minute, 60))
+        if requests_per_day > 0:
+            self.buckets.append(TokenBucket(requests_per_day, 24 * 60 * 60))
+        self.blocked_until = 0.0
+        self.queue = FairQueue()
+        self._dispatcher: asyncio.Task | None = None
+
+    def delay(self) -> float:
+        """
+        :returns: The seconds until the next request may be sent.
+        """
+
+        delays = [bucket.delay() for bucket in self.buckets]
+        delays.append(self.blocked_until - time.monotonic())
+        return max(delays)
+
+    def _consume(self) -> None:
+        for bucket in self.buckets:
+            bucket.consume()
+
+    async def _dispatch(self) -> None:
+        """Hand out request slots to the queued callers as the buckets refill."""
+
+        while self.queue:
+            now = time.monotonic()
+            for waiter in self.queue.expire(now):
+                if not waiter.done():
+                    waiter.set_result(False)
+            if not self.queue:
+                break
+            delay = self.delay()
+            if delay > 0:
+                deadline = self.queue.next_deadline()
+                if deadline is not None:
+                    delay = min(delay, max(deadline - now, 0.0))
+                await asyncio.sleep(delay)
+                continue
+            waiter = self.queue.pop()
+            if not waiter.done():  # Not cancelled while it waited
+                self._consume()
+                waiter.set_result(True)
+
+    async def acquire(
+        self,
+        priority: Priority | None = None,
+        session: Hashable = None,
+        max_wait: float | None = None,
+    ) -> bool:
+        """
+        Wait for a request slot, queueing behind more urgent callers.
+
+        :argument: priority (Priority): The priority class (default: None, the request_priority of the tool call).
+        :argument: session (Hashable): The session of the caller (default: None, the request_session of the tool call).
+        :argument: max_wait (float): Give up after this many seconds, only for background requests (default: None).
+
+        :returns: True once a slot was taken, False if the request was dropped.
+        """
+
+        priority = request_priority.get() if priority is None else priority
+        session = request_session.get() if session is None else session
+        if not self.queue and self.delay() <= 0:
+            self._consume()
+            return True
+        deadline = None
+        if priority is Priority.BACKGROUND and max_wait is not None:
+            if self.delay() > max_wait:
+                # No slot frees up in time, let alone a spare one.
+                return False
+            deadline = time.monotonic() + max_wait
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.queue.push(waiter, priority, session, deadline)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        return await waiter
+
+    def backoff(self, seconds: float) -> None:
+        """
+        Hold every queued and future request for `seconds`, e.g. after the API reported throttling.
+
+        :argument: seconds (float): The time to pause for.
+        """
+
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+def throttle_message(payload: dict | str) -> str | None:
+    """
+    Detect the "Note"/"Information" payloads Alpha Vantage sends instead of data
+    when the API key's request quota is exhausted.
+
+    :argument: payload (dict | str): The decoded JSON or raw text response.
+
+    :returns: The throttle message, or None if the payload is not a throttle response.
+    """
+
+    if isinstance(payload, str):
+        if not payload.lstrip().startswith("{"):
+            return None
+        try:
+            payload = json.loads(payload)
+        except ValueError:
+            return None
+
+    if not isinstance(payload, dict) or len(payload) != 1:
+        return None
+
+    for key in THROTTLE_KEYS:
+        message = payload.get(key)
+        if isinstance(message, str) and any(
+            marker in message.lower() for marker in THROTTLE_MARKERS
+        ):
+            return message
+    return None
@@ -0,0 +1,161 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from alphavantage_mcp_server.store import FIELD_PREFIX, SeriesFrame
+
+# How each daily field is aggregated over a period. Other fields (the split
+# coefficient) are not part of the weekly and monthly responses.
+AGGREGATIONS = {
+    "open": "first",
+    "high": "max",
+    "low": "min",
+    "close": "last",
+    "adjusted close": "last",
+    "volume": "sum",
+    "dividend amount": "sum",
+}
+
+PERIODS = ("weekly", "monthly")
+
+
+@dataclass(frozen=True)
+class Resampling:
+    """How a weekly or monthly endpoint is derived from its daily counterpart."""
+
+    daily: str
+    period: str
+    series: str
+    information: str
+
+
+RESAMPLINGS = {
+    "TIME_SERIES_WEEKLY": Resampling(
+        "TIME_SERIES_DAILY",
+        "weekly",
+        "Weekly Time Series",
+        "Weekly Prices (open, high, low, close) and Volumes",
+    ),
+    "TIME_SERIES_WEEKLY_ADJUSTED": Resampling(
+        "TIME_SERIES_DAILY_ADJUSTED",
+        "weekly",
+        "Weekly Adjusted Time Series",
+        "Weekly Adjusted Prices and Volumes",
+    ),
+    "TIME_SERIES_MONTHLY": Resampling(
+        "TIME_SERIES_DAILY",
+        "monthly",
+        "Monthly Time Series",
+        "Monthly Prices (open, high, low, close) and Volumes",
+    ),
+    "TIME_SERIES_MONTHLY_ADJUSTED": Resampling(
+        "TIME_SERIES_DAILY_ADJUSTED",
+        "monthly",
+        "Monthly Adjusted Time Series",
+        "Monthly Adjusted Prices and Volumes",
+    ),
+    "FX_WEEKLY": Resampling(
+        "FX_DAILY",
+        "weekly",
+        "Time Series FX (Weekly)",
+        "Forex Weekly Prices (open, high, low, close)",
+    ),
+    "FX_MONTHLY": Resampling(
+        "FX_DAILY",
+        "monthly",
+        "Time Series FX (Monthly)",
+        "Forex Monthly Prices (open, high, low, close)",
+    ),
+    "DIGITAL_CURRENCY_WEEKLY": Resampling(
+        "DIGITAL_CURRENCY_DAILY",
+        "weekly",
+        "Time Series (Digital Currency Weekly)",
+        "Weekly Prices and Volumes for Digital Currency",
+    ),
+    "DIGITAL_CURRENCY_MONTHLY": Resampling(
+        "DIGITAL_CURRENCY_DAILY",
+        "monthly",
+        "Time Series (Digital Currency Monthly)",
+        "Monthly Prices and Volumes for Digital Currency",
+    ),
+}
+
+
+def period_ids(index: np.ndarray, period: str) -> np.ndarray:
+    """
+    :argument: index (np.ndarray): Daily datetime64 dates in ascending order.
+    :argument: period (str): "weekly" (weeks starting on Monday) or "monthly".
+
+    :returns: A period number for each date, non-decreasing along the index.
+    """
+
+    if period == "monthly":
+        return index.astype("datetime64[M]").astype(np.int64)
+    if period == "weekly":
+        # Day 0 of datetime64 (1970-01-01) is a Thursday.
+        return (index.astype("datetime64[D]").astype(np.int64) + 3) // 7
+    raise ValueError(f"Invalid period: {period} (expected one of {', '.join(PERIODS)})")
+
+
+def resample(frame: SeriesFrame, period: str) -> SeriesFrame:
+    """
+    Aggregate daily bars into calendar weeks or months.
+
+    Each period is labeled with its last date in the frame, as Alpha Vantage does,
+    so the current, incomplete period ends on the latest day.
+
+    :argument: frame (SeriesFrame): The daily series.
+    :argument: period (str): "weekly" or "monthly".
+
+    :returns: The aggregated series.
+    """
+
+    ids = period_ids(frame.index, period)
+    starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]]) if len(ids) else ids
+    ends = np.r_[starts[1:] - 1, len(ids) - 1] if len(ids) else ids
+
+    columns = {}
+    for field, values in frame.columns.items():
+        aggregation = AGGREGATIONS.get(FIELD_PREFIX.sub("", field))
+        if aggregation == "first":
+            columns[field] = values[starts]
+        elif aggregation == "last":
+            columns[field] = values[ends]
+        elif aggregation == "max":
+            columns[field] = np.maximum.reduceat(values, starts)
+        elif aggregation == "min":
+            columns[field] = np.minimum.reduceat(values, starts)
+        elif aggregation == "sum":
+            columns[field] = np.add.reduceat(values, starts)
+    return SeriesFrame(frame.index[ends], columns, frame.decimals, frame.intraday)
+
+
+def resampled_payload(function: str, daily: dict) -> dict | None:
+    """
+    Derive a weekly or monthly response from the daily response of the same series.
+
+    :argument: function (str): The weekly or monthly function, a key of RESAMPLINGS.
+    :argument: daily (dict): The full daily response, with its series as a frame.
+
+    :returns: The response shaped like the remote endpoint's, or None if the daily series is not a frame.
+    """
+
+    spec = RESAMPLINGS[function]
+    frame = next(
+        (value for value in daily.values() if isinstance(value, SeriesFrame)), None
+    )
+    if frame is None or not len(frame):
+        return None
+
+    meta = [
+        (FIELD_PREFIX.sub("", name), value)
+        for name, value in daily.get("Meta Data", {}).items()
+        if not name.endswith("Output Size")
+    ]
+    meta = [("Information", spec.information)] + [
+        (name, value) for name, value in meta if name != "Information"
+    ]
+    return {
+        "Meta Data": {f"{i}. {name}": value for i, (name, value) in enumerate(meta, 1)},
+        spec.series: resample(frame, spec.period),
+    }
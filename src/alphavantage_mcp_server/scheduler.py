@@ -0,0 +1,124 @@
+import heapq
+import itertools
+from collections.abc import Hashable
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any
+
+
+class Priority(IntEnum):
+    """The priority classes of API requests, most urgent first."""
+
+    INTERACTIVE = 0
+    BATCH = 1
+    BACKGROUND = 2
+
+
+# Set by the server for the duration of a tool call: its priority class and the
+# MCP session it came from. Requests made outside of a tool call are interactive.
+request_priority: ContextVar[Priority] = ContextVar(
+    "request_priority", default=Priority.INTERACTIVE
+)
+request_session: ContextVar[Hashable] = ContextVar("request_session", default=None)
+
+# Shares of the quota while both classes wait: an interactive request waits for
+# at most one request of each batch flow, however long their backlogs.
+WEIGHTS = {Priority.INTERACTIVE: 8.0, Priority.BATCH: 1.0, Priority.BACKGROUND: 1.0}
+
+
+class FairQueue:
+    """
+    The queue of requests waiting for the rate limiter, in the order they are served.
+
+    Interactive and batch requests share the quota by weighted fair queuing over
+    flows, one flow per (session, priority) pair: each request is tagged with the
+    virtual time at which its flow would finish it if every waiting flow were
+    served in proportion to its weight (self-clocked fair queuing), and the
+    smallest tag goes first. A session issuing a thousand requests therefore
+    delays another session's requests by a share of the quota, not by the length
+    of its backlog. Background requests are only served when nothing else waits,
+    and are given up at their deadline.
+    """
+
+    def __init__(self, weights: dict[Priority, float] = WEIGHTS):
+        self.weights = weights
+        self.virtual_time = 0.0
+        self._finish: dict[tuple, float] = {}
+        self._heap: list[list] = []
+        self._deadlines: list[tuple[float, int, list]] = []
+        self._counter = itertools.count()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(
+        self,
+        item: Any,
+        priority: Priority = Priority.INTERACTIVE,
+        session: Hashable = None,
+        deadline: float | None = None,
+    ) -> None:
+        """
+        :argument: item (Any): The waiting request.
+        :argument: priority (Priority): Its priority class (default: INTERACTIVE).
+        :argument: session (Hashable): The session it belongs to (default: None).
+        :argument: deadline (float): When to give it up, in time.monotonic() seconds, if it still waits (default: None).
+        """
+
+        flow = (session, priority)
+        start = max(self.virtual_time, self._finish.get(flow, 0.0))
+        tag = self._finish[flow] = start + 1 / self.weights[priority]
+        seq = next(self._counter)
+        entry = [priority is Priority.BACKGROUND, tag, seq, item, False]
+        heapq.heappush(self._heap, entry)
+        if deadline is not None:
+            heapq.heappush(self._deadlines, (deadline, seq, entry))
+        self._size += 1
+
+    def _remove(self, entry: list) -> Any:
+        entry[4] = True
+        self._size -= 1
+        if not self._size:
+            # Every flow is idle: start the next busy period afresh.
+            self.virtual_time = 0.0
+            self._finish.clear()
+            self._heap.clear()
+            self._deadlines.clear()
+        return entry[3]
+
+    def pop(self) -> Any:
+        """
+        :returns: The next request to serve.
+        """
+
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            if not entry[4]:
+                self.virtual_time = max(self.virtual_time, entry[1])
+                return self._remove(entry)
+        raise IndexError("pop from an empty FairQueue")
+
+    def next_deadline(self) -> float | None:
+        """
+        :returns: The earliest deadline of a waiting request, or None.
+        """
+
+        while self._deadlines and self._deadlines[0][2][4]:
+            heapq.heappop(self._deadlines)
+        return self._deadlines[0][0] if self._deadlines else None
+
+    def expire(self, now: float) -> list[Any]:
+        """
+        Remove the requests whose deadline has passed.
+
+        :argument: now (float): The current time.monotonic().
+
+        :returns: The removed requests.
+        """
+
+        expired = []
+        while (deadline := self.next_deadline()) is not None and deadline <= now:
+            _, _, entry = heapq.heappop(self._deadlines)
+            expired.append(self._remove(entry))
+        return expired
@@ -0,0 +1,54 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TypeVar
+
+from alphavantage_mcp_server import metrics
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into a single in-flight task.
+
+    The first caller for a key starts the work; callers arriving while it is still
+    running await the same task. Each caller waits through asyncio.shield, so
+    cancelling one waiter never cancels the shared work for the others.
+    """
+
+    def __init__(self, name: str = "singleflight"):
+        self.name = name
+        self._calls: dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `fn` unless a call with the same key is already in flight, and return its result.
+
+        :argument: key (Hashable): Identifies identical calls.
+        :argument: fn (Callable): Starts the work when no call is in flight.
+
+        :returns: The result of the (possibly shared) call.
+        """
+
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+            metrics.increment(f"{self.name}.calls")
+        else:
+            metrics.increment(f"{self.name}.coalesced")
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved in case every waiter was cancelled.
+        if not task.cancelled():
+            task.exception()
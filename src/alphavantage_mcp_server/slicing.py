@@ -0,0 +1,177 @@
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Any
+
+from alphavantage_mcp_server.encoding import is_series
+from alphavantage_mcp_server.store import FIELD_PREFIX, SeriesFrame
+
+SLICE_ARGUMENTS = ("start_date", "end_date", "last_n", "fields")
+
+# Sorts past any time of day, so an end date includes the whole day.
+END_OF_DAY = "\uffff"
+
+INDEX_CACHE_SIZE = 32
+
+_indexes: OrderedDict[int, tuple[Any, list[str], list[Any]]] = OrderedDict()
+
+
+def is_records(value: Any) -> bool:
+    """
+    :argument: value (Any): A value of an API response.
+
+    :returns: Whether the value is a list of dated records, like the "data" of the commodity and economic endpoints.
+    """
+
+    return (
+        isinstance(value, list)
+        and bool(value)
+        and all(isinstance(row, dict) and "date" in row for row in value)
+    )
+
+
+def _indexed(value: Any) -> bool:
+    entry = _indexes.get(id(value))
+    return entry is not None and entry[0] is value
+
+
+def date_index(series: dict | list) -> tuple[list[str], list[Any]]:
+    """
+    The dates of a series in ascending order, with the rows they label.
+
+    Cached responses are shared between calls, so the index is built once per
+    series object and reused by every later slice of the same response.
+
+    :argument: series (dict | list): A mapping of dates to rows, or a list of dated records.
+
+    :returns: The sorted dates and the rows in the same order.
+    """
+
+    key = id(series)
+    entry = _indexes.get(key)
+    if entry is not None and entry[0] is series:
+        _indexes.move_to_end(key)
+        return entry[1], entry[2]
+
+    if isinstance(series, dict):
+        dates = sorted(series)
+        rows = [series[date] for date in dates]
+    else:
+        ordered = sorted(series, key=lambda row: row["date"])
+        dates = [row["date"] for row in ordered]
+        rows = ordered
+
+    # Holding the series keeps its id from being reused while the entry exists.
+    _indexes[key] = (series, dates, rows)
+    while len(_indexes) > INDEX_CACHE_SIZE:
+        _indexes.popitem(last=False)
+    return dates, rows
+
+
+def _projection(row: dict, fields: list[str]) -> list[str]:
+    wanted = {field.lower() for field in fields}
+    keys = [
+        key
+        for key in row
+        if key.lower() in wanted or FIELD_PREFIX.sub("", key).lower() in wanted
+    ]
+    found = {key.lower() for key in keys} | {
+        FIELD_PREFIX.sub("", key).lower() for key in keys
+    }
+    missing = [field for field in fields if field.lower() not in found]
+    if missing:
+        available = ", ".join(FIELD_PREFIX.sub("", key) for key in row if key != "date")
+        raise ValueError(
+            f"Unknown field{'s' if len(missing) > 1 else ''}: {', '.join(missing)} (available: {available})"
+        )
+    return keys
+
+
+def _slice_frame(
+    frame: SeriesFrame,
+    start_date: str | None,
+    end_date: str | None,
+    last_n: int | None,
+    fields: list[str] | None,
+) -> SeriesFrame:
+    lo, hi = frame.between(start_date, end_date)
+    if last_n is not None:
+        lo = max(lo, hi - last_n)
+    frame = frame.take(lo, hi)
+    if fields:
+        frame = frame.project(_projection(dict.fromkeys(frame.fields), fields))
+    return frame
+
+
+def _slice(
+    series: dict | list,
+    start_date: str | None,
+    end_date: str | None,
+    last_n: int | None,
+    fields: list[str] | None,
+) -> dict | list:
+    dates, rows = date_index(series)
+    lo = bisect_left(dates, start_date) if start_date else 0
+    hi = bisect_right(dates, end_date + END_OF_DAY) if end_date else len(dates)
+    if last_n is not None:
+        lo = max(lo, hi - last_n)
+    chosen = range(hi - 1, lo - 1, -1)
+
+    if isinstance(series, dict):
+        if fields and rows:
+            keys = _projection(rows[0], fields)
+            return {dates[i]: {key: rows[i].get(key) for key in keys} for i in chosen}
+        return {dates[i]: rows[i] for i in chosen}
+
+    if fields and rows:
+        keys = ["date", *(key for key in _projection(rows[0], fields) if key != "date")]
+        return [{key: rows[i].get(key) for key in keys} for i in chosen]
+    return [rows[i] for i in chosen]
+
+
+def select(
+    result: Any,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    last_n: int | None = None,
+    fields: list[str] | None = None,
+) -> Any:
+    """
+    Keep part of every series in a response, newest first.
+
+    The response is not modified; the series found at any depth are replaced by
+    their slices in a copy. Series held as frames are sliced without copying.
+    Text responses (e.g. CSV) cannot be sliced and are rejected.
+
+    :argument: result (Any): The tool result.
+    :argument: start_date (str): Only return data on or after this date, YYYY-MM-DD (default: None).
+    :argument: end_date (str): Only return data on or before this date, YYYY-MM-DD (default: None).
+    :argument: last_n (int): Only return the latest N data points in the date range (default: None).
+    :argument: fields (list[str]): Only return these fields of each data point, e.g. ["close", "volume"] (default: None).
+
+    :returns: The response with its series sliced.
+    """
+
+    if isinstance(fields, str):
+        fields = [field.strip() for field in fields.split(",") if field.strip()]
+    if last_n is not None:
+        last_n = int(last_n)
+        if last_n < 1:
+            raise ValueError("last_n must be a positive integer")
+    if not isinstance(result, dict):
+        if start_date or end_date or last_n or fields:
+            raise ValueError(
+                "start_date, end_date, last_n and fields only apply to JSON responses"
+            )
+        return result
+
+    sliced = {}
+    for key, value in result.items():
+        if isinstance(value, SeriesFrame):
+            sliced[key] = _slice_frame(value, start_date, end_date, last_n, fields)
+        elif _indexed(value) or is_series(value) or is_records(value):
+            sliced[key] = _slice(value, start_date, end_date, last_n, fields)
+        elif isinstance(value, dict):
+            sliced[key] = select(value, start_date, end_date, last_n, fields)
+        else:
+            sliced[key] = value
+    return sliced
@@ -0,0 +1,652 @@
+import re
+from collections.abc import Hashable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from alphavantage_mcp_server import metrics
+from alphavantage_mcp_server.cache import ResponseCache
+
+FIELD_PREFIX = re.compile(r"^\d+[a-z]?\. ")
+
+# Series endpoints kept in the series store. The ones taking an outputsize return
+# the latest 100 points unless outputsize=full; the others always return everything.
+SERIES_FUNCTIONS = {
+    "TIME_SERIES_INTRADAY",
+    "TIME_SERIES_DAILY",
+    "TIME_SERIES_DAILY_ADJUSTED",
+    "TIME_SERIES_WEEKLY",
+    "TIME_SERIES_WEEKLY_ADJUSTED",
+    "TIME_SERIES_MONTHLY",
+    "TIME_SERIES_MONTHLY_ADJUSTED",
+    "FX_INTRADAY",
+    "FX_DAILY",
+    "FX_WEEKLY",
+    "FX_MONTHLY",
+    "CRYPTO_INTRADAY",
+    "DIGITAL_CURRENCY_DAILY",
+    "DIGITAL_CURRENCY_WEEKLY",
+    "DIGITAL_CURRENCY_MONTHLY",
+}
+OUTPUTSIZE_FUNCTIONS = {
+    "TIME_SERIES_INTRADAY",
+    "TIME_SERIES_DAILY",
+    "TIME_SERIES_DAILY_ADJUSTED",
+    "FX_INTRADAY",
+    "FX_DAILY",
+    "CRYPTO_INTRADAY",
+}
+COMPACT_SIZE = 100
+
+# Full histories refreshed by merging in the compact window instead of refetching.
+INCREMENTAL_FUNCTIONS = {"TIME_SERIES_DAILY", "TIME_SERIES_DAILY_ADJUSTED", "FX_DAILY"}
+
+# Fields of adjusted series recording the events that restate earlier adjusted values.
+EVENT_FIELDS = {"dividend amount": 0.0, "split coefficient": 1.0}
+
+# Requests with any other parameter (e.g. month) are not a whole series.
+SERIES_PARAMS = {
+    "function",
+    "symbol",
+    "from_symbol",
+    "to_symbol",
+    "market",
+    "interval",
+    "adjusted",
+    "extended_hours",
+    "outputsize",
+    "datatype",
+    "apikey",
+}
+
+
+class SeriesFrame(Mapping):
+    """
+    A time series held as typed arrays: a datetime64 index in ascending order and
+    one float64 or int64 array per field.
+
+    The frame reads like the nested dict it was built from (dates, newest first,
+    mapping to rows of formatted strings), so responses holding frames can be used
+    as before. Rows are only formatted when they are read. Slices share the
+    arrays of the frame they are taken from.
+    """
+
+    __slots__ = ("columns", "decimals", "index", "intraday")
+
+    def __init__(
+        self,
+        index: np.ndarray,
+        columns: dict[str, np.ndarray],
+        decimals: dict[str, int | None],
+        intraday: bool,
+    ):
+        self.index = index
+        self.columns = columns
+        self.decimals = decimals
+        self.intraday = intraday
+
+    @classmethod
+    def from_series(cls, series: dict[str, dict[str, str]]) -> "SeriesFrame | None":
+        """
+        :argument: series (dict[str, dict[str, str]]): A mapping of dates to rows of numeric strings.
+
+        :returns: The frame, or None if the series cannot be stored without changing its text.
+        """
+
+        dates = list(series)
+        rows = list(series.values())
+        if not rows or not isinstance(rows[0], dict):
+            return None
+        fields = list(rows[0])
+        if any(not isinstance(row, dict) or list(row) != fields for row in rows):
+            return None
+
+        intraday = len(dates[0]) > 10
+        try:
+            index = np.array(
+                dates, dtype="datetime64[s]" if intraday else "datetime64[D]"
+            )
+        except ValueError:
+            return None
+        order = np.argsort(index, kind="stable")
+        index = index[order]
+        index.flags.writeable = False
+
+        columns, decimals = {}, {}
+        for column in fields:
+            text = [row[column] for row in rows]
+            if not isinstance(text[0], str):
+                return None
+            point = text[0].find(".")
+            decimals[column] = None if point < 0 else len(text[0]) - point - 1
+            try:
+                values = np.array(text).astype(np.float64 if point >= 0 else np.int64)
+            except (ValueError, OverflowError):
+                return None
+            if _format(values, decimals[column]) != text:
+                return None
+            columns[column] = values[order]
+            # Frames are shared by every reader of the cache.
+            columns[column].flags.writeable = False
+
+        frame = cls(index, columns, decimals, intraday)
+        if frame.dates != sorted(dates):
+            return None
+        return frame
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __iter__(self) -> Iterator[str]:
+        return reversed(self.dates)
+
+    def __getitem__(self, date: str) -> dict[str, str]:
+        try:
+            position = np.searchsorted(
+                self.index, np.array(date, dtype=self.index.dtype)
+            )
+        except ValueError:
+            raise KeyError(date) from None
+        if position >= len(self.index) or self._date(position) != date:
+            raise KeyError(date)
+        return {
+            column: _format(values[position : position + 1], self.decimals[column])[0]
+            for column, values in self.columns.items()
+        }
+
+    def items(self):
+        return self.to_dict().items()
+
+    def values(self):
+        return self.to_dict().values()
+
+    def _date(self, position: int) -> str:
+        return self._dates(self.index[position : position + 1])[0]
+
+    def _dates(self, index: np.ndarray) -> list[str]:
+        dates = np.datetime_as_string(index).tolist()
+        return [date.replace("T", " ") for date in dates] if self.intraday else dates
+
+    @property
+    def dates(self) -> list[str]:
+        """
+        :returns: The dates, oldest first, formatted as in the API response.
+        """
+
+        return self._dates(self.index)
+
+    @property
+    def fields(self) -> list[str]:
+        return list(self.columns)
+
+    @property
+    def nbytes(self) -> int:
+        return self.index.nbytes + sum(
+            values.nbytes for values in self.columns.values()
+        )
+
+    def to_dict(self) -> dict[str, dict[str, str]]:
+        """
+        :returns: The series as the API returns it, newest first.
+        """
+
+        dates = self.dates[::-1]
+        text = {
+            column: _format(values[::-1], self.decimals[column])
+            for column, values in self.columns.items()
+        }
+        fields = list(text)
+        return {
+            date: dict(zip(fields, row))
+            for date, row in zip(dates, zip(*text.values()))
+        }
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        :argument: name (str): A field name, with or without its number ("close" or "4. close").
+
+        :returns: The values of the field, oldest first.
+        """
+
+        for column, values in self.columns.items():
+            if name in (column, FIELD_PREFIX.sub("", column)):
+                return values
+        raise KeyError(name)
+
+    def take(self, start: int, stop: int) -> "SeriesFrame":
+        """
+        :argument: start (int): The first position, oldest first.
+        :argument: stop (int): The position after the last one.
+
+        :returns: A frame sharing this frame's arrays.
+        """
+
+        return SeriesFrame(
+            self.index[start:stop],
+            {column: values[start:stop] for column, values in self.columns.items()},
+            self.decimals,
+            self.intraday,
+        )
+
+    def project(self, fields: list[str]) -> "SeriesFrame":
+        """
+        :argument: fields (list[str]): The fields to keep, as named in the frame.
+
+        :returns: A frame with only those fields.
+        """
+
+        columns = {column: self.columns[column] for column in fields}
+        return SeriesFrame(self.index, columns, self.decimals, self.intraday)
+
+    def between(self, start_date: str | None, end_date: str | None) -> tuple[int, int]:
+        """
+        :argument: start_date (str): The first date, YYYY-MM-DD (default: None).
+        :argument: end_date (str): The last date, inclusive of the whole day (default: None).
+
+        :returns: The positions of the first point in the range and of the point after it.
+        """
+
+        unit = self.index.dtype
+        start = 0
+        if start_date:
+            start = int(
+                np.searchsorted(self.index, np.datetime64(start_date).astype(unit))
+            )
+        stop = len(self.index)
+        if end_date:
+            day_after = np.datetime64(end_date[:10], "D") + np.timedelta64(1, "D")
+            stop = int(np.searchsorted(self.index, day_after.astype(unit)))
+        return start, stop
+
+    def tail(self, n: int) -> "SeriesFrame":
+        return self.take(max(len(self.index) - n, 0), len(self.index))
+
+
+def concat_frames(frames: list[SeriesFrame]) -> SeriesFrame | None:
+    """
+    :argument: frames (list[SeriesFrame]): Consecutive, non-overlapping parts of a series, oldest first.
+
+    :returns: The parts joined into one frame, or None if their fields differ.
+    """
+
+    first = frames[0]
+    if any(
+        frame.fields != first.fields
+        or frame.decimals != first.decimals
+        or frame.intraday != first.intraday
+        for frame in frames
+    ):
+        return None
+    index = np.concatenate([frame.index for frame in frames])
+    index.flags.writeable = False
+    columns = {}
+    for column in first.fields:
+        columns[column] = np.concatenate([frame.columns[column] for frame in frames])
+        columns[column].flags.writeable = False
+    return SeriesFrame(index, columns, first.decimals, first.intraday)
+
+
+def _format(values: np.ndarray, decimals: int | None) -> list[str]:
+    if decimals is None:
+        return [str(value) for value in values.tolist()]
+    return [f"{value:.{decimals}f}" for value in values.tolist()]
+
+
+def compress(payload: Any) -> Any:
+    """
+    Convert the series of a response into frames, leaving everything else as it is.
+
+    :argument: payload (Any): A decoded API response.
+
+    :returns: A shallow copy of the response with each convertible series replaced by a
+    frame, or the response itself if it holds no series.
+    """
+
+    if not isinstance(payload, dict):
+        return payload
+    compressed = None
+    for key, value in payload.items():
+        if (
+            isinstance(value, dict)
+            and value
+            and isinstance(next(iter(value.values())), dict)
+        ):
+            frame = SeriesFrame.from_series(value)
+            if frame is not None:
+                compressed = compressed or dict(payload)
+                compressed[key] = frame
+    return payload if compressed is None else compressed
+
+
+def payload_size(payload: Any) -> int:
+    """
+    :argument: payload (Any): A response, possibly holding frames.
+
+    :returns: Its approximate size in memory, in bytes.
+    """
+
+    if isinstance(payload, SeriesFrame):
+        return payload.nbytes
+    if isinstance(payload, dict):
+        return sum(
+            len(str(key)) + payload_size(value) for key, value in payload.items()
+        )
+    if isinstance(payload, (list, tuple)):
+        return sum(payload_size(value) for value in payload)
+    return len(str(payload))
+
+
+def series_key(https_params: dict) -> tuple | None:
+    """
+    Identify the series a request reads, independently of how much of it is requested.
+
+    :argument: https_params (dict): The query parameters.
+
+    :returns: (function, symbol, interval, adjusted, extended_hours), or None if the request is not for a whole series.
+    """
+
+    function = https_params.get("function")
+    if (
+        function not in SERIES_FUNCTIONS
+        or https_params.get("datatype", "json") != "json"
+    ):
+        return None
+    if any(
+        name not in SERIES_PARAMS
+        for name, value in https_params.items()
+        if value is not None
+    ):
+        return None
+    if "from_symbol" in https_params:
+        symbol = f"{https_params['from_symbol']}/{https_params.get('to_symbol')}"
+    elif "market" in https_params:
+        symbol = f"{https_params.get('symbol')}/{https_params['market']}"
+    else:
+        symbol = https_params.get("symbol")
+    return (
+        function,
+        str(symbol).upper(),
+        https_params.get("interval"),
+        str(https_params.get("adjusted", "true")).lower(),
+        str(https_params.get("extended_hours", "true")).lower(),
+    )
+
+
+def is_full(https_params: dict) -> bool:
+    """
+    :argument: https_params (dict): The query parameters of a series request.
+
+    :returns: Whether the request asks for the whole history.
+    """
+
+    return (
+        https_params.get("function") not in OUTPUTSIZE_FUNCTIONS
+        or https_params.get("outputsize") == "full"
+    )
+
+
+def is_incremental(https_params: dict) -> bool:
+    """
+    :argument: https_params (dict): The query parameters of a series request.
+
+    :returns: Whether a stored full history of the series may be refreshed with a compact request.
+    """
+
+    return https_params.get("function") in INCREMENTAL_FUNCTIONS and is_full(
+        https_params
+    )
+
+
+def merge_frames(
+    history: SeriesFrame, update: SeriesFrame, adjusted: bool
+) -> SeriesFrame | None:
+    """
+    Append the latest points of a series to its history, overwriting the dates both hold.
+
+    For adjusted series, the dates both hold (except the latest stored one, which
+    may have been taken before the close) must be unchanged, and the new points
+    must not record a dividend or split, since either restates the adjusted values
+    of the whole history.
+
+    :argument: history (SeriesFrame): The stored series.
+    :argument: update (SeriesFrame): A more recent part of the same series.
+    :argument: adjusted (bool): Whether the series is dividend and split adjusted.
+
+    :returns: The merged series, or None if the update leaves a gap after the history or invalidates it.
+    """
+
+    if not len(history) or not len(update):
+        return None
+    if history.fields != update.fields or history.decimals != update.decimals:
+        return None
+    if update.index[0] > history.index[-1]:
+        return None
+
+    start = int(np.searchsorted(history.index, update.index[0]))
+    if adjusted:
+        shared = len(history) - start
+        if not np.array_equal(history.index[start:], update.index[:shared]):
+            return None
+        for column, values in history.columns.items():
+            if not np.array_equal(
+                values[start:-1], update.columns[column][: shared - 1]
+            ):
+                return None
+        for column, neutral in EVENT_FIELDS.items():
+            try:
+                events = update.column(column)[shared:]
+            except KeyError:
+                continue
+            if np.any(events != neutral):
+                return None
+
+    columns = {}
+    for column, values in history.columns.items():
+        columns[column] = np.concatenate([values[:start], update.columns[column]])
+        columns[column].flags.writeable = False
+    index = np.concatenate([history.index[:start], update.index])
+    index.flags.writeable = False
+    return SeriesFrame(index, columns, history.decimals, history.intraday)
+
+
+def merge_payloads(history: dict, update: dict, adjusted: bool) -> dict | None:
+    """
+    :argument: history (dict): A stored full response, with its series as frames.
+    :argument: update (dict): A compact response of the same series, with its series as frames.
+    :argument: adjusted (bool): Whether the series is dividend and split adjusted.
+
+    :returns: The full response brought up to date, or None if the series cannot be merged.
+    """
+
+    merged, frames = {}, 0
+    for key, value in update.items():
+        if isinstance(value, SeriesFrame):
+            stored = history.get(key)
+            if not isinstance(stored, SeriesFrame):
+                return None
+            value = merge_frames(stored, value, adjusted)
+            if value is None:
+                return None
+            frames += 1
+        elif isinstance(value, dict) and isinstance(history.get(key), dict):
+            value = {
+                name: history[key].get(name, item)
+                if name.endswith("Output Size")
+                else item
+                for name, item in value.items()
+            }
+        merged[key] = value
+    return merged if frames else None
+
+
+def _as_compact(payload: dict) -> dict:
+    compact = {}
+    for key, value in payload.items():
+        if isinstance(value, SeriesFrame):
+            value = value.tail(COMPACT_SIZE)
+        elif isinstance(value, dict):
+            value = {
+                name: "Compact" if name.endswith("Output Size") else item
+                for name, item in value.items()
+            }
+        compact[key] = value
+    return compact
+
+
+@dataclass
+class StoredSeries:
+    payload: dict
+    full: bool
+    # Indicator checkpoints of the series (see streaming.Checkpoint), kept across
+    # refreshes of the series, counted in its size and evicted with it.
+    states: dict = field(default_factory=dict)
+
+    @property
+    def nbytes(self) -> int:
+        return payload_size(self.payload) + sum(
+            state.nbytes for state in self.states.values()
+        )
+
+
+class SeriesStore:
+    """
+    Series responses converted to frames, keyed by the series they hold (see
+    series_key) rather than by request, so that a compact request is answered
+    from a stored full history, and a compact response of a series listed in
+    INCREMENTAL_FUNCTIONS brings its stored full history up to date.
+
+    Entries expire and are evicted like those of the response cache; their size
+    is the memory their arrays and indicator checkpoints take rather than the
+    response length.
+    """
+
+    def __init__(self, max_bytes: int, name: str = "series_store"):
+        self._cache = ResponseCache(max_bytes, name=name)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._cache.peek(key) is not None
+
+    @staticmethod
+    def _serve(stored: StoredSeries | None, https_params: dict) -> dict | None:
+        if stored is None:
+            return None
+        if is_full(https_params):
+            return stored.payload if stored.full else None
+        return _as_compact(stored.payload) if stored.full else stored.payload
+
+    def get(self, key: Hashable, https_params: dict) -> dict | None:
+        """
+        :argument: key (Hashable): The series key.
+        :argument: https_params (dict): The query parameters.
+
+        :returns: The stored response, or None if it is missing, expired or too short for the request.
+        """
+
+        return self._serve(self._cache.get(key), https_params)
+
+    def get_stale(
+        self, key: Hashable, https_params: dict, max_stale: float
+    ) -> tuple[dict, float] | None:
+        """
+        :argument: key (Hashable): The series key.
+        :argument: https_params (dict): The query parameters.
+        :argument: max_stale (float): The oldest expiry that may still be served, in seconds.
+
+        :returns: The stored response and the seconds since it expired, or None.
+        """
+
+        entry = self._cache.get_stale(key, max_stale)
+        if entry is None:
+            return None
+        payload = self._serve(entry[0], https_params)
+        return None if payload is None else (payload, entry[1])
+
+    def has_history(self, key: Hashable) -> bool:
+        """
+        :argument: key (Hashable): The series key.
+
+        :returns: Whether a full history of the series is stored, even an expired one.
+        """
+
+        stored = self._cache.peek(key)
+        return stored is not None and stored.full
+
+    def set(self, key: Hashable, https_params: dict, payload: dict, ttl: float) -> dict:
+        """
+        Store a series response, or merge a compact response into the stored full
+        history of its series when possible (see merge_payloads).
+
+        :argument: key (Hashable): The series key.
+        :argument: https_params (dict): The query parameters of the response.
+        :argument: payload (dict): The decoded response.
+        :argument: ttl (float): Seconds until the entry expires.
+
+        :returns: The response with its series converted to frames.
+        """
+
+        payload = compress(payload)
+        full = is_full(https_params)
+        function = https_params.get("function")
+        previous = self._cache.peek(key)
+        states = previous.states if previous is not None else {}
+        if not full and function in INCREMENTAL_FUNCTIONS and self.has_history(key):
+            merged = merge_payloads(
+                previous.payload, payload, function.endswith("_ADJUSTED")
+            )
+            if merged is not None:
+                metrics.increment(f"{self._cache.name}.merges")
+                stored = StoredSeries(merged, True, states)
+                self._cache.set(key, stored, ttl, stored.nbytes)
+                return payload
+            metrics.increment(f"{self._cache.name}.merge_failures")
+        stored = StoredSeries(payload, full, states)
+        self._cache.set(key, stored, ttl, stored.nbytes)
+        return payload
+
+    def state(self, key: Hashable, name: Hashable) -> Any | None:
+        """
+        :argument: key (Hashable): The series key.
+        :argument: name (Hashable): The name of the indicator checkpoint.
+
+        :returns: The checkpoint kept with the stored series, even an expired one, or None.
+        """
+
+        stored = self._cache.peek(key)
+        return stored.states.get(name) if stored is not None else None
+
+    def set_state(self, key: Hashable, name: Hashable, state: Any | None) -> None:
+        """
+        Keep an indicator checkpoint with the stored series, counted in its size.
+        Nothing is kept once the series is no longer stored.
+
+        :argument: key (Hashable): The series key.
+        :argument: name (Hashable): The name of the indicator checkpoint.
+        :argument: state (Any): The checkpoint, with an nbytes size, or None to drop it.
+        """
+
+        stored = self._cache.peek(key)
+        if stored is None:
+            return
+        if state is None:
+            stored.states.pop(name, None)
+        else:
+            stored.states[name] = state
+        self._cache.resize(key, stored.nbytes)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        :returns: The cache statistics of the store, with its merge counts.
+        """
+
+        return {
+            **self._cache.stats(),
+            "merges": metrics.get(f"{self._cache.name}.merges"),
+            "merge_failures": metrics.get(f"{self._cache.name}.merge_failures"),
+        }
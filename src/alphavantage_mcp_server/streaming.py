@@ -0,0 +1,272 @@
+import copy
+import math
+import sys
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+
+from alphavantage_mcp_server.indicators import INDICATORS, OHLCV, PRICE_FIELDS
+
+NAN = float("nan")
+
+FIELDS = {name: i for i, name in enumerate(PRICE_FIELDS)}
+
+
+class _Smoothing:
+    """
+    y = alpha * y + beta * x, seeded with the mean (or sum) of the first `period`
+    valid inputs, like indicators.smoothed. Inputs before the first valid one are skipped.
+    """
+
+    def __init__(self, period: int, alpha: float, beta: float, total: bool = False):
+        self.period, self.alpha, self.beta, self.total = period, alpha, beta, total
+        self.seed: list[float] | None = []
+        self.value = NAN
+
+    def update(self, x: float) -> float:
+        if self.seed is None:
+            self.value = self.alpha * self.value + self.beta * x
+        elif self.seed or not math.isnan(x):
+            self.seed.append(x)
+            if len(self.seed) == self.period:
+                total = float(np.sum(self.seed))
+                self.value = total if self.total else total / self.period
+                self.seed = None
+        return self.value
+
+
+def _ema(period: int) -> _Smoothing:
+    k = 2 / (period + 1)
+    return _Smoothing(period, 1 - k, k)
+
+
+def _wilder(period: int) -> _Smoothing:
+    return _Smoothing(period, 1 - 1 / period, 1 / period)
+
+
+class Stream(ABC):
+    """
+    The running state of one indicator: `update` consumes the next bar, an
+    (open, high, low, close, volume) tuple, in O(1) and returns the indicator
+    outputs at that bar, NaN while the indicator is warming up.
+    """
+
+    @abstractmethod
+    def update(self, bar: tuple[float, ...]) -> tuple[float, ...]: ...
+
+
+class SMAStream(Stream):
+    def __init__(self, series_type: str, time_period: int):
+        self.field, self.period = FIELDS[series_type], time_period
+        self.window: deque[float] = deque()
+        self.total = 0.0
+
+    def update(self, bar):
+        x = bar[self.field]
+        self.window.append(x)
+        self.total += x
+        if len(self.window) > self.period:
+            self.total -= self.window.popleft()
+        return (self.total / self.period if len(self.window) == self.period else NAN,)
+
+
+class EMAStream(Stream):
+    def __init__(self, series_type: str, time_period: int):
+        self.field, self.ema = FIELDS[series_type], _ema(time_period)
+
+    def update(self, bar):
+        return (self.ema.update(bar[self.field]),)
+
+
+class MOMStream(Stream):
+    def __init__(self, series_type: str, time_period: int):
+        self.field = FIELDS[series_type]
+        self.window: deque[float] = deque(maxlen=time_period + 1)
+
+    def update(self, bar):
+        self.window.append(bar[self.field])
+        full = len(self.window) == self.window.maxlen
+        return (self.window[-1] - self.window[0] if full else NAN,)
+
+
+class RSIStream(Stream):
+    def __init__(self, series_type: str, time_period: int):
+        self.field = FIELDS[series_type]
+        self.gain, self.loss = _wilder(time_period), _wilder(time_period)
+        self.previous = None
+
+    def update(self, bar):
+        x, previous, self.previous = bar[self.field], self.previous, bar[self.field]
+        if previous is None:
+            return (NAN,)
+        change = x - previous
+        gain = self.gain.update(max(change, 0.0))
+        loss = self.loss.update(max(-change, 0.0))
+        return (100 * gain / (gain + loss) if gain + loss != 0 else NAN,)
+
+
+class ATRStream(Stream):
+    def __init__(self, time_period: int):
+        self.atr = _wilder(time_period)
+        self.previous = None
+
+    def update(self, bar):
+        _, high, low, close, _ = bar
+        previous, self.previous = self.previous, close
+        if previous is None:
+            return (NAN,)
+        true_range = max(high - low, abs(high - previous), abs(low - previous))
+        return (self.atr.update(true_range),)
+
+
+class MACDStream(Stream):
+    def __init__(
+        self, series_type: str, fastperiod: int, slowperiod: int, signalperiod: int
+    ):
+        self.field = FIELDS[series_type]
+        self.fast, self.slow, self.signal = (
+            _ema(fastperiod),
+            _ema(slowperiod),
+            _ema(signalperiod),
+        )
+
+    def update(self, bar):
+        x = bar[self.field]
+        macd = self.fast.update(x) - self.slow.update(x)
+        signal = self.signal.update(macd)
+        return macd, macd - signal, signal
+
+
+class WILLRStream(Stream):
+    """Williams' %R, with the highest high and lowest low kept in monotonic deques."""
+
+    def __init__(self, time_period: int):
+        self.period = time_period
+        self.count = 0
+        self.highs: deque[tuple[int, float]] = deque()
+        self.lows: deque[tuple[int, float]] = deque()
+
+    def update(self, bar):
+        _, high, low, close, _ = bar
+        i, self.count = self.count, self.count + 1
+        while self.highs and self.highs[-1][1] <= high:
+            self.highs.pop()
+        self.highs.append((i, high))
+        while self.lows and self.lows[-1][1] >= low:
+            self.lows.pop()
+        self.lows.append((i, low))
+        for window in (self.highs, self.lows):
+            if window[0][0] <= i - self.period:
+                window.popleft()
+        if self.count < self.period:
+            return (NAN,)
+        highest, lowest = self.highs[0][1], self.lows[0][1]
+        k = (close - lowest) / (highest - lowest) if highest != lowest else 0.0
+        return (100 * k - 100,)
+
+
+STREAMS = {
+    "SMA": SMAStream,
+    "EMA": EMAStream,
+    "MOM": MOMStream,
+    "RSI": RSIStream,
+    "ATR": ATRStream,
+    "MACD": MACDStream,
+    "WILLR": WILLRStream,
+}
+
+
+@dataclass
+class Checkpoint:
+    """
+    The state of an indicator after the bars of a series up to `last_date`, with
+    its outputs at those bars. The latest bar of a series may still change (it is
+    revised until the period closes), so it is never part of a checkpoint.
+    """
+
+    stream: Stream
+    dates: list[str]
+    values: np.ndarray
+    last_bar: tuple[float, ...]
+
+    @property
+    def last_date(self) -> str:
+        return self.dates[-1]
+
+    @property
+    def nbytes(self) -> int:
+        """The approximate memory the dates and values take, in bytes."""
+        date_size = sys.getsizeof(self.dates[0]) + 8 if self.dates else 0
+        return self.values.nbytes + len(self.dates) * date_size
+
+
+def _bar(series: OHLCV, i: int) -> tuple[float, ...]:
+    return tuple(float(getattr(series, name)[i]) for name in PRICE_FIELDS)
+
+
+def _resume(checkpoint: Checkpoint, series: OHLCV) -> int | None:
+    """The number of bars of `series` the checkpoint covers, or None if they differ."""
+    dates = series.dates
+    end = bisect_left(dates, checkpoint.last_date)
+    start = bisect_left(checkpoint.dates, dates[0])
+    if (
+        end == len(dates)
+        or dates[end] != checkpoint.last_date
+        or start == len(checkpoint.dates)
+        or checkpoint.dates[start] != dates[0]
+        or len(checkpoint.dates) - start != end + 1
+        or _bar(series, end) != checkpoint.last_bar
+    ):
+        return None
+    return end + 1
+
+
+def advance(
+    function: str, params: dict, series: OHLCV, checkpoint: Checkpoint | None = None
+) -> tuple[tuple[np.ndarray, ...], Checkpoint | None, bool]:
+    """
+    Compute an indicator over a series, resuming from a checkpoint of an earlier
+    version of the same series when the series still starts with the bars it
+    covers. Only the bars after the checkpoint are consumed, one O(1) update each.
+    When the start of the series moved later (a rolling intraday window), the
+    outputs keep the values computed from the longer history.
+
+    :argument: function (str): The indicator function, a key of STREAMS.
+    :argument: params (dict): The parameters from indicators.resolve_params.
+    :argument: series (OHLCV): The price series, oldest first.
+    :argument: checkpoint (Checkpoint): The checkpoint of an earlier call (default: None).
+
+    :returns: One array per indicator output aligned with the series, the checkpoint to keep, and whether the given checkpoint was used.
+    """
+
+    covered = (
+        _resume(checkpoint, series) if checkpoint is not None and len(series) else None
+    )
+    resumed = covered is not None
+    if resumed:
+        stream = copy.deepcopy(checkpoint.stream)
+        start = len(checkpoint.dates) - covered
+        previous = checkpoint.values[:, start:]
+    else:
+        stream = STREAMS[function](**params)
+        covered = 0
+        previous = None
+
+    final = max(len(series) - 1, covered)
+    outputs = [stream.update(_bar(series, i)) for i in range(covered, final)]
+    width = len(INDICATORS[function].outputs)
+    values = np.array(outputs, dtype=float).reshape(len(outputs), width).T
+    if previous is not None:
+        values = np.hstack([previous, values])
+    saved = checkpoint if final == covered and resumed else None
+    if final > 0 and saved is None:
+        saved = Checkpoint(
+            copy.deepcopy(stream), series.dates[:final], values, _bar(series, final - 1)
+        )
+    if final < len(series):
+        latest = np.array(stream.update(_bar(series, final)), dtype=float)[:, None]
+        values = np.hstack([values, latest])
+    return tuple(values), saved, resumed
@@ -0,0 +1,144 @@
+import csv
+import heapq
+import io
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+
+from alphavantage_mcp_server.cache import MARKET_TIMEZONE
+
+TOKEN = re.compile(r"[a-z0-9]+")
+
+# SYMBOL_SEARCH names LISTING_STATUS asset types differently.
+ASSET_TYPES = {"Stock": "Equity", "ETF": "ETF"}
+
+MAX_MATCHES = 10
+
+
+def _tokens(text: str) -> list[str]:
+    return TOKEN.findall(text.lower())
+
+
+@dataclass(frozen=True)
+class Listing:
+    symbol: str
+    name: str
+    exchange: str
+    asset_type: str
+
+
+def _prefix_range(keys: list[str], prefix: str) -> range:
+    return range(bisect_left(keys, prefix), bisect_left(keys, prefix + "\uffff"))
+
+
+class SymbolIndex:
+    """
+    In-memory symbol search over the LISTING_STATUS universe.
+
+    Tickers and the words of company names are kept in sorted lists, so the keys
+    starting with a query are found by bisection, like a prefix trie without a
+    node per character. Matches are ranked by the share of the ticker or name the
+    query covers, as a stand-in for Alpha Vantage's matchScore.
+    """
+
+    def __init__(self, listings: list[Listing]):
+        self.listings = sorted(listings, key=lambda listing: listing.symbol)
+        self._symbols = [listing.symbol.lower() for listing in self.listings]
+        self._name_lengths = [
+            max(sum(map(len, _tokens(listing.name))), 1) for listing in self.listings
+        ]
+        postings = defaultdict(list)
+        for i, listing in enumerate(self.listings):
+            for token in set(_tokens(listing.name)):
+                postings[token].append(i)
+        self._words = sorted(postings)
+        self._postings = [postings[word] for word in self._words]
+
+    def __len__(self) -> int:
+        return len(self.listings)
+
+    @classmethod
+    def from_csv(cls, text: str) -> "SymbolIndex":
+        """
+        :argument: text (str): A LISTING_STATUS response (symbol,name,exchange,assetType,...).
+
+        :returns: The index of the listed symbols.
+        """
+
+        rows = csv.DictReader(io.StringIO(text))
+        return cls(
+            [
+                Listing(
+                    row["symbol"],
+                    row["name"] or "",
+                    row["exchange"] or "",
+                    row["assetType"] or "",
+                )
+                for row in rows
+                if row.get("symbol")
+            ]
+        )
+
+    def search(
+        self, keywords: str, limit: int = MAX_MATCHES
+    ) -> list[tuple[Listing, float]]:
+        """
+        :argument: keywords (str): A ticker or the start of a ticker, or words (or the starts of words) of a company name.
+        :argument: limit (int): The maximum number of matches (default: 10).
+
+        :returns: The best matches with their score between 0 and 1, best first.
+        """
+
+        query = keywords.strip().lower()
+        if not query:
+            return []
+
+        scores = {}
+        for i in _prefix_range(self._symbols, query):
+            scores[i] = len(query) / len(self._symbols[i])
+
+        words = _tokens(query)
+        matched = None
+        for word in words:
+            rows = set()
+            for position in _prefix_range(self._words, word):
+                rows.update(self._postings[position])
+            matched = rows if matched is None else matched & rows
+        if matched:
+            covered = sum(map(len, words))
+            for i in matched:
+                score = min(covered / self._name_lengths[i], 1.0)
+                scores[i] = max(scores.get(i, 0.0), score)
+
+        best = heapq.nsmallest(
+            limit, scores.items(), key=lambda item: (-item[1], self._symbols[item[0]])
+        )
+        return [(self.listings[i], score) for i, score in best]
+
+    def best_matches(self, keywords: str) -> dict[str, list[dict[str, str]]]:
+        """
+        :argument: keywords (str): The search keywords.
+
+        :returns: The matches shaped like a SYMBOL_SEARCH response.
+        """
+
+        offset = datetime.now(MARKET_TIMEZONE).utcoffset()
+        hours = int(offset.total_seconds() // 3600) if offset is not None else -5
+        return {
+            "bestMatches": [
+                {
+                    "1. symbol": listing.symbol,
+                    "2. name": listing.name,
+                    "3. type": ASSET_TYPES.get(listing.asset_type, listing.asset_type),
+                    "4. region": "United States",
+                    "5. marketOpen": "09:30",
+                    "6. marketClose": "16:00",
+                    "7. timezone": f"UTC{hours:+03d}",
+                    "8. currency": "USD",
+                    "9. matchScore": f"{score:.4f}",
+                }
+                for listing, score in self.search(keywords)
+            ]
+        }
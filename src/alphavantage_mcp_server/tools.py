@@ -0,0 +1,264 @@
+import asyncio
+import inspect
+import re
+import types
+import typing
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+import mcp.types
+
+from alphavantage_mcp_server import metrics
+from alphavantage_mcp_server.progress import progress_callback, report_progress
+from alphavantage_mcp_server.scheduler import Priority, request_priority
+from alphavantage_mcp_server.slicing import SLICE_ARGUMENTS, select
+
+JSON_TYPES = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    dict: "object",
+}
+
+ARGUMENT_DOC = re.compile(r":(?:argument|param):? (\w+)(?: \([^)]*\))?: (.*)")
+
+
+@dataclass
+class ToolSpec:
+    """
+    How an MCP tool maps onto the coroutine that serves it.
+
+    Tool arguments are passed to `fetch` by keyword, so they cannot drift out of
+    position. `aliases` maps alternative argument names onto fetch parameters,
+    `defaults` overrides the defaults of the fetch signature, and arguments the
+    coroutine does not accept are ignored. The tool's input schema is generated
+    from the signature and docstring of `fetch` (see to_tool), and its description
+    is `description`, or else the summary paragraph of the docstring; the rest of
+    the docstring documents the implementation and is left out.
+    Sliceable tools also take the arguments of slicing.select, which are applied
+    to the result after it is fetched or read from the cache. Bulk tools run at
+    Priority.BATCH, so their requests yield the quota to interactive calls; a call
+    made from within a bulk tool keeps the lower priority.
+    """
+
+    fetch: Callable[..., Awaitable[Any]]
+    required: tuple[str, ...] = ()
+    defaults: dict[str, Any] = field(default_factory=dict)
+    aliases: dict[str, str] = field(default_factory=dict)
+    description: str | None = None
+    sliceable: bool = False
+    priority: Priority = Priority.INTERACTIVE
+
+    def __post_init__(self):
+        self.parameters = frozenset(inspect.signature(self.fetch).parameters)
+
+    def bind(self, arguments: dict | None) -> dict[str, Any]:
+        """
+        :argument: arguments (dict): The tool call arguments (default: None).
+
+        :returns: The keyword arguments for `fetch`.
+        """
+
+        arguments = {
+            self.aliases.get(name, name): value
+            for name, value in (arguments or {}).items()
+            if value is not None
+        }
+        if any(name not in arguments for name in self.required):
+            plural = "s" if len(self.required) > 1 else ""
+            raise ValueError(
+                f"Missing required argument{plural}: {', '.join(self.required)}"
+            )
+
+        kwargs = dict(self.defaults)
+        kwargs.update(
+            (name, value)
+            for name, value in arguments.items()
+            if name in self.parameters
+        )
+        return kwargs
+
+    async def __call__(self, arguments: dict | None) -> Any:
+        kwargs = self.bind(arguments)
+        reset = request_priority.set(max(request_priority.get(), self.priority))
+        try:
+            result = await self.fetch(**kwargs)
+        finally:
+            request_priority.reset(reset)
+        if self.sliceable:
+            window = {
+                name: value
+                for name, value in (arguments or {}).items()
+                if name in SLICE_ARGUMENTS and value is not None
+            }
+            if window:
+                result = select(result, **window)
+        return result
+
+
+async def call_tool(
+    tools: dict[str, ToolSpec], name: str, arguments: dict | None
+) -> Any:
+    """
+    Dispatch a tool call through the registry.
+
+    :argument: tools (dict[str, ToolSpec]): The registry, keyed by tool name.
+    :argument: name (str): The tool name.
+    :argument: arguments (dict): The tool call arguments.
+
+    :returns: The result of the tool's coroutine.
+    """
+
+    spec = tools.get(name)
+    if spec is None:
+        raise ValueError(f"Unknown tool: {name}")
+    metrics.increment(f"tools.{name}")
+    return await spec(arguments)
+
+
+async def call_batch(
+    tools: dict[str, ToolSpec], calls: list[dict]
+) -> list[dict[str, Any]]:
+    """
+    Run several tool calls concurrently, sharing the rate limiter and caches of
+    single calls. A call failing with an API, argument or HTTP error is reported
+    in its entry without stopping the others. Progress counts one unit per call: the progress a call reports itself
+    fills its own unit, so the batch reports one increasing series.
+
+    :argument: tools (dict[str, ToolSpec]): The registry, keyed by tool name.
+    :argument: calls (list[dict]): The calls, each {"tool": <name>, "arguments": {...}}.
+
+    :returns: One entry per call, in order: {"tool", "result"} or {"tool", "error"}.
+    """
+
+    if not calls:
+        raise ValueError("At least one call is required")
+    callback = progress_callback.get()
+    shares = [0.0] * len(calls)
+    reported = 0.0
+    lock = asyncio.Lock()
+
+    async def advance(i: int, share: float) -> None:
+        nonlocal reported
+        shares[i] = max(shares[i], min(share, 1.0))
+        async with lock:  # Deliver notifications in increasing order
+            progress = sum(shares)
+            if progress > reported:
+                reported = progress
+                # Report to the client, not to the call's own callback.
+                token = progress_callback.set(callback)
+                try:
+                    await report_progress(progress, len(calls))
+                finally:
+                    progress_callback.reset(token)
+
+    async def run(i: int, call: dict) -> dict[str, Any]:
+        async def report(progress: float, total: float | None) -> None:
+            if total:
+                await advance(i, progress / total)
+
+        # Each call runs in its own task, so this only applies to this call.
+        if callback is not None:
+            progress_callback.set(report)
+        name = call.get("tool") if isinstance(call, dict) else None
+        try:
+            if not name:
+                raise ValueError(f"Call without tool: {call}")
+            arguments = call.get("arguments")
+            if arguments is not None and not isinstance(arguments, dict):
+                raise ValueError(f"Arguments of {name} must be an object: {arguments}")
+            result = await call_tool(tools, name, arguments)
+            return {"tool": name, "result": result}
+        except (ValueError, httpx.HTTPError) as e:
+            metrics.increment("batch.errors")
+            return {"tool": name, "error": str(e)}
+        finally:
+            await advance(i, 1.0)
+
+    return list(await asyncio.gather(*map(run, range(len(calls)), calls)))
+
+
+def _json_schema(annotation: Any) -> dict[str, Any]:
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        options = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(options) > 1:
+            return {"anyOf": [_json_schema(option) for option in options]}
+        (annotation,) = options
+    if typing.get_origin(annotation) is list:
+        (item,) = typing.get_args(annotation) or (str,)
+        return {"type": "array", "items": _json_schema(item)}
+    return {"type": JSON_TYPES.get(annotation, "string")}
+
+
+def parse_docstring(fetch: Callable) -> tuple[str, dict[str, str]]:
+    """
+    :argument: fetch (Callable): A function documented with ":argument:" lines.
+
+    :returns: The description (the first paragraph) and the argument descriptions.
+    """
+
+    description, arguments, current = [], {}, None
+    for line in (inspect.getdoc(fetch) or "").splitlines():
+        line = line.strip()
+        match = ARGUMENT_DOC.match(line)
+        if match:
+            current = match.group(1)
+            arguments[current] = match.group(2)
+        elif line.startswith(":"):
+            current = None
+        elif current and line:
+            arguments[current] += " " + line
+        elif not arguments and current is None:
+            description.append(line)
+    paragraphs = [p for p in "\n".join(description).split("\n\n") if p.strip()]
+    return " ".join(paragraphs[0].split()) if paragraphs else "", arguments
+
+
+def _properties(
+    fetch: Callable, names: Iterable[str], defaults: dict | None = None
+) -> dict[str, Any]:
+    _, docs = parse_docstring(fetch)
+    properties = {}
+    for name, parameter in inspect.signature(fetch).parameters.items():
+        if name not in names:
+            continue
+        schema = _json_schema(parameter.annotation)
+        if name in docs:
+            schema["description"] = docs[name]
+        default = (defaults or {}).get(name, parameter.default)
+        if default is not inspect.Parameter.empty and default is not None:
+            schema["default"] = default
+        properties[name] = schema
+    return properties
+
+
+def input_schema(spec: ToolSpec) -> dict[str, Any]:
+    """
+    :argument: spec (ToolSpec): The tool.
+
+    :returns: The JSON schema of the tool arguments, derived from the fetch signature.
+    """
+
+    properties = _properties(spec.fetch, spec.parameters, spec.defaults)
+    if spec.sliceable:
+        properties.update(_properties(select, SLICE_ARGUMENTS))
+    return {"type": "object", "properties": properties, "required": list(spec.required)}
+
+
+def to_tool(name: str, spec: ToolSpec) -> mcp.types.Tool:
+    """
+    :argument: name (str): The tool name.
+    :argument: spec (ToolSpec): The tool.
+
+    :returns: The MCP tool definition.
+    """
+
+    description, _ = parse_docstring(spec.fetch)
+    return mcp.types.Tool(
+        name=name,
+        description=spec.description or description,
+        inputSchema=input_schema(spec),
+    )
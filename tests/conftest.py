@@ -0,0 +1,127 @@
+import httpx
+import numpy as np
+import pytest
+
+from alphavantage_mcp_server import api, metrics
+from alphavantage_mcp_server.api import close_client, init_client
+from alphavantage_mcp_server.ratelimit import RateLimiter
+
+
+@pytest.fixture(autouse=True)
+def isolated_api(monkeypatch):
+    """Give every test empty caches, fresh metrics and no rate limit."""
+    monkeypatch.setattr(api, "rate_limiter", RateLimiter())
+    api.response_cache.clear()
+    api.series_store.clear()
+    monkeypatch.setattr(api, "_indexes", {})
+    metrics.reset()
+
+
+def make_daily_payload(
+    closes,
+    symbol: str = "IBM",
+    start: str = "2024-01-01",
+    spread: float = 1.0,
+    business_days: bool = False,
+    adjusted: bool = False,
+    dividends: dict[str, str] | None = None,
+    rng: np.random.Generator | None = None,
+) -> dict:
+    """
+    Build a daily time series response, latest date first, from its closing prices.
+
+    :argument: closes (list[float]): The closing prices, oldest first.
+    :argument: symbol (str): The symbol in the Meta Data (default: "IBM").
+    :argument: start (str): The date of the first close (default: "2024-01-01").
+    :argument: spread (float): The distance of the high and low from the close (default: 1.0).
+    :argument: business_days (bool): Skip weekends (default: False).
+    :argument: adjusted (bool): Use the TIME_SERIES_DAILY_ADJUSTED layout (default: False).
+    :argument: dividends (dict[str, str]): Dividend amounts by date, for adjusted series (default: None).
+    :argument: rng (np.random.Generator): Draw the opens, highs, lows and volumes at random (default: None).
+
+    :returns: The response.
+    """
+
+    count = len(closes)
+    dates = np.arange(
+        start, count * 2 + 7 if business_days else count, dtype="datetime64[D]"
+    )
+    if business_days:
+        dates = dates[np.is_busday(dates)]
+    dates = dates[:count].astype(str)
+    closes = np.asarray(closes, dtype=float)
+    if rng is None:
+        highs, lows, opens = closes + spread, closes - spread, closes - spread / 2
+        volumes = np.full(count, 1000)
+    else:
+        highs = closes + rng.uniform(0, spread, count)
+        lows = closes - rng.uniform(0, spread, count)
+        opens = rng.uniform(lows, highs)
+        volumes = rng.integers(1000, 9000, count)
+
+    series = {}
+    for i in reversed(range(count)):
+        row = {
+            "1. open": f"{opens[i]:.4f}",
+            "2. high": f"{highs[i]:.4f}",
+            "3. low": f"{lows[i]:.4f}",
+            "4. close": f"{closes[i]:.4f}",
+        }
+        if adjusted:
+            row["5. adjusted close"] = row["4. close"]
+            row["6. volume"] = str(volumes[i])
+            row["7. dividend amount"] = (dividends or {}).get(dates[i], "0.0000")
+            row["8. split coefficient"] = "1.0"
+        else:
+            row["5. volume"] = str(volumes[i])
+        series[dates[i]] = row
+
+    information = (
+        "Daily Time Series with Splits and Dividend Events"
+        if adjusted
+        else "Daily Prices (open, high, low, close) and Volumes"
+    )
+    return {
+        "Meta Data": {
+            "1. Information": information,
+            "2. Symbol": symbol,
+            "3. Last Refreshed": dates[-1],
+            "4. Output Size": "Full size",
+            "5. Time Zone": "US/Eastern",
+        },
+        "Time Series (Daily)": series,
+    }
+
+
+@pytest.fixture
+def daily_payload():
+    """The daily time series response factory, see make_daily_payload."""
+    return make_daily_payload
+
+
+@pytest.fixture
+async def mock_api():
+    """
+    Answer API requests with a handler instead of the network.
+
+    The fixture is an async function installing `handler(params)`, which returns a
+    JSON payload or an httpx.Response. It returns the list the query parameters of
+    every request are appended to. The client is closed after the test.
+    """
+
+    async def serve(handler) -> list[dict]:
+        requests = []
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            params = dict(request.url.params)
+            requests.append(params)
+            response = handler(params)
+            if isinstance(response, httpx.Response):
+                return response
+            return httpx.Response(200, json=response)
+
+        await init_client(transport=httpx.MockTransport(respond))
+        return requests
+
+    yield serve
+    await close_client()
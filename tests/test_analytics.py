@@ -0,0 +1,196 @@
+import numpy as np
+import pytest
+
+from alphavantage_mcp_server import api, metrics
+from alphavantage_mcp_server.analytics import (
+    UnsupportedCalculation,
+    Window,
+    align,
+    fixed_window,
+    parse_calculations,
+    range_bounds,
+    sliding_window,
+)
+from alphavantage_mcp_server.api import (
+    fetch_analytics_fixed_window,
+    fetch_analytics_sliding_window,
+)
+
+
+def random_window(count: int = 120, symbols: int = 3) -> Window:
+    rng = np.random.default_rng(11)
+    prices = 100 * np.cumprod(1 + rng.normal(0, 0.02, (count, symbols)), axis=0)
+    dates = np.arange("2024-01-01", count, dtype="datetime64[D]").astype(str)
+    return Window([f"S{i}" for i in range(symbols)], dates, prices, 252)
+
+
+def test_fixed_window_statistics():
+    """Test the fixed window calculations against direct NumPy computations."""
+    window = random_window()
+    returns = window.returns
+    result = fixed_window(
+        window,
+        parse_calculations(
+            "MEAN,STDDEV(annualized=True),CUMULATIVE_RETURN,MAX_DRAWDOWN,CORRELATION,AUTOCORRELATION(lag=2)"
+        ),
+    )
+
+    assert result["MEAN"]["S1"] == pytest.approx(returns[:, 1].mean())
+    assert result["STDDEV(annualized=True)"]["S0"] == pytest.approx(
+        returns[:, 0].std(ddof=1) * np.sqrt(252)
+    )
+    assert result["CUMULATIVE_RETURN"]["S2"] == pytest.approx(
+        window.prices[-1, 2] / window.prices[0, 2] - 1
+    )
+
+    drawdown = result["MAX_DRAWDOWN"]["S0"]
+    prices = window.prices[:, 0]
+    expected = min(
+        prices[j] / prices[i] - 1
+        for i in range(len(prices))
+        for j in range(i, len(prices))
+    )
+    assert drawdown["max_drawdown"] == pytest.approx(expected)
+    assert (
+        drawdown["drawdown_range"]["start_drawdown"]
+        <= drawdown["drawdown_range"]["end_drawdown"]
+    )
+
+    correlation = result["CORRELATION"]
+    assert correlation["index"] == ["S0", "S1", "S2"]
+    assert [len(row) for row in correlation["correlation"]] == [1, 2, 3], (
+        "Lower triangle"
+    )
+    assert correlation["correlation"][2][1] == pytest.approx(
+        np.corrcoef(returns[:, 2], returns[:, 1])[0, 1]
+    )
+    centered = returns[:, 1] - returns[:, 1].mean()
+    assert result["AUTOCORRELATION(lag=2)"]["S1"] == pytest.approx(
+        (centered[2:] * centered[:-2]).sum() / (centered**2).sum()
+    )
+
+
+def test_sliding_window_matches_recomputing_each_window():
+    """Test that the cumulative-sum running statistics equal a per-window recomputation."""
+    window = random_window(60)
+    size = 20
+    result = sliding_window(
+        window,
+        parse_calculations("MEAN,VARIANCE,MEDIAN,CORRELATION,CUMULATIVE_RETURN", True),
+        size,
+    )
+    returns = window.returns
+    means = result["MEAN"]["RUNNING_MEAN"]["S1"]
+    variances = result["VARIANCE"]["RUNNING_VARIANCE"]["S1"]
+    correlations = result["CORRELATION"]["RUNNING_CORRELATION"]["S0"]["S2"]
+    assert next(iter(means)) == window.dates[size]
+    assert next(reversed(means)) == window.dates[-1]
+
+    for end, date in enumerate(window.dates[size:], size):
+        chunk = returns[end - size : end]
+        assert means[date] == pytest.approx(chunk[:, 1].mean())
+        assert variances[date] == pytest.approx(chunk[:, 1].var(ddof=1))
+        assert result["MEDIAN"]["RUNNING_MEDIAN"]["S1"][date] == pytest.approx(
+            np.median(chunk[:, 1])
+        )
+        assert correlations[date] == pytest.approx(
+            np.corrcoef(chunk[:, 0], chunk[:, 2])[0, 1]
+        )
+        assert result["CUMULATIVE_RETURN"]["RUNNING_CUMULATIVE_RETURN"]["S0"][
+            date
+        ] == pytest.approx(window.prices[end, 0] / window.prices[end - size, 0] - 1)
+
+
+def test_parsing_and_ranges():
+    """Test calculation parsing, ranges and date alignment."""
+    calculations = parse_calculations(
+        "mean, HISTOGRAM(bins=5),CORRELATION(method=PEARSON)"
+    )
+    assert [c.name for c in calculations] == ["MEAN", "HISTOGRAM", "CORRELATION"]
+    assert calculations[1].integer("bins", 10) == 5
+    for text in ("CORRELATION(method=KENDALL)", "SHARPE", "VARIANCE(lag=1)", ""):
+        with pytest.raises(UnsupportedCalculation):
+            parse_calculations(text)
+    with pytest.raises(UnsupportedCalculation):
+        parse_calculations("MAX_DRAWDOWN", sliding=True)
+
+    assert range_bounds("full", "2024-03-31") == (None, None)
+    assert range_bounds("1month", "2024-03-31") == ("2024-02-29", None)
+    assert range_bounds("2week", "2024-03-31") == ("2024-03-17", None)
+    assert range_bounds("2023-07-01,2023-08-31", "2024-03-31") == (
+        "2023-07-01",
+        "2023-08-31",
+    )
+
+    dates, prices = align(
+        [
+            (["2024-01-01", "2024-01-02", "2024-01-03"], [1, 2, 3]),
+            (["2024-01-02", "2024-01-03"], [5, 6]),
+        ]
+    )
+    assert dates.tolist() == ["2024-01-02", "2024-01-03"]
+    assert prices.tolist() == [[2, 5], [3, 6]]
+
+
+@pytest.mark.asyncio
+async def test_analytics_are_computed_from_cached_series(
+    monkeypatch, daily_payload, mock_api
+):
+    """Test the resolver against mocked series, and the fallback for intraday intervals."""
+    monkeypatch.setattr(
+        api,
+        "_resolvers",
+        {
+            "ANALYTICS_FIXED_WINDOW": api._local_analytics,
+            "ANALYTICS_SLIDING_WINDOW": api._local_analytics,
+        },
+    )
+    closes = {"IBM": [100, 101, 99, 102, 104, 103], "AAPL": [50, 51, 52, 50, 49, 53]}
+    requests = await mock_api(
+        lambda params: (
+            daily_payload(closes[params["symbol"]], symbol=params["symbol"])
+            if params["function"] == "TIME_SERIES_DAILY"
+            else {"payload": "remote"}
+        )
+    )
+
+    fixed = await fetch_analytics_fixed_window(
+        ["IBM", "AAPL"], "DAILY", calculations=["CUMULATIVE_RETURN", "CORRELATION"]
+    )
+    sliding = await fetch_analytics_sliding_window(
+        ["IBM", "AAPL"],
+        "3day",
+        interval="DAILY",
+        window_size=2,
+        calculations=["MEAN"],
+    )
+    intraday = await fetch_analytics_fixed_window(
+        ["IBM"], "5min", calculations=["MEAN"]
+    )
+
+    assert [r["function"] for r in requests] == [
+        "TIME_SERIES_DAILY",
+        "TIME_SERIES_DAILY",
+        "ANALYTICS_FIXED_WINDOW",
+    ]
+    assert fixed["meta_data"] == {
+        "symbols": "IBM,AAPL",
+        "min_dt": "2024-01-01",
+        "max_dt": "2024-01-06",
+        "ohlc": "Close",
+        "interval": "DAILY",
+    }
+    calculations = fixed["payload"]["RETURNS_CALCULATIONS"]
+    assert calculations["CUMULATIVE_RETURN"] == {
+        "IBM": pytest.approx(0.03),
+        "AAPL": pytest.approx(0.06),
+    }
+    assert calculations["CORRELATION"]["index"] == ["IBM", "AAPL"]
+
+    running = sliding["payload"]["RETURNS_CALCULATIONS"]["MEAN"]["RUNNING_MEAN"]["IBM"]
+    assert list(running) == ["2024-01-05", "2024-01-06"], "The range starts 3 days back"
+    assert sliding["meta_data"]["window_size"] == 2
+    assert intraday == {"payload": "remote"}
+    assert (
+        metrics.get("analytics.local") == 2 and metrics.get("analytics.fallbacks") == 1
+    )
@@ -3,9 +3,17 @@ import json
 import os
 from io import StringIO
 
+import httpx
 import pytest
 
-from alphavantage_mcp_server.api import fetch_earnings_calendar, fetch_earnings_call_transcript
+from alphavantage_mcp_server import api
+from alphavantage_mcp_server.api import (
+    close_client,
+    fetch_earnings_calendar,
+    fetch_earnings_call_transcript,
+    fetch_quote,
+    init_client,
+)
 
 
 @pytest.mark.asyncio
@@ -55,4 +63,30 @@ async def test_fetch_earnings_calendar():
 
     # Check if we found AAPL data
     apple_entries = [row for row in rows if row["symbol"] == "AAPL"]
-    assert apple_entries, "Should find AAPL entries in the response"
\ No newline at end of file
+    assert apple_entries, "Should find AAPL entries in the response"
+
+
+@pytest.mark.asyncio
+async def test_requests_share_pooled_client():
+    """Test that fetch functions reuse the client created by init_client."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.params["datatype"] == "csv":
+            return httpx.Response(200, text="symbol,price\r\nIBM,1.0\r\n")
+        return httpx.Response(200, json={"Global Quote": {"01. symbol": "IBM"}})
+
+    client = await init_client(transport=httpx.MockTransport(handler))
+    try:
+        data = await fetch_quote(symbol="IBM")
+        csv_data = await fetch_quote(symbol="IBM", datatype="csv")
+
+        assert data == {"Global Quote": {"01. symbol": "IBM"}}
+        assert csv_data.startswith("symbol,price"), "CSV should be returned as text"
+        assert api._get_client() is client, "Requests should reuse the shared client"
+        assert [r.url.params["function"] for r in requests] == ["GLOBAL_QUOTE"] * 2
+    finally:
+        await close_client()
+
+    assert client.is_closed, "close_client should release the pooled connections"
@@ -0,0 +1,120 @@
+import asyncio
+
+import anyio
+import httpx
+import pytest
+
+from alphavantage_mcp_server import api, metrics
+from alphavantage_mcp_server.api import backfill_intraday, close_client, init_client
+from alphavantage_mcp_server.backfill import date_range, plan_months
+from alphavantage_mcp_server.progress import progress_callback, report_progress
+
+
+def month_payload(month: str) -> dict:
+    return {
+        "Meta Data": {"2. Symbol": "IBM", "4. Interval": "5min"},
+        "Time Series (5min)": {
+            f"{month}-15 16:00:00": {
+                "1. open": "2.0000",
+                "4. close": "2.5000",
+                "5. volume": "20",
+            },
+            f"{month}-02 09:30:00": {
+                "1. open": "1.0000",
+                "4. close": "1.5000",
+                "5. volume": "10",
+            },
+        },
+    }
+
+
+def test_plan_months():
+    """Test that a date range is split into calendar months across years."""
+    assert plan_months("2023-11-20", "2024-02") == [
+        "2023-11",
+        "2023-12",
+        "2024-01",
+        "2024-02",
+    ]
+    assert date_range("2023-11", "2024-02") == ("2023-11-01", "2024-02-29")
+    with pytest.raises(ValueError, match="is after"):
+        plan_months("2024-02", "2024-01")
+
+
+@pytest.mark.asyncio
+async def test_backfill_reports_progress_and_resumes():
+    """Test that months load concurrently, failures are isolated, and a rerun only fetches what is missing."""
+    requests, progress = [], []
+    failing = {"2023-12"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        month = request.url.params["month"]
+        requests.append(month)
+        if month in failing:
+            return httpx.Response(200, json={"Error Message": "Invalid API call."})
+        return httpx.Response(200, json=month_payload(month))
+
+    async def record(done, total):
+        progress.append((done, total))
+
+    token = progress_callback.set(record)
+    await init_client(transport=httpx.MockTransport(handler))
+    try:
+        first = await backfill_intraday("IBM", "5min", "2023-11-10", "2024-01")
+        failing.clear()
+        requests.clear()
+        second = await backfill_intraday(
+            "IBM", "5min", "2023-11-10", "2024-01", include_data=True
+        )
+    finally:
+        await close_client()
+        progress_callback.reset(token)
+
+    assert first["months"] == {"2023-11": 2, "2024-01": 2}
+    assert first["failed"] == {"2023-12": "Invalid API call."}
+    assert progress[:4] == [(0, 3), (1, 3), (2, 3), (3, 3)]
+
+    assert requests == ["2023-12"], "Completed months are served from the cache"
+    assert second["failed"] == {}
+    series = second["Time Series (5min)"]
+    assert list(series) == [
+        "2024-01-15 16:00:00",
+        "2024-01-02 09:30:00",
+        "2023-12-15 16:00:00",
+        "2023-12-02 09:30:00",
+        "2023-11-15 16:00:00",
+    ], "Data points before the start date are left out"
+
+
+async def test_backfill_does_not_swallow_cancellation(monkeypatch):
+    """Test that a cancelled month load cancels the backfill instead of counting as a failed month."""
+
+    async def fetch_intraday(*args, month: str, **kwargs):
+        if month == "2023-12":
+            raise asyncio.CancelledError
+        return month_payload(month)
+
+    monkeypatch.setattr(api, "fetch_intraday", fetch_intraday)
+    with pytest.raises(asyncio.CancelledError):
+        await backfill_intraday("IBM", "5min", "2023-11", "2024-01")
+
+
+@pytest.mark.asyncio
+async def test_progress_to_a_closed_session_is_dropped():
+    """Test that a closed session does not fail the call, while other callback errors propagate."""
+
+    async def closed(progress, total):
+        raise anyio.ClosedResourceError
+
+    async def broken(progress, total):
+        raise RuntimeError("bug")
+
+    token = progress_callback.set(closed)
+    try:
+        await report_progress(1, 2)
+        assert metrics.get("progress.errors") == 1
+        progress_callback.set(broken)
+        with pytest.raises(RuntimeError):
+            await report_progress(2, 2)
+    finally:
+        progress_callback.reset(token)
@@ -0,0 +1,122 @@
+import asyncio
+
+import httpx
+import pytest
+
+from alphavantage_mcp_server import api
+from alphavantage_mcp_server.api import (
+    _batched_quote,
+    close_client,
+    fetch_quote,
+    init_client,
+)
+from alphavantage_mcp_server.batching import QuoteBatcher
+
+
+def bulk_row(symbol: str) -> dict:
+    return {
+        "symbol": symbol,
+        "timestamp": "2024-05-17 16:00:00.000",
+        "open": "422.54",
+        "high": "422.92",
+        "low": "418.03",
+        "close": "420.21",
+        "volume": "15352198",
+        "previous_close": "420.99",
+        "change": "-0.78",
+        "change_percent": "-0.185277",
+    }
+
+
+@pytest.mark.asyncio
+async def test_concurrent_quotes_are_batched(monkeypatch):
+    """Test that concurrent quotes become one bulk request fanned out per symbol."""
+    monkeypatch.setattr(api, "_resolvers", {"GLOBAL_QUOTE": _batched_quote})
+    monkeypatch.setattr(api.quote_batcher, "window", 0.02)
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        params = request.url.params
+        if params["function"] == "REALTIME_BULK_QUOTES":
+            symbols = params["symbols"].split(",")
+            return httpx.Response(
+                200, json={"data": [bulk_row(s) for s in symbols if s != "NOPE"]}
+            )
+        return httpx.Response(
+            200, json={"Global Quote": {"01. symbol": params["symbol"]}}
+        )
+
+    await init_client(transport=httpx.MockTransport(handler))
+    try:
+        ibm, msft, missing = await asyncio.gather(
+            fetch_quote(symbol="IBM"),
+            fetch_quote(symbol="MSFT"),
+            fetch_quote(symbol="NOPE"),
+        )
+    finally:
+        await close_client()
+
+    functions = [r.url.params["function"] for r in requests]
+    assert functions == ["REALTIME_BULK_QUOTES", "GLOBAL_QUOTE"], (
+        "Only the missing symbol falls back"
+    )
+    assert ibm["Global Quote"]["01. symbol"] == "IBM"
+    assert msft["Global Quote"]["05. price"] == "420.21"
+    assert msft["Global Quote"]["07. latest trading day"] == "2024-05-17"
+    assert msft["Global Quote"]["10. change percent"] == "-0.1853%"
+    assert missing == {"Global Quote": {"01. symbol": "NOPE"}}
+
+
+@pytest.mark.asyncio
+async def test_bulk_quotes_are_chunked_and_merged():
+    """Test that more than 100 symbols are fetched in chunks and merged."""
+    symbols = [f"S{i:03d}" for i in range(250)]
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        chunk = request.url.params["symbols"].split(",")
+        requested.append(chunk)
+        if request.url.params["datatype"] == "csv":
+            rows = "".join(f"{s},1.0\r\n" for s in chunk)
+            return httpx.Response(200, text="symbol,close\r\n" + rows)
+        return httpx.Response(
+            200,
+            json={
+                "endpoint": "Realtime Bulk Quotes",
+                "data": [bulk_row(s) for s in chunk],
+            },
+        )
+
+    await init_client(transport=httpx.MockTransport(handler))
+    try:
+        data = await api.fetch_realtime_bulk_quotes(symbols)
+        csv_data = await api.fetch_realtime_bulk_quotes(symbols, datatype="csv")
+    finally:
+        await close_client()
+
+    assert [len(chunk) for chunk in requested] == [100, 100, 50] * 2
+    assert [row["symbol"] for row in data["data"]] == symbols
+    assert data["endpoint"] == "Realtime Bulk Quotes"
+    lines = csv_data.splitlines()
+    assert lines[0] == "symbol,close" and lines.count("symbol,close") == 1
+    assert len(lines) == 251
+
+
+@pytest.mark.asyncio
+async def test_failed_batches_release_their_callers():
+    """Test that a failed bulk request fails every caller, and an unexpected error cancels them."""
+
+    async def fetch_bulk(symbols: list[str]) -> dict:
+        raise error
+
+    batcher = QuoteBatcher(fetch_bulk, window=0.01)
+    error = ValueError("Alpha Vantage rate limit exceeded")
+    results = await asyncio.gather(
+        batcher.get("IBM"), batcher.get("MSFT"), return_exceptions=True
+    )
+    assert results == [error, error]
+
+    error = RuntimeError("bug")
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(batcher.get("IBM"), timeout=1)
@@ -0,0 +1,155 @@
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+
+from alphavantage_mcp_server import api, metrics
+from alphavantage_mcp_server.api import (
+    close_client,
+    fetch_company_overview,
+    fetch_quote,
+    init_client,
+    request_key,
+)
+from alphavantage_mcp_server.cache import (
+    MARKET_TIMEZONE,
+    ResponseCache,
+    TTLClass,
+    seconds_until_next_close,
+    ttl_class,
+)
+
+
+class Clock:
+    """A time.monotonic() that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Run the cache on a controllable clock, so expiry does not depend on timing."""
+    clock = Clock()
+    monkeypatch.setattr("alphavantage_mcp_server.cache.time", clock)
+    return clock
+
+
+def test_cache_evicts_least_recently_used_by_size():
+    """Test that the cache stays within its byte budget, evicting the LRU entry."""
+    cache = ResponseCache(max_bytes=100)
+    cache.set("a", "A", ttl=60, size=40)
+    cache.set("b", "B", ttl=60, size=40)
+    assert cache.get("a") == "A"
+
+    cache.set("c", "C", ttl=60, size=40)
+
+    assert cache.get("b") is None, "The least recently used entry should be evicted"
+    assert cache.get("a") == "A" and cache.get("c") == "C"
+    assert cache.size == 80
+
+    cache.resize("c", 70)
+    assert cache.get("a") is None, "An entry that grew evicts the LRU entry"
+    assert cache.get("c") == "C" and cache.size == 70
+
+
+def test_cache_expires_entries(clock):
+    """Test that entries are not served after their TTL."""
+    cache = ResponseCache(max_bytes=100)
+    cache.set("a", "A", ttl=10, size=1)
+    cache.set("b", "B", ttl=float("inf"), size=1)
+    clock.now += 10
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "B"
+    assert cache.stats()["hit_rate"] == 0.5
+
+
+def test_ttl_policy():
+    """Test the freshness class assigned to representative requests."""
+    assert ttl_class({"function": "GLOBAL_QUOTE"}) == TTLClass.REALTIME
+    assert ttl_class({"function": "INCOME_STATEMENT"}) == TTLClass.FUNDAMENTALS
+    assert ttl_class({"function": "CPI"}) == TTLClass.FUNDAMENTALS
+    assert ttl_class({"function": "EARNINGS_CALL_TRANSCRIPT"}) == TTLClass.IMMUTABLE
+    assert ttl_class({"function": "SMA", "interval": "5min"}) == TTLClass.INTRADAY
+    assert ttl_class({"function": "SMA", "interval": "daily"}) == TTLClass.DAILY
+    assert (
+        ttl_class({"function": "TIME_SERIES_INTRADAY", "month": "2009-01"})
+        == TTLClass.IMMUTABLE
+    )
+    assert ttl_class({"function": "UNKNOWN"}) is None
+
+
+def test_daily_ttl_runs_until_next_close():
+    """Test that daily data expires after the next weekday close."""
+    friday_evening = datetime(2024, 1, 5, 18, 0, tzinfo=MARKET_TIMEZONE)
+    monday_morning = datetime(2024, 1, 8, 9, 0, tzinfo=MARKET_TIMEZONE)
+
+    assert seconds_until_next_close(friday_evening) == (2 * 24 + 22) * 3600 + 15 * 60
+    assert seconds_until_next_close(monday_morning) == 7 * 3600 + 15 * 60
+
+
+@pytest.mark.asyncio
+async def test_fundamentals_are_served_from_cache():
+    """Test that a repeated fundamentals request does not hit the API."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"Symbol": request.url.params["symbol"]})
+
+    await init_client(transport=httpx.MockTransport(handler))
+    try:
+        first = await fetch_company_overview(symbol="IBM")
+        second = await fetch_company_overview(symbol="IBM")
+    finally:
+        await close_client()
+
+    assert first == second == {"Symbol": "IBM"}
+    assert len(requests) == 1, "The second call should be a cache hit"
+    assert api.response_cache.stats()["hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate(monkeypatch, clock):
+    """Test that an expired quote is served immediately and refreshed in the background."""
+    monkeypatch.setattr(api, "STALE_WHILE_REVALIDATE", {TTLClass.REALTIME})
+    key = request_key({"function": "GLOBAL_QUOTE", "symbol": "IBM", "datatype": "json"})
+    api.response_cache.set(key, {"Global Quote": {"05. price": "1.0"}}, ttl=10, size=1)
+    clock.now += 10
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"Global Quote": {"05. price": "2.0"}})
+
+    await init_client(transport=httpx.MockTransport(handler))
+    try:
+        stale = await fetch_quote(symbol="IBM")
+        await asyncio.gather(*api._revalidations.values())
+        fresh = await fetch_quote(symbol="IBM")
+    finally:
+        await close_client()
+
+    assert stale["Global Quote"]["05. price"] == "1.0"
+    assert stale["_stale"]["revalidating"], "Stale responses should be marked"
+    assert fresh == {"Global Quote": {"05. price": "2.0"}}
+
+
+@pytest.mark.asyncio
+async def test_failed_revalidation_is_logged(monkeypatch, clock, caplog, mock_api):
+    """Test that a failed background refresh is counted and logged, and the stale entry kept."""
+    monkeypatch.setattr(api, "STALE_WHILE_REVALIDATE", {TTLClass.REALTIME})
+    key = request_key({"function": "GLOBAL_QUOTE", "symbol": "IBM", "datatype": "json"})
+    api.response_cache.set(key, {"Global Quote": {"05. price": "1.0"}}, ttl=10, size=1)
+    clock.now += 10
+    await mock_api(lambda params: httpx.Response(503))
+
+    await fetch_quote(symbol="IBM")
+    await asyncio.gather(*api._revalidations.values())
+
+    assert metrics.get("revalidate.errors") == 1
+    assert "Refreshing GLOBAL_QUOTE failed" in caplog.text
+    assert api.response_cache.get_stale(key, 60) is not None
@@ -0,0 +1,128 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from alphavantage_mcp_server import api
+from alphavantage_mcp_server.analytics import align, cross_section, shrunk_covariance
+from alphavantage_mcp_server.api import fetch_correlation_matrix
+from alphavantage_mcp_server.progress import progress_callback
+
+
+def test_align_keeps_the_dates_every_symbol_has():
+    """Test that partly overlapping series are aligned on their common dates."""
+    days = np.arange("2024-01-01", 10, dtype="datetime64[D]")
+    series = [
+        (days, np.arange(10.0)),
+        (days[3:], 10 + np.arange(7.0)),
+        (np.delete(days, [5, 6]), 20 + np.arange(8.0)),
+    ]
+
+    dates, matrix = align(series)
+
+    assert dates.tolist() == np.delete(days[3:], [2, 3]).tolist()
+    assert matrix.shape == (5, 3)
+    assert matrix[:, 0].tolist() == [3, 4, 7, 8, 9]
+    assert matrix[:, 1].tolist() == [10, 11, 14, 15, 16]
+    assert matrix[:, 2].tolist() == [23, 24, 25, 26, 27], (
+        "Values follow their own dates"
+    )
+
+
+def test_cross_section_aligns_and_reduces_in_one_pass():
+    """Test the matrix against NumPy over the common dates of the window."""
+    rng = np.random.default_rng(3)
+    days = np.arange("2024-01-01", 80, dtype="datetime64[D]")
+    prices = 100 * np.cumprod(1 + rng.normal(0, 0.01, (80, 4)), axis=0)
+    series = [(days, prices[:, j]) for j in range(3)] + [(days[10:], prices[10:, 3])]
+    symbols = ["A", "B", "C", "D"]
+
+    result = cross_section(symbols, series, "correlation", "2024-01-05", "2024-02")
+    window = prices[10:60]
+    returns = window[1:] / window[:-1] - 1
+    assert result["meta_data"]["min_dt"] == "2024-01-11", "D starts on the 11th"
+    assert result["meta_data"]["max_dt"] == "2024-02-29"
+    assert result["meta_data"]["observations"] == 49
+    assert result["index"] == symbols
+    expected = np.corrcoef(returns, rowvar=False)
+    for i, row in enumerate(result["correlation"]):
+        assert row == pytest.approx(expected[i, : i + 1].tolist())
+
+    covariance = cross_section(symbols, series, "covariance")["covariance"]
+    assert covariance[3][3] == pytest.approx(
+        np.var(prices[11:, 3] / prices[10:-1, 3] - 1, ddof=1)
+    )
+    with pytest.raises(ValueError, match="Invalid matrix"):
+        cross_section(symbols, series, "beta")
+
+
+def test_shrinkage():
+    """Test that shrinkage keeps the diagonal average and pulls in the off-diagonal terms."""
+    rng = np.random.default_rng(5)
+    returns = rng.normal(0, 0.01, (30, 50))
+    sample, intensity = shrunk_covariance(returns)
+    assert intensity == 0.0
+
+    shrunk, intensity = shrunk_covariance(returns, "ledoit_wolf")
+    assert 0 < intensity <= 1
+    assert np.trace(shrunk) == pytest.approx(np.trace(sample) * 29 / 30)
+    off_diagonal = ~np.eye(50, dtype=bool)
+    assert np.abs(shrunk[off_diagonal]).mean() < np.abs(sample[off_diagonal]).mean()
+    assert np.linalg.eigvalsh(shrunk).min() > 0, (
+        "More symbols than dates, still invertible"
+    )
+
+    half, intensity = shrunk_covariance(returns, "0.5")
+    assert intensity == 0.5
+    assert half[0, 1] == pytest.approx(sample[0, 1] / 2)
+    assert np.array_equal(shrunk_covariance(returns, 0.5)[0], half), (
+        "A number and its string give the same intensity"
+    )
+    with pytest.raises(ValueError, match="Invalid shrinkage"):
+        shrunk_covariance(returns, "2")
+
+
+@pytest.mark.asyncio
+async def test_correlation_matrix_tool_loads_symbols_concurrently(
+    daily_payload, mock_api
+):
+    """Test loading, failures and progress for the matrix of several symbols."""
+    closes = {
+        "IBM": [100, 101, 99, 102, 104],
+        "AAPL": [50, 51, 50, 52, 53],
+        "MSFT": [300, 297, 303, 300, 294],
+    }
+    progress = []
+    await mock_api(
+        lambda params: (
+            daily_payload(closes[params["symbol"]], symbol=params["symbol"])
+            if params["symbol"] in closes
+            else {"Error Message": "Invalid API call."}
+        )
+    )
+
+    async def record(done, total):
+        progress.append((done, total))
+
+    token = progress_callback.set(record)
+    try:
+        result = await fetch_correlation_matrix(["IBM", "aapl", "NOPE", "MSFT", "IBM"])
+    finally:
+        progress_callback.reset(token)
+
+    assert result["index"] == ["IBM", "AAPL", "MSFT"]
+    assert list(result["failed"]) == ["NOPE"]
+    assert progress[-1] == (4, 4) and len(progress) == 4
+    assert result["correlation"][0] == [pytest.approx(1.0)]
+    assert result["correlation"][2][1] < 0, "MSFT moves against AAPL"
+
+
+async def test_correlation_matrix_does_not_swallow_cancellation(monkeypatch):
+    """Test that a cancelled symbol load cancels the call instead of counting as a failed symbol."""
+
+    async def fetch_time_series_daily(symbol: str, **kwargs):
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(api, "fetch_time_series_daily", fetch_time_series_daily)
+    with pytest.raises(asyncio.CancelledError):
+        await fetch_correlation_matrix(["A", "B", "C"])
@@ -0,0 +1,66 @@
+import httpx
+import pytest
+
+from alphavantage_mcp_server import api
+from alphavantage_mcp_server.api import (
+    close_client,
+    fetch_time_series_daily,
+    init_client,
+)
+from alphavantage_mcp_server.disk_cache import DiskCache
+
+
+def test_disk_cache_round_trip(tmp_path):
+    """Test that JSON and text bodies are decoded back from the database."""
+    cache = DiskCache(str(tmp_path / "cache.sqlite3"), max_bytes=1024)
+    cache.set(("function", "OVERVIEW"), b'{"Symbol": "IBM"}', text=False, ttl=60)
+    cache.set(
+        ("function", "IPO_CALENDAR"), b"symbol,name\r\n", text=True, ttl=float("inf")
+    )
+
+    assert cache.get(("function", "OVERVIEW")).value == {"Symbol": "IBM"}
+    entry = cache.get(("function", "IPO_CALENDAR"))
+    assert entry.value == "symbol,name\r\n" and entry.ttl == float("inf")
+    assert cache.get(("function", "MISSING")) is None
+    cache.close()
+
+
+def test_disk_cache_evicts_least_recently_read(tmp_path):
+    """Test that the size cap evicts the entry that was read least recently."""
+    cache = DiskCache(str(tmp_path / "cache.sqlite3"), max_bytes=100)
+    cache.set("a", b'"' + b"a" * 38 + b'"', text=False, ttl=60)
+    cache.set("b", b'"' + b"b" * 38 + b'"', text=False, ttl=60)
+    cache.get("a")
+    cache.set("c", b'"' + b"c" * 38 + b'"', text=False, ttl=60)
+
+    assert cache.get("b") is None, "The least recently read entry should be evicted"
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats()["bytes"] == 80
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_new_session_is_served_from_disk(tmp_path, monkeypatch):
+    """Test that a restarted server (empty memory cache) needs no API call."""
+    monkeypatch.setattr(
+        api, "disk_cache", DiskCache(str(tmp_path / "cache.sqlite3"), 1 << 20)
+    )
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200, json={"Time Series (Daily)": {"2024-01-02": {"4. close": "1"}}}
+        )
+
+    await init_client(transport=httpx.MockTransport(handler))
+    try:
+        first = await fetch_time_series_daily(symbol="IBM", outputsize="full")
+        api.response_cache.clear()
+        second = await fetch_time_series_daily(symbol="IBM", outputsize="full")
+    finally:
+        await close_client()
+        api.disk_cache.close()
+
+    assert first == second
+    assert len(requests) == 1, "The second session should be served from disk"
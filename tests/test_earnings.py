@@ -0,0 +1,62 @@
+import httpx
+import pytest
+
+from alphavantage_mcp_server.api import (
+    close_client,
+    fetch_earnings_calendar,
+    init_client,
+)
+from alphavantage_mcp_server.earnings import EarningsCalendar
+
+CALENDAR = (
+    "symbol,name,reportDate,fiscalDateEnding,estimate,currency\r\n"
+    "AAPL,Apple Inc,2024-05-02,2024-03-31,1.5,USD\r\n"
+    "IBM,International Business Machines Corp,2024-04-24,2024-03-31,1.6,USD\r\n"
+    'BRK-B,"Berkshire Hathaway Inc, Class B",2024-05-04,2024-03-31,,USD\r\n'
+    "IBM,International Business Machines Corp,2024-07-24,2024-06-30,2.2,USD\r\n"
+)
+
+
+def test_calendar_answers_symbol_and_date_queries():
+    """Test symbol and report date queries against the parsed calendar."""
+    calendar = EarningsCalendar(CALENDAR)
+    assert len(calendar) == 4
+    assert calendar.query() == CALENDAR
+    assert calendar.rows(["ibm"]) == [1, 3]
+    assert calendar.rows(["IBM", "BRK-B"], start_date="2024-05") == [2, 3]
+    assert calendar.rows(end_date="2024-05-02") == [0, 1]
+    assert calendar.rows(start_date="2024-05", end_date="2024-05") == [0, 2]
+    assert calendar.rows(["MSFT"]) == []
+    assert calendar.query(["BRK-B"]).splitlines()[1].startswith('BRK-B,"Berkshire')
+
+    with pytest.raises(ValueError, match="Not an earnings calendar"):
+        EarningsCalendar('{"Information": "Invalid API call."}')
+
+
+@pytest.mark.asyncio
+async def test_symbols_share_one_calendar_request():
+    """Test that per-symbol queries are answered from one unfiltered calendar per horizon."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(request.url.params))
+        return httpx.Response(200, text=CALENDAR)
+
+    await init_client(transport=httpx.MockTransport(handler))
+    try:
+        ibm = await fetch_earnings_calendar("IBM")
+        portfolio = await fetch_earnings_calendar("AAPL, BRK-B", end_date="2024-05-02")
+        everything = await fetch_earnings_calendar(None, horizon="12month")
+    finally:
+        await close_client()
+
+    assert [params["horizon"] for params in requests] == ["3month", "12month"]
+    assert not any("symbol" in params for params in requests)
+    assert [line.split(",")[2] for line in ibm.splitlines()[1:]] == [
+        "2024-04-24",
+        "2024-07-24",
+    ]
+    assert portfolio.splitlines()[1:] == [
+        "AAPL,Apple Inc,2024-05-02,2024-03-31,1.5,USD"
+    ]
+    assert everything == CALENDAR
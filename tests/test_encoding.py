@@ -0,0 +1,64 @@
+import json
+
+import httpx
+import pytest
+
+from alphavantage_mcp_server import server
+from alphavantage_mcp_server.api import close_client, init_client
+from alphavantage_mcp_server.encoding import OutputFormat, encode
+
+DAILY = {
+    "Meta Data": {"2. Symbol": "IBM"},
+    "Time Series (Daily)": {
+        "2024-01-03": {"1. open": "101.5", "4. close": "102.0", "5. volume": "1200"},
+        "2024-01-02": {"1. open": "100.0", "4. close": "101.25", "5. volume": "1000"},
+    },
+}
+
+
+def test_compact_is_equivalent_to_pretty():
+    """Test that compact output decodes to the same payload without the whitespace."""
+    compact = encode(DAILY)
+    pretty = encode(DAILY, OutputFormat.PRETTY)
+    assert json.loads(compact) == json.loads(pretty) == DAILY
+    assert "\n" not in compact and len(compact) < len(pretty)
+
+
+def test_columnar_transposes_series():
+    """Test that columnar output lists each field once, in the order of the dates."""
+    payload = json.loads(encode(DAILY, OutputFormat.COLUMNAR))
+    assert payload["Meta Data"] == DAILY["Meta Data"], "Metadata is left as is"
+    assert payload["Time Series (Daily)"] == {
+        "dates": ["2024-01-03", "2024-01-02"],
+        "open": [101.5, 100.0],
+        "close": [102.0, 101.25],
+        "volume": [1200, 1000],
+    }
+
+
+def test_columnar_leaves_other_payloads_alone():
+    """Test that payloads without series are encoded as compact JSON."""
+    quote = {"Global Quote": {"01. symbol": "IBM", "05. price": "101.0"}}
+    feed = {"feed": [{"title": "a"}], "items": "1"}
+    for payload in (quote, feed):
+        assert json.loads(encode(payload, OutputFormat.COLUMNAR)) == payload
+
+
+@pytest.mark.asyncio
+async def test_csv_results_are_not_escaped(monkeypatch):
+    """Test that CSV endpoints are returned as plain text rather than a JSON string."""
+    csv = "symbol,name\r\nIBM,International Business Machines\r\n"
+    monkeypatch.setattr(server, "OUTPUT_FORMAT", OutputFormat.COMPACT)
+
+    await init_client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, text=csv))
+    )
+    try:
+        (content,) = await server.handle_call_tool(
+            server.AlphavantageTools.TIME_SERIES_DAILY.value,
+            {"symbol": "IBM", "datatype": "csv"},
+        )
+    finally:
+        await close_client()
+
+    assert content.text == csv
@@ -0,0 +1,139 @@
+import numpy as np
+import pytest
+
+from alphavantage_mcp_server import api, metrics
+from alphavantage_mcp_server.api import (
+    _local_indicator,
+    fetch_indicator_bundle,
+    fetch_macd,
+    fetch_sma,
+)
+from alphavantage_mcp_server.indicators import (
+    INDICATORS,
+    OHLCV,
+    IndicatorContext,
+    compute,
+    ema,
+    parse_ohlcv,
+    resolve_params,
+    to_payload,
+)
+
+
+def test_ema_matches_recursive_definition():
+    """Test that the vectorized EMA equals the SMA-seeded recursive EMA."""
+    x = np.random.default_rng(1).normal(100, 5, 2000)
+    for period in (2, 12, 200):
+        expected = np.full(len(x), np.nan)
+        expected[period - 1] = x[:period].mean()
+        k = 2 / (period + 1)
+        for i in range(period, len(x)):
+            expected[i] = expected[i - 1] + k * (x[i] - expected[i - 1])
+        np.testing.assert_allclose(
+            ema(x, period), expected, rtol=1e-10, err_msg=f"EMA({period})"
+        )
+
+
+def test_every_indicator_produces_alpha_vantage_shape(daily_payload):
+    """Test that each locally computed indicator is formatted like the API response."""
+    series = parse_ohlcv(daily_payload(100 + 10 * np.sin(np.arange(300) / 7)))
+    ctx = IndicatorContext(series)
+
+    for function in INDICATORS:
+        params = resolve_params(function, {"time_period": 10, "series_type": "close"})
+        payload = to_payload(
+            function, "IBM", "daily", series, params, compute(ctx, function, params)
+        )
+        analysis = payload[f"Technical Analysis: {function}"]
+        assert payload["Meta Data"]["1: Symbol"] == "IBM"
+        assert analysis, f"{function} produced no values"
+        latest = next(iter(analysis))
+        assert latest == series.dates[-1], (
+            f"{function} should list the latest date first"
+        )
+        assert set(analysis[latest]) == set(INDICATORS[function].outputs)
+
+
+def test_intermediates_are_shared():
+    """Test that MACD reuses the EMAs already computed for EMA(12) and EMA(26)."""
+    series = OHLCV([str(i) for i in range(100)], *np.ones((4, 100)), np.ones(100))
+    series.close = np.linspace(1, 2, 100)
+    ctx = IndicatorContext(series)
+    compute(
+        ctx, "EMA", resolve_params("EMA", {"time_period": 12, "series_type": "close"})
+    )
+    compute(
+        ctx, "EMA", resolve_params("EMA", {"time_period": 26, "series_type": "close"})
+    )
+    cached = len(ctx)
+    compute(ctx, "MACD", resolve_params("MACD", {"series_type": "close"}))
+    assert len(ctx) == cached, "MACD should not recompute its EMAs"
+
+
+@pytest.mark.asyncio
+async def test_indicators_are_computed_from_one_series(
+    monkeypatch, daily_payload, mock_api
+):
+    """Test that indicator requests are answered from one cached daily series."""
+    monkeypatch.setattr(api, "_resolvers", {f: _local_indicator for f in INDICATORS})
+    requests = await mock_api(
+        lambda params: (
+            daily_payload(np.arange(1.0, 61))
+            if params["function"] == "TIME_SERIES_DAILY"
+            else {"Technical Analysis: KAMA": {}}
+        )
+    )
+
+    sma = await fetch_sma("IBM", interval="daily", time_period=5, series_type="close")
+    macd = await fetch_macd("IBM", interval="daily", series_type="close")
+    # A missing required parameter is left for the API to report.
+    await fetch_sma("IBM", interval="daily", series_type="close")
+
+    assert [r["function"] for r in requests] == ["TIME_SERIES_DAILY", "SMA"], (
+        "Only the invalid request should reach the API"
+    )
+    assert sma["Technical Analysis: SMA"]["2024-02-29"] == {"SMA": "58.0000"}
+    assert "MACD_Signal" in next(iter(macd["Technical Analysis: MACD"].values()))
+    assert metrics.get("indicators.local") == 2
+
+
+@pytest.mark.asyncio
+async def test_indicator_bundle_loads_series_once(daily_payload, mock_api):
+    """Test that a bundle computes supported indicators from one series and fetches the rest."""
+    requests = await mock_api(
+        lambda params: (
+            daily_payload(np.arange(1.0, 61))
+            if params["function"] == "TIME_SERIES_DAILY"
+            else {"Technical Analysis: KAMA": {"2024-02-29": {"KAMA": "1"}}}
+        )
+    )
+
+    bundle = await fetch_indicator_bundle(
+        "IBM",
+        "daily",
+        [
+            {"function": "SMA", "time_period": 20, "series_type": "close"},
+            {"function": "ema", "time_period": 12, "series_type": "close"},
+            {"function": "MACD", "series_type": "close", "name": "macd"},
+            {"function": "ATR", "time_period": 14},
+            {"function": "KAMA", "time_period": 10, "series_type": "close"},
+        ],
+    )
+
+    assert sorted(r["function"] for r in requests) == ["KAMA", "TIME_SERIES_DAILY"], (
+        "The series should be loaded once"
+    )
+    assert list(bundle) == [
+        "SMA(20, close)",
+        "EMA(12, close)",
+        "macd",
+        "ATR(14)",
+        "KAMA(10, close)",
+    ]
+    assert bundle["SMA(20, close)"]["Technical Analysis: SMA"]["2024-02-29"] == {
+        "SMA": "50.5000"
+    }
+    assert "Technical Analysis: MACD" in bundle["macd"]
+    assert bundle["KAMA(10, close)"] == {
+        "Technical Analysis: KAMA": {"2024-02-29": {"KAMA": "1"}}
+    }
@@ -0,0 +1,74 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from alphavantage_mcp_server import api
+from alphavantage_mcp_server.api import close_client, fetch_quote, init_client
+from alphavantage_mcp_server.ratelimit import RateLimiter, TokenBucket, throttle_message
+
+THROTTLE_NOTE = {
+    "Note": "Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls per minute."
+}
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_queues_instead_of_rejecting():
+    """Test that requests beyond the bucket capacity wait for a refill."""
+    limiter = RateLimiter()
+    limiter.buckets = [TokenBucket(2, 0.2)]
+
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+    elapsed = time.monotonic() - start
+
+    assert elapsed >= 0.15, "Requests over capacity should have been queued"
+    assert limiter.delay() > 0, "Bucket should be empty after the burst"
+    assert not limiter.queue, "Every queued request should have been served"
+
+
+def test_throttle_message_detection():
+    """Test that only rate limit payloads are treated as throttling."""
+    assert throttle_message(THROTTLE_NOTE) == THROTTLE_NOTE["Note"]
+    assert throttle_message(
+        '{"Information": "our standard API rate limit is 25 requests per day."}'
+    )
+    assert throttle_message({"Information": "This is a premium endpoint."}) is None
+    assert throttle_message({"Global Quote": {}}) is None
+    assert throttle_message("symbol,price\r\nIBM,1.0\r\n") is None
+
+
+@pytest.mark.asyncio
+async def test_throttled_request_is_retried(monkeypatch):
+    """Test that a throttle payload is retried after a backoff instead of returned."""
+    monkeypatch.setattr(api, "THROTTLE_BACKOFF", 0.01)
+    responses = [THROTTLE_NOTE, {"Global Quote": {"01. symbol": "IBM"}}]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=responses.pop(0))
+
+    await init_client(transport=httpx.MockTransport(handler))
+    try:
+        data = await fetch_quote(symbol="IBM")
+    finally:
+        await close_client()
+
+    assert data == {"Global Quote": {"01. symbol": "IBM"}}
+    assert not responses, "The throttled request should have been sent again"
+
+
+@pytest.mark.asyncio
+async def test_throttle_retries_exhausted(monkeypatch):
+    """Test that persistent throttling surfaces as an error, not as data."""
+    monkeypatch.setattr(api, "THROTTLE_BACKOFF", 0.001)
+    monkeypatch.setattr(api, "THROTTLE_RETRIES", 1)
+
+    await init_client(
+        transport=httpx.MockTransport(lambda r: httpx.Response(200, json=THROTTLE_NOTE))
+    )
+    try:
+        with pytest.raises(ValueError, match="rate limit exceeded"):
+            await fetch_quote(symbol="IBM")
+    finally:
+        await close_client()
@@ -0,0 +1,140 @@
+import numpy as np
+import pytest
+
+from alphavantage_mcp_server import api, metrics
+from alphavantage_mcp_server.api import (
+    _local_resample,
+    fetch_digital_currency_daily,
+    fetch_digital_currency_monthly,
+    fetch_digital_currency_weekly,
+    fetch_fx_monthly,
+    fetch_time_series_daily_adjusted,
+    fetch_time_series_weekly_adjusted,
+)
+from alphavantage_mcp_server.resample import RESAMPLINGS, resample
+from alphavantage_mcp_server.store import SeriesFrame
+
+
+@pytest.fixture
+def daily_adjusted(daily_payload):
+    """Random adjusted daily series of a number of trading days, with dividends."""
+
+    def build(count: int) -> dict:
+        rng = np.random.default_rng(7)
+        payload = daily_payload(
+            rng.uniform(90, 110, count),
+            start="2024-01-02",
+            spread=10,
+            business_days=True,
+            adjusted=True,
+            rng=rng,
+        )
+        for i, row in enumerate(payload["Time Series (Daily)"].values()):
+            if i % 30 == 0:
+                row["7. dividend amount"] = "0.2500"
+        return payload
+
+    return build
+
+
+def test_resample_matches_calendar_grouping(daily_adjusted):
+    """Test the first/max/min/last/sum aggregation of daily bars into weeks and months."""
+    series = daily_adjusted(90)["Time Series (Daily)"]
+    frame = SeriesFrame.from_series(series)
+
+    for period, label in (("weekly", "%G-%V"), ("monthly", "%Y-%m")):
+        groups = {}
+        for day in sorted(series):
+            key = np.datetime64(day).astype(object).strftime(label)
+            groups.setdefault(key, []).append(day)
+        expected = {}
+        for days in groups.values():
+            rows = [series[day] for day in days]
+            expected[days[-1]] = {
+                "1. open": rows[0]["1. open"],
+                "2. high": max(rows, key=lambda row: float(row["2. high"]))["2. high"],
+                "3. low": min(rows, key=lambda row: float(row["3. low"]))["3. low"],
+                "4. close": rows[-1]["4. close"],
+                "5. adjusted close": rows[-1]["5. adjusted close"],
+                "6. volume": str(sum(int(row["6. volume"]) for row in rows)),
+                "7. dividend amount": f"{sum(float(row['7. dividend amount']) for row in rows):.4f}",
+            }
+        assert resample(frame, period).to_dict() == dict(reversed(expected.items())), (
+            period
+        )
+
+
+@pytest.mark.asyncio
+async def test_weekly_series_is_derived_from_the_stored_daily_history(
+    monkeypatch, daily_adjusted, mock_api
+):
+    """Test that weekly data comes from the cached daily history and monthly FX falls back to the API."""
+    monkeypatch.setattr(api, "_resolvers", {f: _local_resample for f in RESAMPLINGS})
+    requests = await mock_api(
+        lambda params: (
+            daily_adjusted(60)
+            if params["function"] == "TIME_SERIES_DAILY_ADJUSTED"
+            else {"Time Series FX (Monthly)": {"2024-03-29": {"1. open": "1.0"}}}
+        )
+    )
+
+    await fetch_time_series_daily_adjusted("IBM", outputsize="full")
+    weekly = await fetch_time_series_weekly_adjusted("IBM")
+    await fetch_fx_monthly("EUR", "USD")
+
+    assert [r["function"] for r in requests] == [
+        "TIME_SERIES_DAILY_ADJUSTED",
+        "FX_MONTHLY",
+    ]
+    assert weekly["Meta Data"] == {
+        "1. Information": "Weekly Adjusted Prices and Volumes",
+        "2. Symbol": "IBM",
+        "3. Last Refreshed": "2024-03-25",
+        "4. Time Zone": "US/Eastern",
+    }
+    series = weekly["Weekly Adjusted Time Series"]
+    assert list(series)[:2] == ["2024-03-25", "2024-03-22"], (
+        "The current week ends on its latest day"
+    )
+    assert "8. split coefficient" not in series["2024-03-22"]
+    assert metrics.get("resample.local") == 1 and metrics.get("resample.fallbacks") == 1
+
+
+@pytest.mark.asyncio
+async def test_digital_currency_series_are_derived_from_the_daily_series(
+    monkeypatch, daily_payload, mock_api
+):
+    """Test that weekly and monthly digital currency data come from the cached daily series."""
+    monkeypatch.setattr(api, "_resolvers", {f: _local_resample for f in RESAMPLINGS})
+    payload = daily_payload(np.linspace(60000, 65000, 60), rng=np.random.default_rng(3))
+    payload["Meta Data"] = {
+        "1. Information": "Daily Prices and Volumes for Digital Currency",
+        "2. Digital Currency Code": "BTC",
+        "3. Digital Currency Name": "Bitcoin",
+        "4. Market Code": "USD",
+        "5. Market Name": "United States Dollar",
+        "6. Last Refreshed": "2024-02-29 00:00:00",
+        "7. Time Zone": "UTC",
+    }
+    payload["Time Series (Digital Currency Daily)"] = payload.pop("Time Series (Daily)")
+    requests = await mock_api(lambda params: payload)
+
+    daily = await fetch_digital_currency_daily("BTC", "USD")
+    weekly = await fetch_digital_currency_weekly("BTC", "USD")
+    monthly = await fetch_digital_currency_monthly("BTC", "USD")
+
+    assert [r["function"] for r in requests] == ["DIGITAL_CURRENCY_DAILY"]
+    frame = daily["Time Series (Digital Currency Daily)"]
+    assert weekly["Meta Data"]["1. Information"] == (
+        "Weekly Prices and Volumes for Digital Currency"
+    )
+    assert weekly["Meta Data"]["4. Market Code"] == "USD"
+    assert (
+        weekly["Time Series (Digital Currency Weekly)"].to_dict()
+        == resample(frame, "weekly").to_dict()
+    )
+    assert list(monthly["Time Series (Digital Currency Monthly)"]) == [
+        "2024-02-29",
+        "2024-01-31",
+    ]
+    assert metrics.get("resample.local") == 2
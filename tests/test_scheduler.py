@@ -0,0 +1,125 @@
+import asyncio
+import time
+
+import pytest
+
+from alphavantage_mcp_server.ratelimit import RateLimiter, TokenBucket
+from alphavantage_mcp_server.scheduler import FairQueue, Priority, request_priority
+from alphavantage_mcp_server.tools import ToolSpec, call_tool
+
+
+def drain(queue: FairQueue) -> list:
+    return [queue.pop() for _ in range(len(queue))]
+
+
+def test_interactive_overtakes_batch_backlog():
+    """Test that an interactive request is served ahead of a queued batch backlog."""
+    queue = FairQueue()
+    for i in range(5):
+        queue.push(f"scan-{i}", Priority.BATCH, session="a")
+    queue.push("bg", Priority.BACKGROUND, session="b")
+    queue.push("quote", Priority.INTERACTIVE, session="b")
+
+    order = drain(queue)
+
+    assert order[0] == "quote", "The interactive request should go first"
+    assert order[1:6] == [f"scan-{i}" for i in range(5)], (
+        "Batch requests keep their order"
+    )
+    assert order[-1] == "bg", "Background requests wait until nothing else does"
+
+
+def test_sessions_share_the_quota_fairly():
+    """Test that a session's backlog does not delay another session's requests."""
+    queue = FairQueue()
+    for i in range(4):
+        queue.push(("a", i), Priority.BATCH, session="a")
+    queue.pop()
+    queue.push(("b", 0), Priority.BATCH, session="b")
+    queue.push(("b", 1), Priority.BATCH, session="b")
+
+    order = drain(queue)
+
+    assert order == [("a", 1), ("b", 0), ("a", 2), ("b", 1), ("a", 3)], (
+        "Sessions should alternate while both have requests waiting"
+    )
+
+
+def test_expired_requests_are_removed():
+    """Test that requests past their deadline are given up and not served."""
+    queue = FairQueue()
+    queue.push("late", Priority.BACKGROUND, deadline=1.0)
+    queue.push("later", Priority.BACKGROUND, deadline=5.0)
+    queue.push("quote", Priority.INTERACTIVE)
+
+    assert queue.next_deadline() == 1.0
+    assert queue.expire(2.0) == ["late"]
+    assert len(queue) == 2
+    assert drain(queue) == ["quote", "later"]
+    assert queue.next_deadline() is None
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_serves_interactive_first():
+    """Test that an interactive caller queued behind batch callers gets the next slot."""
+    limiter = RateLimiter()
+    limiter.buckets = [TokenBucket(1, 0.05)]
+    order = []
+
+    async def request(name: str, priority: Priority):
+        assert await limiter.acquire(priority, session=name[0])
+        order.append(name)
+
+    scan = [asyncio.create_task(request(f"s{i}", Priority.BATCH)) for i in range(4)]
+    await asyncio.sleep(0.01)
+    await asyncio.gather(request("quote", Priority.INTERACTIVE), *scan)
+
+    assert order[0] == "s0", "The first request takes the free slot"
+    assert order[1] == "quote", "The interactive request should skip the batch backlog"
+    assert not limiter.queue, "Every waiter should have been served"
+
+
+@pytest.mark.asyncio
+async def test_background_requests_are_dropped_at_their_deadline():
+    """Test that background work gives up instead of waiting behind other callers."""
+    limiter = RateLimiter()
+    limiter.buckets = [TokenBucket(1, 0.2)]
+    assert await limiter.acquire(Priority.INTERACTIVE)
+
+    start = time.monotonic()
+    dropped = await limiter.acquire(Priority.BACKGROUND, max_wait=0.05)
+    assert not dropped, "No spare slot freed up in time"
+    assert time.monotonic() - start < 0.15, (
+        "The request should be dropped at its deadline"
+    )
+
+    limiter.backoff(10)
+    start = time.monotonic()
+    assert not await limiter.acquire(Priority.BACKGROUND, max_wait=1)
+    assert time.monotonic() - start < 0.05, (
+        "A backoff past the deadline drops the request at once"
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_tools_lower_the_priority_of_their_calls():
+    """Test that calls made from a batch tool keep the batch priority."""
+    seen = []
+
+    async def quote():
+        seen.append(request_priority.get())
+
+    tools = {"quote": ToolSpec(quote)}
+
+    async def scan():
+        await call_tool(tools, "quote", {})
+
+    tools["scan"] = ToolSpec(scan, priority=Priority.BATCH)
+
+    await call_tool(tools, "quote", {})
+    await call_tool(tools, "scan", {})
+
+    assert seen == [Priority.INTERACTIVE, Priority.BATCH]
+    assert request_priority.get() is Priority.INTERACTIVE, (
+        "The priority is reset after the call"
+    )
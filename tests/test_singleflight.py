@@ -0,0 +1,53 @@
+import asyncio
+
+import httpx
+import pytest
+
+from alphavantage_mcp_server import metrics
+from alphavantage_mcp_server.api import close_client, fetch_quote, init_client
+from alphavantage_mcp_server.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_are_coalesced():
+    """Test that concurrent identical fetches share one HTTP request."""
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"Global Quote": {"01. symbol": "IBM"}})
+
+    await init_client(transport=httpx.MockTransport(handler))
+    try:
+        results = await asyncio.gather(*(fetch_quote(symbol="IBM") for _ in range(5)))
+        other = await fetch_quote(symbol="AAPL")
+    finally:
+        await close_client()
+
+    assert all(r == {"Global Quote": {"01. symbol": "IBM"}} for r in results)
+    assert other, "A different symbol should not be coalesced"
+    assert len(requests) == 2, "Five identical calls should have sent one request"
+    assert metrics.get("singleflight.coalesced") == 4
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_call():
+    """Test that cancelling one waiter leaves the shared call running for the others."""
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def work():
+        started.set()
+        await asyncio.sleep(0.05)
+        return "done"
+
+    first = asyncio.create_task(flight.do("key", work))
+    await started.wait()
+    second = asyncio.create_task(flight.do("key", work))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "done"
+    assert first.cancelled()
+    assert len(flight) == 0, "Finished calls should be forgotten"
@@ -0,0 +1,127 @@
+import httpx
+import pytest
+
+from alphavantage_mcp_server import slicing
+from alphavantage_mcp_server.api import close_client, init_client
+from alphavantage_mcp_server.server import TOOLS, AlphavantageTools, handle_list_tools
+from alphavantage_mcp_server.slicing import select
+from alphavantage_mcp_server.tools import call_tool
+
+DAILY = {
+    "Meta Data": {"2. Symbol": "IBM"},
+    "Time Series (Daily)": {
+        f"2024-01-{day:02d}": {
+            "1. open": str(100 + day),
+            "4. close": str(101 + day),
+            "5. volume": "1000",
+        }
+        for day in range(20, 0, -1)
+    },
+}
+
+TREASURY = {
+    "name": "10-Year Treasury Constant Maturity Rate",
+    "data": [
+        {"date": f"2024-{month:02d}-01", "value": str(month)}
+        for month in range(12, 0, -1)
+    ],
+}
+
+
+def test_date_range_and_last_n():
+    """Test that the range is inclusive, newest first, and last_n keeps the latest points."""
+    series = select(DAILY, start_date="2024-01-05", end_date="2024-01-10")[
+        "Time Series (Daily)"
+    ]
+    assert list(series) == [f"2024-01-{day:02d}" for day in range(10, 4, -1)]
+
+    latest = select(DAILY, last_n=3, fields=["close"])
+    assert latest["Meta Data"] == DAILY["Meta Data"]
+    assert latest["Time Series (Daily)"] == {
+        "2024-01-20": {"4. close": "121"},
+        "2024-01-19": {"4. close": "120"},
+        "2024-01-18": {"4. close": "119"},
+    }
+    assert len(DAILY["Time Series (Daily)"]) == 20, (
+        "The cached response is not modified"
+    )
+
+
+def test_records_and_intraday_timestamps():
+    """Test slicing of dated records and that an end date includes the whole day."""
+    data = select(TREASURY, start_date="2024-03-01", last_n=2)["data"]
+    assert data == [
+        {"date": "2024-12-01", "value": "12"},
+        {"date": "2024-11-01", "value": "11"},
+    ]
+
+    intraday = {
+        "Time Series (5min)": {
+            "2024-01-02 16:00:00": {"4. close": "1"},
+            "2024-01-03 09:35:00": {"4. close": "2"},
+        }
+    }
+    assert list(select(intraday, end_date="2024-01-02")["Time Series (5min)"]) == [
+        "2024-01-02 16:00:00"
+    ]
+
+
+def test_index_is_reused():
+    """Test that repeated slices of the same series share one sorted index."""
+    slicing._indexes.clear()
+    select(DAILY, last_n=1)
+    select(DAILY, start_date="2024-01-10")
+    assert len(slicing._indexes) == 1
+
+
+def test_unknown_fields_are_reported():
+    """Test that a projection onto missing fields names the available ones."""
+    with pytest.raises(
+        ValueError,
+        match=r"Unknown field: adjusted close \(available: open, close, volume\)",
+    ):
+        select(DAILY, fields=["close", "adjusted close"])
+
+
+def test_text_responses_are_not_sliced():
+    """Test that slicing arguments are rejected instead of ignored for CSV responses."""
+    csv = "timestamp,open\n2024-01-02,1.0\n"
+    assert select(csv) is csv
+    with pytest.raises(ValueError, match="only apply to JSON responses"):
+        select(csv, last_n=1)
+
+
+@pytest.mark.asyncio
+async def test_series_tools_take_slice_arguments():
+    """Test that series tools document and apply the slicing arguments after the fetch."""
+    tools = {tool.name: tool for tool in await handle_list_tools()}
+    assert (
+        "last_n"
+        in tools[AlphavantageTools.TIME_SERIES_DAILY.value].inputSchema["properties"]
+    )
+    assert (
+        "last_n"
+        not in tools[AlphavantageTools.STOCK_QUOTE.value].inputSchema["properties"]
+    )
+
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(request.url.params))
+        return httpx.Response(200, json=DAILY)
+
+    await init_client(transport=httpx.MockTransport(handler))
+    try:
+        result = await call_tool(
+            TOOLS,
+            AlphavantageTools.TIME_SERIES_DAILY.value,
+            {"symbol": "IBM", "last_n": 2, "fields": "close,volume"},
+        )
+    finally:
+        await close_client()
+
+    assert "last_n" not in requests[0], "Slicing arguments are not sent to the API"
+    assert result["Time Series (Daily)"] == {
+        "2024-01-20": {"4. close": "121", "5. volume": "1000"},
+        "2024-01-19": {"4. close": "120", "5. volume": "1000"},
+    }
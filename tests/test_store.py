@@ -0,0 +1,182 @@
+import json
+import sys
+
+import numpy as np
+import pytest
+
+from alphavantage_mcp_server import api
+from alphavantage_mcp_server.api import (
+    fetch_digital_currency_daily,
+    fetch_time_series_daily,
+    fetch_time_series_daily_adjusted,
+)
+from alphavantage_mcp_server.encoding import OutputFormat, encode
+from alphavantage_mcp_server.slicing import select
+from alphavantage_mcp_server.store import SeriesFrame, compress
+
+
+@pytest.fixture
+def history(daily_payload):
+    """Daily series responses of a number of days from 2020-01-01."""
+    return lambda days, **kwargs: daily_payload(
+        100 + np.arange(days) / 16, start="2020-01-01", **kwargs
+    )
+
+
+def test_frame_reads_like_the_series(history):
+    """Test that a frame reproduces the response text and stores typed arrays."""
+    payload = history(500)
+    series = payload["Time Series (Daily)"]
+    frame = SeriesFrame.from_series(series)
+
+    assert frame.to_dict() == series and list(frame) == list(series)
+    assert frame["2020-01-01"] == series["2020-01-01"]
+    assert frame.index.dtype == np.dtype("datetime64[D]")
+    assert frame.column("volume").dtype == np.int64
+    text_size = sum(
+        sys.getsizeof(date) + sys.getsizeof(row) + sum(map(sys.getsizeof, row.values()))
+        for date, row in series.items()
+    )
+    assert frame.nbytes * 8 < text_size, "Arrays should be far smaller than the dicts"
+    with pytest.raises(ValueError):
+        frame.column("close")[0] = 0
+
+    assert json.loads(encode(compress(payload))) == payload
+    columns = json.loads(encode(compress(payload), OutputFormat.COLUMNAR))[
+        "Time Series (Daily)"
+    ]
+    assert columns["dates"][0] == "2021-05-14" and columns["close"][0] == 131.1875
+
+
+def test_series_that_would_change_are_kept_as_text():
+    """Test that series whose text does not round-trip through floats are not converted."""
+    assert SeriesFrame.from_series({"2024-01-02": {"1. value": "None"}}) is None
+    assert (
+        SeriesFrame.from_series(
+            {"2024-01-02": {"1. value": "1.5"}, "2024-01-01": {"1. value": "1.25"}}
+        )
+        is None
+    )
+
+
+def test_frames_are_sliced_without_copying(history):
+    """Test that slicing a frame shares its arrays."""
+    frame = compress(history(300))["Time Series (Daily)"]
+    sliced = select(
+        {"s": frame}, start_date="2020-02-01", end_date="2020-02-10", fields=["close"]
+    )["s"]
+    assert list(sliced) == [f"2020-02-{day:02d}" for day in range(10, 0, -1)]
+    assert sliced.fields == ["4. close"]
+    assert np.shares_memory(sliced.column("close"), frame.column("close"))
+
+
+@pytest.mark.asyncio
+async def test_compact_requests_use_the_stored_full_history(history, mock_api):
+    """Test that a stored full history answers compact requests for the same series."""
+    requests = await mock_api(lambda params: history(400))
+
+    full = await fetch_time_series_daily("IBM", outputsize="full")
+    compact = await fetch_time_series_daily("IBM")
+
+    assert [r["outputsize"] for r in requests] == ["full"], (
+        "The compact request should not reach the API"
+    )
+    assert len(full["Time Series (Daily)"]) == 400
+    assert len(compact["Time Series (Daily)"]) == 100
+    assert compact["Meta Data"]["4. Output Size"] == "Compact"
+    assert (
+        list(compact["Time Series (Daily)"]) == list(full["Time Series (Daily)"])[:100]
+    )
+    assert len(api.series_store) == 1 and len(api.response_cache) == 0
+
+
+def expire_store():
+    for entry in api.series_store._cache._entries.values():
+        entry.expires_at = 0
+
+
+async def refresh_full_history(
+    mock_api, responses: list[dict], adjusted: bool = False
+) -> tuple:
+    """Fetch a full history, expire it and fetch it again, answering with `responses` in turn."""
+    requests = await mock_api(lambda params: responses[len(requests) - 1])
+
+    fetch = fetch_time_series_daily_adjusted if adjusted else fetch_time_series_daily
+    await fetch("IBM", outputsize="full")
+    expire_store()
+    refreshed = await fetch("IBM", outputsize="full")
+    return [r["outputsize"] for r in requests], refreshed
+
+
+@pytest.mark.asyncio
+async def test_expired_history_is_refreshed_with_a_compact_request(history, mock_api):
+    """Test that the latest 100 points are merged into an expired full history."""
+    stored = history(400)
+    latest = history(402)
+    compact = {
+        **latest,
+        "Time Series (Daily)": dict(list(latest["Time Series (Daily)"].items())[:100]),
+    }
+    # The latest stored bar was taken before the close and is corrected by the update.
+    corrected = {
+        "1. open": "1.0000",
+        "2. high": "2.5000",
+        "3. low": "0.5000",
+        "4. close": "2.0000",
+        "5. volume": "3",
+    }
+    compact["Time Series (Daily)"]["2021-02-03"] = corrected
+
+    requests, refreshed = await refresh_full_history(mock_api, [stored, compact])
+
+    series = refreshed["Time Series (Daily)"]
+    assert requests == ["full", "compact"]
+    assert len(series) == 402 and list(series)[:2] == ["2021-02-05", "2021-02-04"]
+    assert series["2021-02-03"] == corrected
+    assert series["2020-01-01"] == stored["Time Series (Daily)"]["2020-01-01"]
+    assert refreshed["Meta Data"]["4. Output Size"] == "Full size"
+    assert api.series_store.stats()["merges"] == 1
+
+
+@pytest.mark.asyncio
+async def test_history_is_refetched_when_the_update_cannot_be_merged(history, mock_api):
+    """Test the full refetch after a gap, and after a dividend in an adjusted series."""
+    gap = history(600)
+    gap["Time Series (Daily)"] = dict(list(gap["Time Series (Daily)"].items())[:100])
+    requests, refreshed = await refresh_full_history(
+        mock_api, [history(400), gap, history(600)]
+    )
+    assert requests == ["full", "compact", "full"]
+    assert len(refreshed["Time Series (Daily)"]) == 600
+
+    api.series_store.clear()
+    dividend = history(401, adjusted=True, dividends={"2021-02-04": "0.5000"})
+    dividend["Time Series (Daily)"] = dict(
+        list(dividend["Time Series (Daily)"].items())[:100]
+    )
+    requests, _ = await refresh_full_history(
+        mock_api,
+        [history(400, adjusted=True), dividend, history(401, adjusted=True)],
+        adjusted=True,
+    )
+    assert requests == ["full", "compact", "full"]
+    assert api.series_store.stats()["merge_failures"] == 2
+
+
+@pytest.mark.asyncio
+async def test_digital_currency_series_are_cached(daily_payload, mock_api):
+    """Test that a repeated digital currency request is answered from the series store."""
+    payload = daily_payload(np.linspace(60000, 65000, 30), symbol="BTC")
+    payload["Time Series (Digital Currency Daily)"] = payload.pop("Time Series (Daily)")
+    requests = await mock_api(lambda params: payload)
+
+    first = await fetch_digital_currency_daily("BTC", "USD")
+    second = await fetch_digital_currency_daily("BTC", "USD")
+
+    assert len(requests) == 1, "The second request should be served from the store"
+    assert second is first
+    assert (
+        first["Time Series (Digital Currency Daily)"].to_dict()
+        == (payload["Time Series (Digital Currency Daily)"])
+    )
+    assert len(api.series_store) == 1 and len(api.response_cache) == 0
@@ -0,0 +1,134 @@
+import numpy as np
+import pytest
+
+from alphavantage_mcp_server import api, metrics
+from alphavantage_mcp_server.api import (
+    _local_indicator,
+    fetch_rsi,
+)
+from alphavantage_mcp_server.indicators import (
+    OHLCV,
+    IndicatorContext,
+    compute,
+    parse_ohlcv,
+    resolve_params,
+    to_payload,
+)
+from alphavantage_mcp_server.store import payload_size
+from alphavantage_mcp_server.streaming import STREAMS, advance
+
+PARAMS = {"time_period": 14, "series_type": "close"}
+
+
+def random_series(count: int) -> OHLCV:
+    rng = np.random.default_rng(9)
+    close = 100 + np.cumsum(rng.normal(0, 1, count))
+    high, low = close + rng.uniform(0, 1, count), close - rng.uniform(0, 1, count)
+    dates = [str(d) for d in np.arange("2024-01-01", count, dtype="datetime64[D]")]
+    return OHLCV(
+        dates, close + rng.normal(0, 0.2, count), high, low, close, np.ones(count)
+    )
+
+
+def head(series: OHLCV, count: int) -> OHLCV:
+    return OHLCV(
+        series.dates[:count],
+        *(
+            getattr(series, name)[:count]
+            for name in ("open", "high", "low", "close", "volume")
+        ),
+    )
+
+
+def test_streams_match_the_batch_indicators():
+    """Test that resuming from checkpoints gives the values of a full recomputation."""
+    series = random_series(300)
+    for function in STREAMS:
+        params = resolve_params(function, PARAMS)
+        expected = compute(IndicatorContext(series), function, params)
+        checkpoint = None
+        for count in (120, 121, 200, 300, 300):
+            values, checkpoint, resumed = advance(
+                function, params, head(series, count), checkpoint
+            )
+        assert resumed, f"{function} should resume from its checkpoint"
+        for output, batch in zip(values, expected):
+            np.testing.assert_allclose(output, batch, rtol=1e-9, err_msg=function)
+
+
+def test_revised_bars_are_recomputed():
+    """Test that the latest bar may change, and that a changed history discards the checkpoint."""
+    series = random_series(100)
+    params = resolve_params("RSI", PARAMS)
+    _, checkpoint, _ = advance("RSI", params, series)
+    assert checkpoint.last_date == series.dates[-2], (
+        "The latest bar is not checkpointed"
+    )
+
+    revised = head(series, 100)
+    revised.close = series.close.copy()
+    revised.close[-1] += 5
+    values, _, resumed = advance("RSI", params, revised, checkpoint)
+    assert resumed
+    assert values[0][-1] == pytest.approx(
+        compute(IndicatorContext(revised), "RSI", params)[0][-1]
+    )
+
+    revised.close[-2] += 5
+    _, _, resumed = advance("RSI", params, revised, checkpoint)
+    assert not resumed, "A changed checkpointed bar requires a full recomputation"
+
+
+def intraday(count: int) -> dict:
+    series = head(random_series(201), count)
+    times = [
+        str(t).replace("T", " ")
+        for t in np.datetime64("2024-03-01T09:30:00")
+        + np.arange(count) * np.timedelta64(5, "m")
+    ]
+    return {
+        "Meta Data": {"2. Symbol": "IBM", "4. Interval": "5min"},
+        "Time Series (5min)": {
+            time: {
+                "1. open": f"{series.open[i]:.4f}",
+                "2. high": f"{series.high[i]:.4f}",
+                "3. low": f"{series.low[i]:.4f}",
+                "4. close": f"{series.close[i]:.4f}",
+                "5. volume": "100",
+            }
+            for i, time in reversed(list(enumerate(times)))
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_refreshed_series_resumes_the_stored_state(monkeypatch, mock_api):
+    """Test that the indicator state is kept with the cached series across refreshes."""
+    monkeypatch.setattr(api, "_resolvers", {"RSI": _local_indicator})
+    responses = [intraday(200), intraday(201)]
+    await mock_api(lambda params: responses.pop(0))
+
+    await fetch_rsi("IBM", "5min", time_period=14, series_type="close")
+    (stored,) = (entry.value for entry in api.series_store._cache._entries.values())
+    (checkpoint,) = stored.states.values()
+    assert api.series_store.stats()["bytes"] == (
+        payload_size(stored.payload) + checkpoint.nbytes
+    ), "The checkpoint counts toward the size of the store"
+    for cache in (api.response_cache, api.series_store._cache):
+        for entry in cache._entries.values():
+            entry.expires_at = 0
+    refreshed = await fetch_rsi("IBM", "5min", time_period=14, series_type="close")
+
+    series = parse_ohlcv(intraday(201))
+    params = resolve_params("RSI", PARAMS)
+    expected = to_payload(
+        "RSI",
+        "IBM",
+        "5min",
+        series,
+        params,
+        compute(IndicatorContext(series), "RSI", params),
+    )
+    assert refreshed == expected
+    assert metrics.get("indicators.local") == 2
+    assert metrics.get("indicators.resumed") == 1
@@ -0,0 +1,65 @@
+import httpx
+import pytest
+
+from alphavantage_mcp_server import api, metrics
+from alphavantage_mcp_server.api import close_client, init_client, search_endpoint
+from alphavantage_mcp_server.symbols import SymbolIndex
+
+LISTING = """symbol,name,exchange,assetType,ipoDate,delistingDate,status
+A,Agilent Technologies Inc,NYSE,Stock,1999-11-18,null,Active
+AAPL,Apple Inc,NASDAQ,Stock,1980-12-12,null,Active
+APLE,Apple Hospitality REIT Inc,NYSE,Stock,2015-05-18,null,Active
+IBM,International Business Machines Corp,NYSE,Stock,1962-01-02,null,Active
+IBMN,iShares iBonds Dec 2025 Term Muni Bond ETF,BATS,ETF,2019-04-09,null,Active
+MSFT,Microsoft Corporation,NASDAQ,Stock,1986-03-13,null,Active
+"""
+
+
+def test_search_ranks_tickers_and_names():
+    """Test ticker prefix and name word matches and their order."""
+    index = SymbolIndex.from_csv(LISTING)
+    assert len(index) == 6
+
+    matches = [
+        (listing.symbol, round(score, 4)) for listing, score in index.search("IBM")
+    ]
+    assert matches == [("IBM", 1.0), ("IBMN", 0.75)], "The exact ticker comes first"
+
+    assert [listing.symbol for listing, _ in index.search("apple")] == ["AAPL", "APLE"]
+    assert [listing.symbol for listing, _ in index.search("micro")] == ["MSFT"]
+    assert [listing.symbol for listing, _ in index.search("business mach")] == ["IBM"]
+    assert index.search("apple micro") == [], "Every word has to match"
+    assert index.search("  ") == []
+
+    match = index.best_matches("msft")["bestMatches"][0]
+    assert match["1. symbol"] == "MSFT" and match["3. type"] == "Equity"
+    assert match["9. matchScore"] == "1.0000"
+    assert index.best_matches("IBMN")["bestMatches"][0]["3. type"] == "ETF"
+
+
+@pytest.mark.asyncio
+async def test_symbol_search_uses_the_listing_and_falls_back(monkeypatch):
+    """Test that searches are answered from one listing fetch and misses go to the API."""
+    monkeypatch.setattr(api, "_resolvers", {"SYMBOL_SEARCH": api._local_symbol_search})
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.params["function"])
+        if request.url.params["function"] == "LISTING_STATUS":
+            return httpx.Response(200, text=LISTING)
+        return httpx.Response(200, json={"bestMatches": [{"1. symbol": "TSCO.LON"}]})
+
+    await init_client(transport=httpx.MockTransport(handler))
+    try:
+        apple = await search_endpoint("apple")
+        ibm = await search_endpoint("ibm")
+        tesco = await search_endpoint("tesco")
+    finally:
+        await close_client()
+
+    assert requests == ["LISTING_STATUS", "SYMBOL_SEARCH"]
+    assert [match["1. symbol"] for match in apple["bestMatches"]] == ["AAPL", "APLE"]
+    assert ibm["bestMatches"][0]["1. symbol"] == "IBM"
+    assert tesco["bestMatches"] == [{"1. symbol": "TSCO.LON"}]
+    assert metrics.get("symbol_search.local") == 2
+    assert metrics.get("symbol_search.fallbacks") == 1
@@ -0,0 +1,203 @@
+import asyncio
+
+import httpx
+import pytest
+
+from alphavantage_mcp_server import metrics
+from alphavantage_mcp_server.api import close_client, init_client
+from alphavantage_mcp_server.progress import progress_callback, report_progress
+from alphavantage_mcp_server.server import (
+    TOOLS,
+    AlphavantageTools,
+    handle_list_tools,
+    list_prompts,
+)
+from alphavantage_mcp_server.tools import ToolSpec, call_batch, call_tool
+
+
+def test_every_tool_is_registered():
+    """Test that each AlphavantageTools member has a registry entry."""
+    assert set(TOOLS) == {tool.value for tool in AlphavantageTools}
+
+
+def test_missing_required_arguments():
+    """Test that the binder rejects calls missing a required argument."""
+    with pytest.raises(
+        ValueError, match="Missing required arguments: symbol, interval"
+    ):
+        TOOLS[AlphavantageTools.TIME_SERIES_INTRADAY.value].bind({"symbol": "IBM"})
+
+    async def fetch(limit: int, adjusted: bool):
+        pass
+
+    spec = ToolSpec(fetch, required=("limit", "adjusted"))
+    assert spec.bind({"limit": 0, "adjusted": False}) == {
+        "limit": 0,
+        "adjusted": False,
+    }, "Falsy values are given arguments"
+
+
+@pytest.mark.asyncio
+async def test_unknown_tool():
+    """Test that unknown tool names are rejected."""
+    with pytest.raises(ValueError, match="Unknown tool: nope"):
+        await call_tool(TOOLS, "nope", {})
+
+
+@pytest.mark.asyncio
+async def test_arguments_are_bound_by_name():
+    """Test that tool arguments reach the API under their own names."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(request.url.params))
+        return httpx.Response(200, json={"ok": True})
+
+    await init_client(transport=httpx.MockTransport(handler))
+    try:
+        await call_tool(
+            TOOLS,
+            AlphavantageTools.TIME_SERIES_INTRADAY.value,
+            {"symbol": "IBM", "interval": "5min", "adjusted": False, "unknown": 1},
+        )
+        await call_tool(
+            TOOLS,
+            AlphavantageTools.ULTOSC.value,
+            {"symbol": "IBM", "interval": "daily", "time_period1": 5},
+        )
+    finally:
+        await close_client()
+
+    intraday, ultosc = requests
+    assert intraday["adjusted"] == "false" and intraday["extended_hours"] == "true"
+    assert "unknown" not in intraday, "Arguments the tool does not take are dropped"
+    assert ultosc["timeperiod1"] == "5", "Aliases map onto the fetch parameter"
+    assert metrics.get("tools.time_series_intraday") == 1
+
+
+@pytest.mark.asyncio
+async def test_catalogs_are_built_once():
+    """Test that tools/list and prompts/list reuse the catalogs built on the first call."""
+    assert await handle_list_tools() is await handle_list_tools()
+    assert await list_prompts() is await list_prompts()
+    assert isinstance(await handle_list_tools(), tuple), "The catalog is immutable"
+    assert isinstance(await list_prompts(), tuple), "The catalog is immutable"
+
+
+@pytest.mark.asyncio
+async def test_tool_schemas_follow_fetch_signatures():
+    """Test that generated schemas document every argument of the serving coroutine."""
+    tools = {tool.name: tool for tool in await handle_list_tools()}
+    assert set(tools) == set(TOOLS)
+
+    intraday = tools[AlphavantageTools.TIME_SERIES_INTRADAY.value].inputSchema
+    assert intraday["required"] == ["symbol", "interval"]
+    assert intraday["properties"]["adjusted"] == {
+        "type": "boolean",
+        "description": "The adjusted data flag (default: True).",
+        "default": True,
+    }
+    bulk = tools[AlphavantageTools.REALTIME_BULK_QUOTES.value].inputSchema
+    assert bulk["properties"]["symbols"]["items"] == {"type": "string"}
+    daily = tools[AlphavantageTools.TIME_SERIES_DAILY.value].inputSchema
+    assert daily["properties"]["last_n"]["type"] == "integer"
+    correlation = tools[AlphavantageTools.CORRELATION_MATRIX.value].inputSchema
+    assert correlation["properties"]["shrinkage"]["anyOf"] == [
+        {"type": "string"},
+        {"type": "number"},
+    ], "Shrinkage takes ledoit_wolf or a number"
+
+    assert tools[AlphavantageTools.REALTIME_BULK_QUOTES.value].description == (
+        "Fetch real-time bulk stock quotes from the Alpha Vantage API."
+    ), "Implementation notes after the summary are left out"
+    for name, tool in tools.items():
+        assert tool.description, f"{name} has no description"
+        assert "\n" not in tool.description, f"{name} has more than a summary"
+        for argument, schema in tool.inputSchema["properties"].items():
+            assert schema.get("description"), f"{name}.{argument} is undocumented"
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_calls_concurrently():
+    """Test that a batch returns each result or error in order and shares the cache."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.params["function"])
+        return httpx.Response(200, json={"Symbol": request.url.params["symbol"]})
+
+    await init_client(transport=httpx.MockTransport(handler))
+    try:
+        results = await call_tool(
+            TOOLS,
+            AlphavantageTools.BATCH.value,
+            {
+                "calls": [
+                    {"tool": "company_overview", "arguments": {"symbol": "IBM"}},
+                    {"tool": "income_statement", "arguments": {"symbol": "IBM"}},
+                    {"tool": "company_overview", "arguments": {}},
+                    {"tool": "batch", "arguments": {"calls": []}},
+                    {"tool": "company_overview", "arguments": {"symbol": "IBM"}},
+                    {"tool": "company_overview", "arguments": "IBM"},
+                ]
+            },
+        )
+    finally:
+        await close_client()
+
+    assert sorted(requests) == ["INCOME_STATEMENT", "OVERVIEW"], (
+        "Identical calls are fetched once"
+    )
+    assert results[0] == {"tool": "company_overview", "result": {"Symbol": "IBM"}}
+    assert results[1]["result"] == {"Symbol": "IBM"}
+    assert results[2] == {
+        "tool": "company_overview",
+        "error": "Missing required argument: symbol",
+    }
+    assert results[3] == {"tool": "batch", "error": "Unknown tool: batch"}
+    assert results[4] == results[0]
+    assert results[5] == {
+        "tool": "company_overview",
+        "error": "Arguments of company_overview must be an object: IBM",
+    }
+    assert metrics.get("batch.errors") == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_progress_only_increases():
+    """Test that the progress of the calls in a batch maps into one increasing series."""
+    notifications = []
+
+    async def scan(steps: int) -> int:
+        await report_progress(0, steps)
+        for step in range(1, steps + 1):
+            await asyncio.sleep(0)
+            await report_progress(step, steps)
+        return steps
+
+    async def quote() -> str:
+        await asyncio.sleep(0)
+        return "IBM"
+
+    async def record(progress, total):
+        notifications.append((progress, total))
+
+    tools = {"scan": ToolSpec(scan), "quote": ToolSpec(quote)}
+    token = progress_callback.set(record)
+    try:
+        results = await call_batch(
+            tools,
+            [
+                {"tool": "scan", "arguments": {"steps": 4}},
+                {"tool": "quote"},
+                {"tool": "scan", "arguments": {"steps": 3}},
+            ],
+        )
+    finally:
+        progress_callback.reset(token)
+
+    assert [entry["result"] for entry in results] == [4, "IBM", 3]
+    assert {total for _, total in notifications} == {3}, "The total never changes"
+    values = [progress for progress, _ in notifications]
+    assert values == sorted(set(values)), f"Progress should only increase: {values}"
+    assert values[-1] == pytest.approx(3)